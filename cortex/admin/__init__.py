@@ -4,8 +4,9 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from cortex.admin.helpers import ORJSONResponse, invalidate_on_write
 from cortex.admin.auth import router as auth_router
 from cortex.admin.dashboard import router as dashboard_router
 from cortex.admin.users import router as users_router
@@ -27,7 +28,12 @@ from cortex.admin.media import router as media_router
 from cortex.admin.loras import router as loras_router
 from cortex.admin.legacy import router as legacy_router
 
-router = APIRouter(prefix="/admin", tags=["admin"])
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    default_response_class=ORJSONResponse,
+    dependencies=[Depends(invalidate_on_write, scope="function")],
+)
 
 router.include_router(auth_router)
 router.include_router(dashboard_router)
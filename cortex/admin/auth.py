@@ -9,7 +9,7 @@ from cortex.auth import authenticate, create_token, hash_password, verify_passwo
 from cortex.admin import helpers as _h
 from cortex.admin.helpers import require_admin
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(_h.writes("admin_users"))])
 
 
 class LoginRequest(BaseModel):
@@ -22,8 +22,11 @@ class ChangePasswordRequest(BaseModel):
     new_password: str
 
 
+# login and change-password are sync so FastAPI runs them in its threadpool:
+# bcrypt is CPU-bound and would otherwise stall the event loop.
+
 @router.post("/auth/login")
-async def login(req: LoginRequest):
+def login(req: LoginRequest):
     conn = _h._db()
     user = authenticate(conn, req.username, req.password)
     if user is None:
@@ -37,7 +40,7 @@ async def me(admin: dict = Depends(require_admin)):
 
 
 @router.post("/auth/change-password")
-async def change_password(req: ChangePasswordRequest, admin: dict = Depends(require_admin)):
+def change_password(req: ChangePasswordRequest, admin: dict = Depends(require_admin)):
     conn = _h._db()
     row = conn.execute(
         "SELECT password_hash FROM admin_users WHERE id = ?", (admin["sub"],)
@@ -2,63 +2,65 @@
 
 from __future__ import annotations
 
-from typing import Any
-
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
 from cortex.admin import helpers as _h
 from cortex.admin.helpers import require_admin
 
-router = APIRouter()
+router = APIRouter(
+    route_class=_h.ETagRoute,
+    dependencies=[Depends(_h.writes("command_patterns", "speaker_profiles"))],
+)
 
 
 # ── Voice / Speakers ──────────────────────────────────────────────
 
 
+_SPEAKER_COLS = (
+    "id", "user_id", "display_name", "enrolled_at", "sample_count", "last_verified",
+    "confidence_threshold",
+)
+_LIST_SPEAKERS_SQL = (
+    f"SELECT {', '.join(_SPEAKER_COLS)} FROM speaker_profiles ORDER BY enrolled_at DESC"
+)
+
+
 @router.get("/voice/speakers")
-async def list_speakers(_: dict = Depends(require_admin)):
+def list_speakers(_: dict = Depends(require_admin)):
     conn = _h._db()
-    cur = conn.execute(
-        "SELECT id, user_id, display_name, enrolled_at, sample_count, last_verified, "
-        "confidence_threshold FROM speaker_profiles ORDER BY enrolled_at DESC"
-    )
-    return {"speakers": _h._rows(cur)}
+    cur = conn.execute(_LIST_SPEAKERS_SQL)
+    return {"speakers": _h._rows_fixed(cur, _SPEAKER_COLS)}
 
 
 @router.delete("/voice/speakers/{speaker_id}")
-async def delete_speaker(speaker_id: str, _: dict = Depends(require_admin)):
+def delete_speaker(speaker_id: str, _: dict = Depends(require_admin)):
     conn = _h._db()
     conn.execute("DELETE FROM speaker_profiles WHERE id = ?", (speaker_id,))
     conn.commit()
     return {"ok": True}
 
 
+class SpeakerUpdate(BaseModel):
+    display_name: str | None = None
+    user_id: str | None = None
+    confidence_threshold: float | None = None
+
+
 @router.patch("/voice/speakers/{speaker_id}")
-async def update_speaker(
+def update_speaker(
     speaker_id: str,
-    update: dict,
+    update: SpeakerUpdate,
     _: dict = Depends(require_admin),
 ):
     conn = _h._db()
-    # Map allowed input field names to fixed SQL assignment fragments
-    allowed_fields = {
-        "display_name": "display_name = ?",
-        "user_id": "user_id = ?",
-        "confidence_threshold": "confidence_threshold = ?",
-    }
-    set_parts: list[str] = []
-    params: list[Any] = []
-    for key, value in update.items():
-        if key in allowed_fields and value is not None:
-            set_parts.append(allowed_fields[key])
-            params.append(value)
-    if not set_parts:
+    fields = update.model_dump(exclude_none=True)
+    if not fields:
         raise HTTPException(status_code=400, detail="No valid fields to update")
-    set_clause = ", ".join(set_parts)
+    cols = tuple(sorted(fields))
     conn.execute(
-        f"UPDATE speaker_profiles SET {set_clause} WHERE id = ?",
-        params + [speaker_id],
+        _h._update_sql("speaker_profiles", cols, "id"),
+        [fields[c] for c in cols] + [speaker_id],
     )
     conn.commit()
     return {"ok": True}
@@ -68,61 +70,57 @@ async def update_speaker(
 
 
 @router.get("/devices")
-async def list_devices(
+def list_devices(
     _: dict = Depends(require_admin),
     domain: str | None = None,
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=100),
 ):
     conn = _h._db()
-    where, params = [], []
-    if domain:
-        where.append("domain = ?")
-        params.append(domain)
-    where_sql = " AND ".join(where) if where else "1=1"
-
-    total = conn.execute(f"SELECT COUNT(*) FROM ha_devices WHERE {where_sql}", params).fetchone()[0]
+    cols, params = _h._filters(("domain", domain))
+    count_sql, page_sql = _h._list_sql("ha_devices", cols, "domain, friendly_name")
+    total = conn.execute(count_sql, params).fetchone()[0]
     offset = (page - 1) * per_page
-    cur = conn.execute(
-        f"SELECT * FROM ha_devices WHERE {where_sql} ORDER BY domain, friendly_name LIMIT ? OFFSET ?",
-        params + [per_page, offset],
-    )
+    cur = conn.execute(page_sql, params + [per_page, offset])
     devices = _h._rows(cur)
 
-    # Attach aliases to each device
+    # Attach aliases to each device (one query for the whole page)
+    ids = [dev["entity_id"] for dev in devices]
+    cur = conn.execute(
+        "SELECT entity_id, alias, source FROM device_aliases "
+        f"WHERE entity_id IN ({_h._placeholders(ids)})",
+        ids,
+    )
+    aliases = _h._group_rows(cur, "entity_id")
     for dev in devices:
-        cur = conn.execute(
-            "SELECT alias, source FROM device_aliases WHERE entity_id = ?",
-            (dev["entity_id"],),
-        )
-        dev["aliases"] = _h._rows(cur)
+        dev["aliases"] = aliases.get(dev["entity_id"], [])
 
     return {"devices": devices, "total": total, "page": page, "per_page": per_page}
 
 
 @router.get("/devices/patterns")
-async def list_command_patterns(
+def list_command_patterns(
     _: dict = Depends(require_admin),
     source: str | None = None,
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=100),
+    cursor: str | None = None,
 ):
+    """List command patterns, most-hit first (``cursor`` pages by keyset)."""
     conn = _h._db()
-    where, params = [], []
-    if source:
-        where.append("source = ?")
-        params.append(source)
-    where_sql = " AND ".join(where) if where else "1=1"
-
-    total = conn.execute(
-        f"SELECT COUNT(*) FROM command_patterns WHERE {where_sql}", params
-    ).fetchone()[0]
-    offset = (page - 1) * per_page
-    cur = conn.execute(
-        f"SELECT * FROM command_patterns WHERE {where_sql} ORDER BY hit_count DESC LIMIT ? OFFSET ?",
-        params + [per_page, offset],
+    cols, params = _h._filters(("source", source))
+    seek_sql, seek_params = _h._seek(cursor, "hit_count", "id")
+    count_sql, page_sql = _h._list_sql(
+        "command_patterns", cols, "hit_count DESC, id DESC", seek_sql
     )
-    return {"patterns": _h._rows(cur), "total": total, "page": page, "per_page": per_page}
+    total = conn.execute(count_sql, params).fetchone()[0]
+    offset = 0 if cursor else (page - 1) * per_page
+    cur = conn.execute(page_sql, params + seek_params + [per_page, offset])
+    patterns = _h._rows(cur)
+    return {
+        "patterns": patterns, "total": total, "page": page, "per_page": per_page,
+        "next_cursor": _h._next_cursor(patterns, per_page, "hit_count", "id"),
+    }
 
 
 class PatternUpdate(BaseModel):
@@ -133,24 +131,25 @@ class PatternUpdate(BaseModel):
 
 
 @router.patch("/devices/patterns/{pattern_id}")
-async def update_command_pattern(
+def update_command_pattern(
     pattern_id: int, update: PatternUpdate, _: dict = Depends(require_admin)
 ):
     conn = _h._db()
     fields = {k: v for k, v in update.model_dump().items() if v is not None}
     if not fields:
         raise HTTPException(status_code=400, detail="No fields to update")
-    set_clause = ", ".join(f"{k} = ?" for k in fields)
-    conn.execute(
-        f"UPDATE command_patterns SET {set_clause} WHERE id = ?",
-        list(fields.values()) + [pattern_id],
+    cols = tuple(sorted(fields))
+    cur = conn.execute(
+        _h._update_sql("command_patterns", cols, "id", returning=True),
+        [fields[c] for c in cols] + [pattern_id],
     )
+    pattern = _h._row(cur)
     conn.commit()
-    return {"ok": True}
+    return {"ok": True, "pattern": pattern}
 
 
 @router.delete("/devices/patterns/{pattern_id}")
-async def delete_command_pattern(pattern_id: int, _: dict = Depends(require_admin)):
+def delete_command_pattern(pattern_id: int, _: dict = Depends(require_admin)):
     conn = _h._db()
     conn.execute("DELETE FROM command_patterns WHERE id = ?", (pattern_id,))
     conn.commit()
@@ -13,7 +13,7 @@ from cortex.admin.helpers import require_admin
 
 log = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=_h.ETagRoute)
 
 
 # ── Request models ────────────────────────────────────────────────
@@ -84,28 +84,23 @@ async def list_runs(
     per_page: int = Query(50, ge=1, le=100),
     run_type: str | None = None,
     status: str | None = None,
+    cursor: str | None = None,
 ):
+    """List evolution runs, newest first (``cursor`` pages by keyset)."""
     conn = _h._db()
-    where, params = [], []
-    if run_type:
-        where.append("run_type = ?")
-        params.append(run_type)
-    if status:
-        where.append("status = ?")
-        params.append(status)
-
-    where_sql = " AND ".join(where) if where else "1=1"
-    total = conn.execute(
-        f"SELECT COUNT(*) FROM evolution_runs WHERE {where_sql}", params
-    ).fetchone()[0]
-
-    offset = (page - 1) * per_page
-    cur = conn.execute(
-        f"SELECT * FROM evolution_runs WHERE {where_sql} "
-        "ORDER BY created_at DESC LIMIT ? OFFSET ?",
-        params + [per_page, offset],
+    cols, params = _h._filters(("run_type", run_type), ("status", status))
+    seek_sql, seek_params = _h._seek(cursor, "created_at", "id")
+    count_sql, page_sql = _h._list_sql(
+        "evolution_runs", cols, "created_at DESC, id DESC", seek_sql
     )
-    return {"runs": _h._rows(cur), "total": total, "page": page, "per_page": per_page}
+    total = conn.execute(count_sql, params).fetchone()[0]
+    offset = 0 if cursor else (page - 1) * per_page
+    cur = conn.execute(page_sql, params + seek_params + [per_page, offset])
+    runs = _h._rows(cur)
+    return {
+        "runs": runs, "total": total, "page": page, "per_page": per_page,
+        "next_cursor": _h._next_cursor(runs, per_page, "created_at", "id"),
+    }
 
 
 @router.get("/evolution/runs/{run_id}")
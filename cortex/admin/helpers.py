@@ -2,28 +2,388 @@
 
 from __future__ import annotations
 
+import base64
+import contextlib
+import functools
+import hashlib
+import inspect
 import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Coroutine, Iterator, Sequence
+
+import orjson
+from fastapi import HTTPException, Request, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
 
 from cortex.auth import require_admin  # noqa: F401 — re-exported for sub-routers
-from cortex.db import get_db, init_db
+from cortex.db import get_db, get_db_path, init_db
 from cortex.auth import seed_admin
 
+RESPONSE_CACHE_TTL = 30  # seconds
+
+# Databases whose schema + default admin have already been set up in this
+# process.  Keyed by path so ``set_db_path()`` (tests, CLI) re-initialises.
+_ready_paths: set[Path] = set()
+_init_lock = threading.Lock()
+
+# Cached read-endpoint payloads: key → (data, expiry)
+_response_cache: dict[tuple, tuple[bytes, float]] = {}
+# Bumped on every invalidation; a handler that started before the bump
+# must not store its (possibly stale) result
+_response_generation = 0
+# Tables each cached handler reads, by (module, qualname); see cached_response
+_response_reads: dict[tuple[str, str], frozenset[str]] = {}
+
+# In-memory copy of ``system_settings`` per DB path; see :func:`_settings`
+_settings_cache: dict[Path, dict[str, str]] = {}
+_settings_lock = threading.Lock()
+
+_UPSERT_SETTING_SQL = (
+    "INSERT OR REPLACE INTO system_settings (key, value, updated_at) "
+    "VALUES (?, ?, CURRENT_TIMESTAMP)"
+)
+
 
 def _db() -> sqlite3.Connection:
-    init_db()
+    """Return the per-thread connection, initialising the DB once per path."""
+    path = get_db_path()
     conn = get_db()
-    seed_admin(conn)
+    if path not in _ready_paths:
+        # Sync handlers run in the threadpool — only one thread seeds
+        with _init_lock:
+            if path not in _ready_paths:
+                init_db()
+                seed_admin(conn)
+                _ready_paths.add(path)
     return conn
 
 
+def _settings() -> dict[str, str]:
+    """Return the ``system_settings`` table as a dict, read once per DB path.
+
+    The table changes rarely and admin writes go through
+    :func:`_put_setting`, which updates this copy in place, so reads only
+    touch SQLite again after :func:`invalidate_response_cache` drops it.
+    Callers must not mutate the result.
+    """
+    path = get_db_path()
+    settings = _settings_cache.get(path)
+    if settings is None:
+        with _settings_lock:
+            settings = _settings_cache.get(path)
+            if settings is None:
+                rows = _db().execute("SELECT key, value FROM system_settings").fetchall()
+                settings = _settings_cache[path] = {r["key"]: r["value"] for r in rows}
+    return settings
+
+
+def _put_setting(key: str, value: str) -> None:
+    """Upsert one system setting and write it through to :func:`_settings`."""
+    conn = _db()
+    conn.execute(_UPSERT_SETTING_SQL, (key, value))
+    conn.commit()
+    with _settings_lock:
+        settings = _settings_cache.get(get_db_path())
+        if settings is not None:
+            settings[key] = value
+
+
+# Row helpers read the column names from ``cur.description`` once, switch
+# the cursor to plain tuples (``row_factory = None``) and zip each tuple
+# with those names, instead of building a ``sqlite3.Row`` per row.
+
+def _names(cur: sqlite3.Cursor) -> list[str] | None:
+    """Column names of *cur*'s result set; switches it to plain-tuple rows.
+
+    Zipping tuples with the names once per query is cheaper than building a
+    ``sqlite3.Row`` per row and copying it with ``dict()``.
+    """
+    if cur.description is None:
+        return None
+    cur.row_factory = None
+    return [d[0] for d in cur.description]
+
+
 def _rows(cur: sqlite3.Cursor) -> list[dict]:
-    cols = [d[0] for d in cur.description] if cur.description else []
-    return [dict(zip(cols, r)) for r in cur.fetchall()]
+    names = _names(cur)
+    if names is None:
+        return []
+    return [dict(zip(names, r)) for r in cur.fetchall()]
 
 
 def _row(cur: sqlite3.Cursor) -> dict | None:
-    r = cur.fetchone()
-    if r is None:
+    names = _names(cur)
+    r = None if names is None else cur.fetchone()
+    return None if r is None else dict(zip(names, r))
+
+
+def _rows_fixed(cur: sqlite3.Cursor, cols: tuple[str, ...]) -> list[dict]:
+    """Like :func:`_rows` for a SELECT whose column list is *cols*, in order.
+
+    Skips reading ``cur.description`` as well; the names are already known.
+    """
+    cur.row_factory = None
+    return [dict(zip(cols, r)) for r in cur.fetchall()]
+
+
+@contextlib.contextmanager
+def _read_snapshot(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Run a group of SELECTs inside one deferred read transaction.
+
+    SQLite takes the WAL read lock once for the whole group, so the queries
+    see one consistent snapshot instead of re-acquiring the lock per
+    statement.  A transaction already open on *conn* is reused as-is.
+    """
+    if conn.in_transaction:
+        yield conn
+        return
+    conn.execute("BEGIN DEFERRED")
+    try:
+        yield conn
+    finally:
+        conn.commit()
+
+
+@functools.lru_cache(maxsize=256)
+def _update_sql(
+    table: str,
+    cols: tuple[str, ...],
+    key: str,
+    touch: str | None = None,
+    returning: bool = False,
+) -> str:
+    """Return ``UPDATE <table> SET c1 = ?, ... WHERE <key> = ?``.
+
+    *touch* names a timestamp column that SQLite sets to ``CURRENT_TIMESTAMP``
+    in the same statement; *returning* appends ``RETURNING *`` so the updated
+    row comes back without a follow-up SELECT.  Memoised per column set; pass
+    *cols* sorted so equivalent updates share one SQL string (and one entry
+    in sqlite3's statement cache).  Column names must come from a fixed
+    whitelist, never from user input.
+    """
+    assignments = [f"{c} = ?" for c in cols]
+    if touch:
+        assignments.append(f"{touch} = CURRENT_TIMESTAMP")
+    sql = f"UPDATE {table} SET {', '.join(assignments)} WHERE {key} = ?"
+    return sql + " RETURNING *" if returning else sql
+
+
+def _filters(*pairs: tuple[str, Any]) -> tuple[tuple[str, ...], list[Any]]:
+    """Split ``(column, value)`` filter pairs into active columns and params.
+
+    A pair is active unless its value is ``None`` or ``""`` (``False``/``0``
+    still filter).  Feed the column tuple to :func:`_list_sql`.
+    """
+    cols, params = [], []
+    for col, value in pairs:
+        if value is None or value == "":
+            continue
+        cols.append(col)
+        params.append(value)
+    return tuple(cols), params
+
+
+@functools.lru_cache(maxsize=256)
+def _list_sql(
+    table: str, cols: tuple[str, ...], order_by: str, seek: str = ""
+) -> tuple[str, str]:
+    """Return ``(count_sql, page_sql)`` for a filtered, paginated list.
+
+    Memoised per filter combination, so each endpoint only ever produces a
+    handful of distinct SQL strings and they stay in sqlite3's statement
+    cache.  *page_sql* ends in ``LIMIT ? OFFSET ?``; *seek* is the clause
+    from :func:`_seek`.  Names must come from code, never from user input.
+    """
+    where = " AND ".join(f"{c} = ?" for c in cols) or "1=1"
+    return (
+        f"SELECT COUNT(*) FROM {table} WHERE {where}",
+        f"SELECT * FROM {table} WHERE {where}{seek} ORDER BY {order_by} LIMIT ? OFFSET ?",
+    )
+
+
+def _seek(cursor: str | None, sort_col: str, key_col: str) -> tuple[str, list[Any]]:
+    """Return an ``AND (sort, key) < (?, ?)`` fragment + params for *cursor*.
+
+    Keyset pagination for lists ordered ``sort_col DESC, key_col DESC``:
+    each page is an index seek instead of scanning and discarding ``OFFSET``
+    rows.  Returns ``("", [])`` when no cursor is given.
+    """
+    if not cursor:
+        return "", []
+    try:
+        sort_value, key_value = orjson.loads(base64.urlsafe_b64decode(cursor))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return f" AND ({sort_col}, {key_col}) < (?, ?)", [sort_value, key_value]
+
+
+def _next_cursor(rows: list[dict], per_page: int, sort_col: str, key_col: str) -> str | None:
+    """Opaque cursor for the page after *rows*, or None on the last page."""
+    if len(rows) < per_page:
         return None
-    cols = [d[0] for d in cur.description]
-    return dict(zip(cols, r))
+    last = rows[-1]
+    return base64.urlsafe_b64encode(orjson.dumps([last[sort_col], last[key_col]])).decode()
+
+
+def _placeholders(values: Sequence[Any]) -> str:
+    """Return ``?, ?, ...`` for an ``IN (...)`` clause over *values*."""
+    return ", ".join("?" * len(values))
+
+
+def _group_rows(cur: sqlite3.Cursor, key: str) -> dict[Any, list[dict]]:
+    """Bucket *cur*'s rows by column *key* (dropped from each row dict).
+
+    Used to attach child rows fetched with one ``IN (...)`` query instead of
+    one query per parent row.
+    """
+    grouped: dict[Any, list[dict]] = {}
+    for r in _rows(cur):
+        grouped.setdefault(r.pop(key), []).append(r)
+    return grouped
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (non-str keys and numpy values allowed)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
+class ETagRoute(APIRoute):
+    """Route class that tags GET responses with an ``ETag`` and honours
+    ``If-None-Match`` with an empty ``304``.
+
+    Admin pages poll slowly-changing lists; a match skips re-sending the
+    body.  Streaming and file responses are passed through untouched.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def etag_handler(request: Request) -> Response:
+            response = await handler(request)
+            body = getattr(response, "body", None)
+            if request.method != "GET" or response.status_code != 200 or body is None:
+                return response
+            etag = f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+            if_none_match = request.headers.get("if-none-match", "")
+            if etag in (tag.strip() for tag in if_none_match.split(",")):
+                return Response(status_code=304, headers={"ETag": etag})
+            response.headers["ETag"] = etag
+            return response
+
+        return etag_handler
+
+
+def cached_response(
+    ttl: float = RESPONSE_CACHE_TTL, reads: Sequence[str] = ()
+) -> Callable:
+    """Cache an admin GET handler's payload for *ttl* seconds.
+
+    The key covers the handler, the active DB path and its query/path
+    parameters (the ``_`` admin-claims argument is ignored, so only use this
+    on endpoints that do not depend on who is asking).  Admin writes clear
+    it via :func:`invalidate_on_write`; list the tables the handler *reads*
+    so writes elsewhere leave it cached.
+
+    The payload is cached as encoded JSON and each call gets a fresh
+    ``Response``, so nothing downstream can mutate the cached copy.  A
+    result computed while an invalidation happened is returned but not
+    stored.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        if reads:
+            _response_reads[(fn.__module__, fn.__qualname__)] = frozenset(reads)
+
+        def lookup(kwargs: dict[str, Any]) -> tuple[tuple, bytes | None]:
+            params = tuple(sorted((k, v) for k, v in kwargs.items() if k != "_"))
+            key = (fn.__module__, fn.__qualname__, get_db_path(), params)
+            entry = _response_cache.get(key)
+            if entry and time.monotonic() < entry[1]:
+                return key, entry[0]
+            return key, None
+
+        def store(key: tuple, generation: int, data: Any) -> Response:
+            body = ORJSONResponse(data).body
+            if generation == _response_generation:
+                _response_cache[key] = (body, time.monotonic() + ttl)
+            return _json(body)
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                key, body = lookup(kwargs)
+                if body is not None:
+                    return _json(body)
+                generation = _response_generation
+                return store(key, generation, await fn(*args, **kwargs))
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key, body = lookup(kwargs)
+            if body is not None:
+                return _json(body)
+            generation = _response_generation
+            return store(key, generation, fn(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+def _json(body: bytes) -> Response:
+    return Response(body, media_type="application/json")
+
+
+def invalidate_response_cache(tables: frozenset[str] | None = None) -> None:
+    """Drop cached admin responses that may read any of *tables*.
+
+    ``None`` drops everything, as do handlers that declared no ``reads``.
+    The :func:`_settings` copy goes too when ``system_settings`` may have
+    changed, so edits made outside :func:`_put_setting` show up.
+    """
+    global _response_generation
+    _response_generation += 1
+    if tables is None or "system_settings" in tables:
+        with _settings_lock:
+            _settings_cache.clear()
+    if tables is None:
+        _response_cache.clear()
+        return
+    for key in list(_response_cache):
+        reads = _response_reads.get(key[:2])
+        if reads is None or reads & tables:
+            _response_cache.pop(key, None)
+
+
+def writes(*tables: str) -> Callable:
+    """Router dependency declaring the tables a router's handlers modify.
+
+    :func:`invalidate_on_write` then only drops cached responses that read
+    those tables.  Routers without it clear the whole cache on any write.
+    """
+
+    async def declare(request: Request) -> None:
+        request.state.writes = frozenset(tables)
+
+    return declare
+
+
+async def invalidate_on_write(request: Request):
+    """Router dependency: clear cached responses after any non-GET request.
+
+    Declare with ``scope="function"`` so the exit code runs before the
+    response is sent; otherwise a GET fired as soon as the write returns can
+    still be served the stale entry.
+    """
+    yield
+    if request.method not in ("GET", "HEAD"):
+        invalidate_response_cache(getattr(request.state, "writes", None))
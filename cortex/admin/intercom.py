@@ -9,7 +9,7 @@ import json
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
-from cortex.admin.helpers import _db, _rows, _row, require_admin
+from cortex.admin.helpers import _db, _rows, _row, _update_sql, require_admin
 
 router = APIRouter()
 
@@ -97,22 +97,18 @@ async def update_zone(
     zone_id: int, req: ZoneUpdateRequest, _: dict = Depends(require_admin)
 ):
     conn = _db()
-    parts: list[str] = []
-    params: list[object] = []
+    fields: dict[str, object] = {}
     if req.name is not None:
-        parts.append("name = ?")
-        params.append(req.name)
+        fields["name"] = req.name
     if req.satellite_ids is not None:
-        parts.append("satellite_ids = ?")
-        params.append(json.dumps(req.satellite_ids))
+        fields["satellite_ids"] = json.dumps(req.satellite_ids)
     if req.description is not None:
-        parts.append("description = ?")
-        params.append(req.description)
-    if not parts:
+        fields["description"] = req.description
+    if not fields:
         raise HTTPException(status_code=400, detail="No fields to update")
-    params.append(zone_id)
+    cols = tuple(sorted(fields))
     cur = conn.execute(
-        f"UPDATE satellite_zones SET {', '.join(parts)} WHERE id = ?", params
+        _update_sql("satellite_zones", cols, "id"), [fields[c] for c in cols] + [zone_id]
     )
     conn.commit()
     if cur.rowcount == 0:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 from typing import Any
@@ -9,7 +10,7 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
-from cortex.admin.helpers import _db, _row, _rows, require_admin
+from cortex.admin.helpers import _db, _filters, _row, _rows, _update_sql, require_admin
 
 logger = logging.getLogger(__name__)
 
@@ -102,25 +103,20 @@ async def update_channel(
 ):
     """Update a legacy channel (PATCH — only provided fields)."""
     conn = _db()
-    parts: list[str] = []
-    params: list[object] = []
-
+    fields: dict[str, object] = {}
     if req.name is not None:
-        parts.append("name = ?")
-        params.append(req.name)
+        fields["name"] = req.name
     if req.config is not None:
-        parts.append("config = ?")
-        params.append(json.dumps(req.config))
+        fields["config"] = json.dumps(req.config)
     if req.enabled is not None:
-        parts.append("enabled = ?")
-        params.append(int(req.enabled))
+        fields["enabled"] = int(req.enabled)
 
-    if not parts:
+    if not fields:
         raise HTTPException(status_code=400, detail="No fields to update")
 
-    params.append(channel_id)
+    cols = tuple(sorted(fields))
     cur = conn.execute(
-        f"UPDATE legacy_channels SET {', '.join(parts)} WHERE id = ?", params
+        _update_sql("legacy_channels", cols, "id"), [fields[c] for c in cols] + [channel_id]
     )
     conn.commit()
     if cur.rowcount == 0:
@@ -142,6 +138,19 @@ async def delete_channel(channel_id: str, _: dict = Depends(require_admin)):
 
 # ── Messages ────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=None)
+def _messages_sql(cols: tuple[str, ...]) -> str:
+    """Page SQL for the legacy message list, one string per filter set."""
+    where = " AND ".join(f"m.{c} = ?" for c in cols) or "1=1"
+    return (
+        "SELECT m.id, m.channel_id, m.direction, m.sender, m.recipient, "
+        "m.content, m.metadata, m.processed, m.created_at, c.name as channel_name, "
+        "c.channel_type FROM legacy_messages m "
+        "LEFT JOIN legacy_channels c ON m.channel_id = c.id "
+        f"WHERE {where} ORDER BY m.created_at DESC LIMIT ?"
+    )
+
+
 @router.get("/legacy/messages")
 async def list_messages(
     channel_id: str | None = None,
@@ -151,28 +160,8 @@ async def list_messages(
 ):
     """List legacy messages with optional filters."""
     conn = _db()
-    query = (
-        "SELECT m.id, m.channel_id, m.direction, m.sender, m.recipient, "
-        "m.content, m.metadata, m.processed, m.created_at, c.name as channel_name, "
-        "c.channel_type FROM legacy_messages m "
-        "LEFT JOIN legacy_channels c ON m.channel_id = c.id "
-    )
-    conditions: list[str] = []
-    params: list[object] = []
-
-    if channel_id:
-        conditions.append("m.channel_id = ?")
-        params.append(channel_id)
-    if direction:
-        conditions.append("m.direction = ?")
-        params.append(direction)
-
-    if conditions:
-        query += "WHERE " + " AND ".join(conditions) + " "
-    query += "ORDER BY m.created_at DESC LIMIT ?"
-    params.append(min(limit, 500))
-
-    cur = conn.execute(query, params)
+    cols, params = _filters(("channel_id", channel_id), ("direction", direction))
+    cur = conn.execute(_messages_sql(cols), params + [min(limit, 500)])
     messages = _rows(cur)
     for msg in messages:
         msg["metadata"] = json.loads(msg.get("metadata", "{}") or "{}")
@@ -498,23 +498,12 @@ async def playback_history(
     if not isinstance(per_page, int):
         per_page = 50
     conn = _h._db()
-    where, params = [], []
-    if user_id:
-        where.append("user_id = ?")
-        params.append(user_id)
-
-    where_sql = " AND ".join(where) if where else "1=1"
-    total = conn.execute(
-        f"SELECT COUNT(*) FROM media_playback_history WHERE {where_sql}",
-        params,
-    ).fetchone()[0]
+    cols, params = _h._filters(("user_id", user_id))
+    count_sql, page_sql = _h._list_sql("media_playback_history", cols, "played_at DESC")
+    total = conn.execute(count_sql, params).fetchone()[0]
 
     offset = (page - 1) * per_page
-    cur = conn.execute(
-        f"SELECT * FROM media_playback_history WHERE {where_sql} "
-        "ORDER BY played_at DESC LIMIT ? OFFSET ?",
-        params + [per_page, offset],
-    )
+    cur = conn.execute(page_sql, params + [per_page, offset])
     return {
         "history": _h._rows(cur),
         "total": total,
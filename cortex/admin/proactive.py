@@ -9,7 +9,7 @@ import json
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
-from cortex.admin.helpers import _db, _rows, _row, require_admin
+from cortex.admin.helpers import _db, _rows, _row, _update_sql, require_admin
 
 router = APIRouter()
 
@@ -174,28 +174,22 @@ async def update_preferences(
             ),
         )
     else:
-        updates: list[str] = []
-        params: list[str | int] = []
+        fields: dict[str, str | int] = {}
         if req.quiet_hours_start is not None:
-            updates.append("quiet_hours_start = ?")
-            params.append(req.quiet_hours_start)
+            fields["quiet_hours_start"] = req.quiet_hours_start
         if req.quiet_hours_end is not None:
-            updates.append("quiet_hours_end = ?")
-            params.append(req.quiet_hours_end)
+            fields["quiet_hours_end"] = req.quiet_hours_end
         if req.min_priority is not None:
-            updates.append("min_priority = ?")
-            params.append(req.min_priority)
+            fields["min_priority"] = req.min_priority
         if req.max_per_hour is not None:
-            updates.append("max_per_hour = ?")
-            params.append(req.max_per_hour)
+            fields["max_per_hour"] = req.max_per_hour
         if req.channels is not None:
-            updates.append("channels = ?")
-            params.append(json.dumps(req.channels))
-        if updates:
-            params.append(user_id)
+            fields["channels"] = json.dumps(req.channels)
+        if fields:
+            cols = tuple(sorted(fields))
             conn.execute(
-                f"UPDATE notification_preferences SET {', '.join(updates)} WHERE user_id = ?",
-                params,
+                _update_sql("notification_preferences", cols, "user_id"),
+                [fields[c] for c in cols] + [user_id],
             )
     conn.commit()
     return {"updated": True}
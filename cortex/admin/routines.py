@@ -7,7 +7,9 @@ import json
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
-from cortex.admin.helpers import _db, _rows, _row, require_admin
+from cortex.admin.helpers import (
+    _db, _group_rows, _placeholders, _rows, _row, require_admin,
+)
 from cortex.routines.engine import RoutineEngine
 from cortex.routines.templates import TEMPLATES, instantiate_template
 
@@ -44,23 +46,38 @@ class TemplateInstantiateRequest(BaseModel):
 # ── Routine CRUD ─────────────────────────────────────────────────
 
 @router.get("/routines")
-async def list_routines(_: dict = Depends(require_admin)):
+def list_routines(_: dict = Depends(require_admin)):
     conn = _db()
     routines = _rows(conn.execute("SELECT * FROM routines ORDER BY name"))
 
+    # Children for every routine in one query per table; the grouping key is
+    # aliased so each child row keeps its own routine_id column
+    ids = [r["id"] for r in routines]
+    marks = _placeholders(ids)
+    steps = _group_rows(conn.execute(
+        f"SELECT routine_id AS _rid, * FROM routine_steps WHERE routine_id IN ({marks}) "
+        "ORDER BY step_order", ids,
+    ), "_rid")
+    triggers = _group_rows(conn.execute(
+        f"SELECT routine_id AS _rid, * FROM routine_triggers WHERE routine_id IN ({marks}) "
+        "ORDER BY id", ids,
+    ), "_rid")
+    runs = _group_rows(conn.execute(
+        "SELECT * FROM ("
+        "  SELECT routine_id AS _rid, *, ROW_NUMBER() OVER ("
+        "    PARTITION BY routine_id ORDER BY started_at DESC) AS _rn"
+        f"  FROM routine_runs WHERE routine_id IN ({marks})"
+        ") WHERE _rn <= 5 ORDER BY _rid, _rn", ids,
+    ), "_rid")
+
     for r in routines:
         rid = r["id"]
-        r["steps"] = _rows(conn.execute(
-            "SELECT * FROM routine_steps WHERE routine_id = ? ORDER BY step_order", (rid,)
-        ))
-        r["triggers"] = _rows(conn.execute(
-            "SELECT * FROM routine_triggers WHERE routine_id = ?", (rid,)
-        ))
-        runs = _rows(conn.execute(
-            "SELECT * FROM routine_runs WHERE routine_id = ? ORDER BY started_at DESC LIMIT 5",
-            (rid,),
-        ))
-        r["recent_runs"] = runs
+        r["steps"] = steps.get(rid, [])
+        r["triggers"] = triggers.get(rid, [])
+        recent = runs.get(rid, [])
+        for run in recent:
+            del run["_rn"]
+        r["recent_runs"] = recent
 
     return {"routines": routines}
 
@@ -10,45 +10,48 @@ from pydantic import BaseModel
 from cortex.admin import helpers as _h
 from cortex.admin.helpers import require_admin
 
-router = APIRouter()
+router = APIRouter(
+    route_class=_h.ETagRoute,
+    dependencies=[Depends(_h.writes("jailbreak_patterns"))],
+)
 
 
 @router.get("/safety/events")
-async def list_safety_events(
+def list_safety_events(
     _: dict = Depends(require_admin),
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=100),
     category: str | None = None,
     severity: str | None = None,
     user_id: str | None = None,
+    cursor: str | None = None,
 ):
+    """List guardrail events, newest first.
+
+    Pass the returned ``next_cursor`` as ``cursor`` to page via keyset
+    seeks (fast at any depth); ``page`` still works for random access.
+    """
     conn = _h._db()
-    where, params = [], []
-    if category:
-        where.append("category = ?")
-        params.append(category)
-    if severity:
-        where.append("severity = ?")
-        params.append(severity)
-    if user_id:
-        where.append("user_id = ?")
-        params.append(user_id)
-
-    where_sql = " AND ".join(where) if where else "1=1"
-    total = conn.execute(
-        f"SELECT COUNT(*) FROM guardrail_events WHERE {where_sql}", params
-    ).fetchone()[0]
-
-    offset = (page - 1) * per_page
-    cur = conn.execute(
-        f"SELECT * FROM guardrail_events WHERE {where_sql} ORDER BY created_at DESC LIMIT ? OFFSET ?",
-        params + [per_page, offset],
+    cols, params = _h._filters(
+        ("category", category), ("severity", severity), ("user_id", user_id)
+    )
+    seek_sql, seek_params = _h._seek(cursor, "created_at", "id")
+    count_sql, page_sql = _h._list_sql(
+        "guardrail_events", cols, "created_at DESC, id DESC", seek_sql
     )
-    return {"events": _h._rows(cur), "total": total, "page": page, "per_page": per_page}
+    total = conn.execute(count_sql, params).fetchone()[0]
+    offset = 0 if cursor else (page - 1) * per_page
+    cur = conn.execute(page_sql, params + seek_params + [per_page, offset])
+    events = _h._rows(cur)
+    return {
+        "events": events, "total": total, "page": page, "per_page": per_page,
+        "next_cursor": _h._next_cursor(events, per_page, "created_at", "id"),
+    }
 
 
 @router.get("/safety/patterns")
-async def list_jailbreak_patterns(_: dict = Depends(require_admin)):
+@_h.cached_response(reads=["jailbreak_patterns"])
+def list_jailbreak_patterns(_: dict = Depends(require_admin)):
     conn = _h._db()
     cur = conn.execute("SELECT * FROM jailbreak_patterns ORDER BY hit_count DESC")
     return {"patterns": _h._rows(cur)}
@@ -60,7 +63,7 @@ class JailbreakPatternRequest(BaseModel):
 
 
 @router.post("/safety/patterns")
-async def add_jailbreak_pattern(req: JailbreakPatternRequest, _: dict = Depends(require_admin)):
+def add_jailbreak_pattern(req: JailbreakPatternRequest, _: dict = Depends(require_admin)):
     conn = _h._db()
     try:
         conn.execute(
@@ -73,8 +76,24 @@ async def add_jailbreak_pattern(req: JailbreakPatternRequest, _: dict = Depends(
     return {"ok": True}
 
 
+@router.post("/safety/patterns/bulk")
+def add_jailbreak_patterns_bulk(
+    reqs: list[JailbreakPatternRequest], _: dict = Depends(require_admin)
+):
+    """Insert many patterns in one transaction; duplicates are skipped."""
+    conn = _h._db()
+    before = conn.total_changes
+    with conn:
+        conn.executemany(
+            "INSERT OR IGNORE INTO jailbreak_patterns (pattern, source) VALUES (?, ?)",
+            [(r.pattern, r.source) for r in reqs],
+        )
+    added = conn.total_changes - before
+    return {"ok": True, "added": added, "skipped": len(reqs) - added}
+
+
 @router.delete("/safety/patterns/{pattern_id}")
-async def delete_jailbreak_pattern(pattern_id: int, _: dict = Depends(require_admin)):
+def delete_jailbreak_pattern(pattern_id: int, _: dict = Depends(require_admin)):
     conn = _h._db()
     conn.execute("DELETE FROM jailbreak_patterns WHERE id = ?", (pattern_id,))
     conn.commit()
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-import json as _json
+import asyncio
+from types import MappingProxyType
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 
@@ -13,7 +15,9 @@ from cortex.admin.helpers import require_admin
 router = APIRouter()
 
 
-# Lazy-init singleton to avoid import-time side effects
+# Lazy-init singleton to avoid import-time side effects.  The server warms
+# it at startup via warm_satellite_manager(); the lazy path stays as a
+# fallback for apps that mount the router without the server lifespan.
 _satellite_manager = None
 
 
@@ -25,6 +29,11 @@ def _get_satellite_manager():
     return _satellite_manager
 
 
+async def warm_satellite_manager() -> None:
+    """Build the satellite manager and prime its discovery list."""
+    await _get_satellite_manager().get_discovered()
+
+
 class SatelliteAddRequest(BaseModel):
     ip_address: str
     mode: str = "dedicated"
@@ -323,6 +332,34 @@ async def set_kiosk_url(
     return result
 
 
+# Built-in LED patterns; satellite-specific overrides are merged over these.
+# Read-only so the shared mapping can't be mutated through a response.
+_LED_DEFAULTS = MappingProxyType({
+    "idle": {"r": 0, "g": 0, "b": 0, "brightness": 0.0},
+    "listening": {"r": 0, "g": 100, "b": 255, "brightness": 0.4},
+    "thinking": {"r": 255, "g": 165, "b": 0, "brightness": 0.3},
+    "speaking": {"r": 0, "g": 200, "b": 100, "brightness": 0.4},
+    "error": {"r": 255, "g": 0, "b": 0, "brightness": 0.5},
+    "muted": {"r": 255, "g": 0, "b": 0, "brightness": 0.1},
+    "wakeword": {"r": 0, "g": 200, "b": 255, "brightness": 0.6},
+})
+
+
+_GET_LED_SQL = "SELECT led_config FROM satellites WHERE id = ?"
+_SET_LED_SQL = "UPDATE satellites SET led_config = ? WHERE id = ?"
+
+
+def _merge_led_config(satellite_id: str, patterns: dict) -> None:
+    db = get_db()
+    existing = db.execute(_GET_LED_SQL, (satellite_id,)).fetchone()
+    if not existing:
+        raise HTTPException(status_code=404, detail="Satellite not found")
+    current = orjson.loads(existing["led_config"]) if existing["led_config"] else {}
+    current.update(patterns)
+    db.execute(_SET_LED_SQL, (orjson.dumps(current).decode(), satellite_id))
+    db.commit()
+
+
 @router.patch("/satellites/{satellite_id}/led_config")
 async def update_led_config(satellite_id: str, body: dict, admin: dict = Depends(require_admin)):
     """Update LED pattern colors for a satellite and push live."""
@@ -330,40 +367,23 @@ async def update_led_config(satellite_id: str, body: dict, admin: dict = Depends
     patterns = body.get("patterns", {})
     if not patterns:
         raise HTTPException(status_code=400, detail="Missing patterns")
-    # Store in DB
-    db = get_db()
-    existing = db.execute("SELECT led_config FROM satellites WHERE id = ?", (satellite_id,)).fetchone()
-    if not existing:
-        raise HTTPException(status_code=404, detail="Satellite not found")
-    current = _json.loads(existing["led_config"]) if existing["led_config"] else {}
-    current.update(patterns)
-    db.execute("UPDATE satellites SET led_config = ? WHERE id = ?", (_json.dumps(current), satellite_id))
-    db.commit()
+    # Store in DB (off the event loop — the commit can block on disk)
+    await asyncio.to_thread(_merge_led_config, satellite_id, patterns)
     # Push to satellite
     sent = await send_command(satellite_id, "led_config", {"patterns": patterns})
     return {"saved": True, "pushed": sent}
 
 
 @router.get("/satellites/{satellite_id}/led_config")
-async def get_led_config(satellite_id: str, admin: dict = Depends(require_admin)):
+def get_led_config(satellite_id: str, admin: dict = Depends(require_admin)):
     """Get the LED pattern configuration for a satellite."""
     db = get_db()
-    row = db.execute("SELECT led_config FROM satellites WHERE id = ?", (satellite_id,)).fetchone()
+    row = db.execute(_GET_LED_SQL, (satellite_id,)).fetchone()
     if not row:
         raise HTTPException(status_code=404, detail="Satellite not found")
-    config = _json.loads(row["led_config"]) if row["led_config"] else {}
+    config = orjson.loads(row["led_config"]) if row["led_config"] else {}
     # Return defaults merged with custom
-    defaults = {
-        "idle": {"r": 0, "g": 0, "b": 0, "brightness": 0.0},
-        "listening": {"r": 0, "g": 100, "b": 255, "brightness": 0.4},
-        "thinking": {"r": 255, "g": 165, "b": 0, "brightness": 0.3},
-        "speaking": {"r": 0, "g": 200, "b": 100, "brightness": 0.4},
-        "error": {"r": 255, "g": 0, "b": 0, "brightness": 0.5},
-        "muted": {"r": 255, "g": 0, "b": 0, "brightness": 0.1},
-        "wakeword": {"r": 0, "g": 200, "b": 255, "brightness": 0.6},
-    }
-    merged = {**defaults, **config}
-    return {"patterns": merged}
+    return {"patterns": _LED_DEFAULTS | config}
 
 
 @router.delete("/satellites/{satellite_id}")
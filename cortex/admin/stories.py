@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -36,6 +37,18 @@ class AssignVoiceRequest(BaseModel):
 # ── Story CRUD ────────────────────────────────────────────────────
 
 
+@functools.lru_cache(maxsize=None)
+def _stories_sql(cols: tuple[str, ...]) -> tuple[str, str]:
+    """``(count_sql, page_sql)`` for the stories list, one pair per filter set."""
+    where = " AND ".join(f"s.{c} = ?" for c in cols) or "1=1"
+    return (
+        f"SELECT COUNT(*) FROM stories s WHERE {where}",
+        "SELECT s.*, "
+        "(SELECT COUNT(*) FROM story_chapters sc WHERE sc.story_id = s.id) AS chapter_count "
+        f"FROM stories s WHERE {where} ORDER BY s.created_at DESC LIMIT ? OFFSET ?",
+    )
+
+
 @router.get("/stories")
 async def list_stories(
     _: dict = Depends(require_admin),
@@ -45,27 +58,12 @@ async def list_stories(
     age_group: str | None = None,
 ):
     conn = _h._db()
-    where, params = [], []
-    if genre:
-        where.append("s.genre = ?")
-        params.append(genre)
-    if age_group:
-        where.append("s.target_age_group = ?")
-        params.append(age_group)
-
-    where_sql = " AND ".join(where) if where else "1=1"
-    total = conn.execute(
-        f"SELECT COUNT(*) FROM stories s WHERE {where_sql}", params
-    ).fetchone()[0]
+    cols, params = _h._filters(("genre", genre), ("target_age_group", age_group))
+    count_sql, page_sql = _stories_sql(cols)
+    total = conn.execute(count_sql, params).fetchone()[0]
 
     offset = (page - 1) * per_page
-    cur = conn.execute(
-        f"SELECT s.*, "
-        "(SELECT COUNT(*) FROM story_chapters sc WHERE sc.story_id = s.id) AS chapter_count "
-        f"FROM stories s WHERE {where_sql} "
-        "ORDER BY s.created_at DESC LIMIT ? OFFSET ?",
-        params + [per_page, offset],
-    )
+    cur = conn.execute(page_sql, params + [per_page, offset])
     return {"stories": _h._rows(cur), "total": total, "page": page, "per_page": per_page}
 
 
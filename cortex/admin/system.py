@@ -4,18 +4,20 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
-from cortex.db import get_db
 from cortex.admin import helpers as _h
 from cortex.admin.helpers import require_admin
 
-router = APIRouter()
+router = APIRouter(
+    route_class=_h.ETagRoute,
+    dependencies=[Depends(_h.writes("mistake_log", "system_settings"))],
+)
 
 
 # ── Evolution ─────────────────────────────────────────────────────
 
 
 @router.get("/evolution/profiles")
-async def list_emotional_profiles(
+def list_emotional_profiles(
     _: dict = Depends(require_admin),
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=100),
@@ -29,19 +31,25 @@ async def list_emotional_profiles(
     )
     profiles = _h._rows(cur)
 
+    # Top 5 topics per user, fetched for the whole page in one query
+    ids = [p["user_id"] for p in profiles]
+    cur = conn.execute(
+        "SELECT user_id, topic, mention_count FROM ("
+        "  SELECT user_id, topic, mention_count, ROW_NUMBER() OVER ("
+        "    PARTITION BY user_id ORDER BY mention_count DESC) AS rn"
+        f"  FROM user_topics WHERE user_id IN ({_h._placeholders(ids)})"
+        ") WHERE rn <= 5 ORDER BY user_id, mention_count DESC",
+        ids,
+    )
+    topics = _h._group_rows(cur, "user_id")
     for p in profiles:
-        uid = p["user_id"]
-        cur = conn.execute(
-            "SELECT topic, mention_count FROM user_topics WHERE user_id = ? ORDER BY mention_count DESC LIMIT 5",
-            (uid,),
-        )
-        p["top_topics"] = _h._rows(cur)
+        p["top_topics"] = topics.get(p["user_id"], [])
 
     return {"profiles": profiles, "total": total, "page": page, "per_page": per_page}
 
 
 @router.get("/evolution/logs")
-async def list_evolution_logs(
+def list_evolution_logs(
     _: dict = Depends(require_admin),
     limit: int = Query(20, ge=1, le=100),
 ):
@@ -51,32 +59,32 @@ async def list_evolution_logs(
 
 
 @router.get("/evolution/mistakes")
-async def list_mistakes(
+def list_mistakes(
     _: dict = Depends(require_admin),
     resolved: bool | None = None,
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=100),
+    cursor: str | None = None,
 ):
+    """List logged mistakes, newest first (``cursor`` pages by keyset)."""
     conn = _h._db()
-    where, params = [], []
-    if resolved is not None:
-        where.append("resolved = ?")
-        params.append(resolved)
-    where_sql = " AND ".join(where) if where else "1=1"
-
-    total = conn.execute(
-        f"SELECT COUNT(*) FROM mistake_log WHERE {where_sql}", params
-    ).fetchone()[0]
-    offset = (page - 1) * per_page
-    cur = conn.execute(
-        f"SELECT * FROM mistake_log WHERE {where_sql} ORDER BY created_at DESC LIMIT ? OFFSET ?",
-        params + [per_page, offset],
+    cols, params = _h._filters(("resolved", resolved))
+    seek_sql, seek_params = _h._seek(cursor, "created_at", "id")
+    count_sql, page_sql = _h._list_sql(
+        "mistake_log", cols, "created_at DESC, id DESC", seek_sql
     )
-    return {"mistakes": _h._rows(cur), "total": total, "page": page, "per_page": per_page}
+    total = conn.execute(count_sql, params).fetchone()[0]
+    offset = 0 if cursor else (page - 1) * per_page
+    cur = conn.execute(page_sql, params + seek_params + [per_page, offset])
+    mistakes = _h._rows(cur)
+    return {
+        "mistakes": mistakes, "total": total, "page": page, "per_page": per_page,
+        "next_cursor": _h._next_cursor(mistakes, per_page, "created_at", "id"),
+    }
 
 
 @router.patch("/evolution/mistakes/{mistake_id}")
-async def resolve_mistake(mistake_id: int, _: dict = Depends(require_admin)):
+def resolve_mistake(mistake_id: int, _: dict = Depends(require_admin)):
     conn = _h._db()
     conn.execute("UPDATE mistake_log SET resolved = TRUE WHERE id = ?", (mistake_id,))
     conn.commit()
@@ -87,7 +95,8 @@ async def resolve_mistake(mistake_id: int, _: dict = Depends(require_admin)):
 
 
 @router.get("/system/hardware")
-async def get_hardware(_: dict = Depends(require_admin)):
+@_h.cached_response(reads=["hardware_profile", "hardware_gpu"])
+def get_hardware(_: dict = Depends(require_admin)):
     conn = _h._db()
     cur = conn.execute("SELECT * FROM hardware_profile WHERE is_current = TRUE")
     profile = _h._row(cur)
@@ -97,21 +106,24 @@ async def get_hardware(_: dict = Depends(require_admin)):
 
 
 @router.get("/system/models")
-async def get_model_config(_: dict = Depends(require_admin)):
+@_h.cached_response(reads=["model_config"])
+def get_model_config(_: dict = Depends(require_admin)):
     conn = _h._db()
     cur = conn.execute("SELECT * FROM model_config ORDER BY role")
     return {"models": _h._rows(cur)}
 
 
 @router.get("/system/services")
-async def get_services(_: dict = Depends(require_admin)):
+@_h.cached_response(reads=["discovered_services"])
+def get_services(_: dict = Depends(require_admin)):
     conn = _h._db()
     cur = conn.execute("SELECT * FROM discovered_services ORDER BY service_type")
     return {"services": _h._rows(cur)}
 
 
 @router.get("/system/backups")
-async def get_backups(
+@_h.cached_response(reads=["backup_log"])
+def get_backups(
     _: dict = Depends(require_admin),
     limit: int = Query(20, ge=1, le=100),
 ):
@@ -121,53 +133,43 @@ async def get_backups(
 
 
 @router.get("/system/interactions")
-async def get_interactions(
+def get_interactions(
     _: dict = Depends(require_admin),
     user_id: str | None = None,
     layer: str | None = None,
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=100),
+    cursor: str | None = None,
 ):
+    """List interactions, newest first (``cursor`` pages by keyset)."""
     conn = _h._db()
-    where, params = [], []
-    if user_id:
-        where.append("user_id = ?")
-        params.append(user_id)
-    if layer:
-        where.append("matched_layer = ?")
-        params.append(layer)
-    where_sql = " AND ".join(where) if where else "1=1"
-
-    total = conn.execute(
-        f"SELECT COUNT(*) FROM interactions WHERE {where_sql}", params
-    ).fetchone()[0]
-    offset = (page - 1) * per_page
-    cur = conn.execute(
-        f"SELECT * FROM interactions WHERE {where_sql} ORDER BY created_at DESC LIMIT ? OFFSET ?",
-        params + [per_page, offset],
+    cols, params = _h._filters(("user_id", user_id), ("matched_layer", layer))
+    seek_sql, seek_params = _h._seek(cursor, "created_at", "id")
+    count_sql, page_sql = _h._list_sql(
+        "interactions", cols, "created_at DESC, id DESC", seek_sql
     )
-    return {"interactions": _h._rows(cur), "total": total, "page": page, "per_page": per_page}
+    total = conn.execute(count_sql, params).fetchone()[0]
+    offset = 0 if cursor else (page - 1) * per_page
+    cur = conn.execute(page_sql, params + seek_params + [per_page, offset])
+    interactions = _h._rows(cur)
+    return {
+        "interactions": interactions, "total": total, "page": page, "per_page": per_page,
+        "next_cursor": _h._next_cursor(interactions, per_page, "created_at", "id"),
+    }
 
 
 # ── Settings ──────────────────────────────────────────────────────
 
 
 @router.get("/settings")
-async def get_system_settings(admin: dict = Depends(require_admin)):
+def get_system_settings(admin: dict = Depends(require_admin)):
     """Get all system settings."""
-    db = get_db()
-    rows = db.execute("SELECT key, value FROM system_settings").fetchall()
-    return {row["key"]: row["value"] for row in rows}
+    return dict(_h._settings())
 
 
 @router.put("/settings/{key}")
-async def set_system_setting(key: str, body: dict, admin: dict = Depends(require_admin)):
+def set_system_setting(key: str, body: dict, admin: dict = Depends(require_admin)):
     """Set a system setting. Body: {\"value\": \"...\"}"""
     value = body.get("value", "")
-    db = get_db()
-    db.execute(
-        "INSERT OR REPLACE INTO system_settings (key, value, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)",
-        (key, value),
-    )
-    db.commit()
+    _h._put_setting(key, value)
     return {"key": key, "value": value}
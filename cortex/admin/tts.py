@@ -2,111 +2,184 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
 import logging
 import os
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
 
 from cortex.db import get_db
+from cortex.admin import helpers as _h
 from cortex.admin.helpers import require_admin
+from cortex.speech import tts_cache
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(_h.writes("system_settings"))])
+
+
+# Kokoro prefix → language mapping
+_KOKORO_LANG = {
+    "a": "en", "b": "en",  # American / British English
+    "e": "es", "f": "fr", "g": "de", "h": "hi",
+    "i": "it", "j": "ja", "k": "ko", "p": "pt",
+    "z": "zh",
+}
+
+
+# Orpheus ships a fixed voice catalogue, so its listing entries and the id
+# set used to route previews are built once, on first use (the catalogue
+# lives in the deprecated cortex.voice package, which warns on import)
+@functools.lru_cache(maxsize=None)
+def _orpheus_catalogue() -> tuple[tuple[dict, ...], frozenset[str]]:
+    from cortex.voice.providers.orpheus import _ORPHEUS_VOICES
+
+    entries = tuple(
+        {
+            "name": v["id"],
+            "provider": "orpheus",
+            "description": f"{v['name']} ({v['style']}, {v['gender']})",
+            "language": "en",
+            "installed": True,
+        }
+        for v in _ORPHEUS_VOICES
+    )
+    return entries, frozenset(v["id"].removeprefix("orpheus_") for v in _ORPHEUS_VOICES)
 
 
-@router.get("/tts/voices")
-async def list_tts_voices(admin: dict = Depends(require_admin)):
-    """List available TTS voices from Qwen3-TTS + Kokoro + Orpheus + Piper."""
-    from cortex.voice.wyoming import WyomingClient
-    all_voices = []
-
-    # Kokoro prefix → language mapping
-    _kokoro_lang = {
-        "a": "en", "b": "en",  # American / British English
-        "e": "es", "f": "fr", "g": "de", "h": "hi",
-        "i": "it", "j": "ja", "k": "ko", "p": "pt",
-        "z": "zh",
-    }
+# Kokoro voices (af_*, am_*, bf_*, bm_*, jf_*, etc.)
+_KOKORO_PREFIXES = ("af_", "am_", "bf_", "bm_", "ef_", "em_", "ff_", "gf_",
+                    "hf_", "if_", "jf_", "pf_", "zf_", "zm_")
+
+
+# service → (host env vars, port env vars, default host, default port); the
+# first variable that is set wins, so PIPER_* falls back to TTS_*
+_ENDPOINT_ENV = {
+    "qwen": (("QWEN_TTS_HOST",), ("QWEN_TTS_PORT",), "localhost", "7860"),
+    "kokoro": (("KOKORO_HOST",), ("KOKORO_PORT",), "localhost", "8880"),
+    "piper": (("PIPER_HOST", "TTS_HOST"), ("PIPER_PORT", "TTS_PORT"), "localhost", "10200"),
+    "wyoming": (("TTS_HOST",), ("TTS_PORT",), "localhost", "10200"),
+}
+
+
+def _env_first(names: tuple[str, ...], default: str) -> str:
+    return next((os.environ[n] for n in names if n in os.environ), default)
 
-    # Qwen3-TTS voices (primary, highest quality)
+
+@functools.lru_cache(maxsize=None)
+def _endpoint(service: str) -> tuple[str, int]:
+    """Return the ``(host, port)`` of a TTS *service*, read from the env once."""
+    host_vars, port_vars, host, port = _ENDPOINT_ENV[service]
+    return _env_first(host_vars, host), int(_env_first(port_vars, port))
+
+
+def _reset_endpoints() -> None:
+    """Forget resolved endpoints so the next lookup re-reads the environment."""
+    _endpoint.cache_clear()
+
+
+async def _fetch_qwen_voices() -> list[dict]:
+    """Qwen3-TTS voices (primary, highest quality)."""
     try:
         from cortex.voice.providers.qwen3_tts import Qwen3TTSProvider
-        qwen_host = os.environ.get("QWEN_TTS_HOST", "localhost")
-        qwen_port = int(os.environ.get("QWEN_TTS_PORT", "7860"))
+        qwen_host, qwen_port = _endpoint("qwen")
         qwen = Qwen3TTSProvider({"QWEN_TTS_HOST": qwen_host, "QWEN_TTS_PORT": str(qwen_port)})
         qwen_voices = await qwen.list_voices()
-        for v in qwen_voices:
-            all_voices.append({
-                "name": v["id"],
-                "provider": "qwen3_tts",
-                "description": f"{v['name']} ({v.get('style', 'natural')}, {v.get('gender', 'unknown')})",
-                "language": v.get("language", "en"),
-                "installed": True,
-            })
     except Exception:
-        pass
-
-    # Kokoro voices (primary)
+        return []
+    return [
+        {
+            "name": v["id"],
+            "provider": "qwen3_tts",
+            "description": f"{v['name']} ({v.get('style', 'natural')}, {v.get('gender', 'unknown')})",
+            "language": v.get("language", "en"),
+            "installed": True,
+        }
+        for v in qwen_voices
+    ]
+
+
+async def _fetch_kokoro_voices() -> list[dict]:
+    """Kokoro voices; the first letter of the id encodes the language."""
     try:
-        from cortex.voice.kokoro import KokoroClient
-        host = os.environ.get("KOKORO_HOST", "localhost")
-        port = int(os.environ.get("KOKORO_PORT", "8880"))
-        kokoro = KokoroClient(host, port, timeout=5.0)
+        from cortex.voice.kokoro import get_kokoro_client
+        host, port = _endpoint("kokoro")
+        kokoro = get_kokoro_client(host, port, timeout=5.0, connect_timeout=2.0)
         kokoro_voices = await kokoro.list_voices()
-        for v in kokoro_voices:
-            lang = _kokoro_lang.get(v[0], "en") if len(v) > 0 else "en"
-            all_voices.append({
-                "name": v,
-                "provider": "kokoro",
-                "description": v,
-                "language": lang,
-                "installed": True,
-            })
     except Exception:
-        pass
-
-    # Orpheus voices
-    try:
-        from cortex.voice.providers.orpheus import _ORPHEUS_VOICES
-        for v in _ORPHEUS_VOICES:
-            all_voices.append({
-                "name": v["id"],
-                "provider": "orpheus",
-                "description": f"{v['name']} ({v['style']}, {v['gender']})",
-                "language": "en",
-                "installed": True,
-            })
-    except Exception:
-        pass
-
-    # Piper voices (fallback)
+        return []
+    return [
+        {
+            "name": v,
+            "provider": "kokoro",
+            "description": v,
+            "language": _KOKORO_LANG.get(v[0], "en") if len(v) > 0 else "en",
+            "installed": True,
+        }
+        for v in kokoro_voices
+    ]
+
+
+async def _fetch_orpheus_voices() -> list[dict]:
+    """Orpheus voices (static catalogue, no network)."""
+    return list(_orpheus_catalogue()[0])
+
+
+async def _fetch_piper_voices() -> list[dict]:
+    """Piper voices over Wyoming (fallback)."""
+    from cortex.voice.wyoming import WyomingClient
     try:
-        host = os.environ.get("PIPER_HOST", os.environ.get("TTS_HOST", "localhost"))
-        port = int(os.environ.get("PIPER_PORT", os.environ.get("TTS_PORT", "10200")))
-        tts = WyomingClient(host, port)
+        host, port = _endpoint("piper")
+        tts = WyomingClient(host, port, timeout=2.0, read_timeout=5.0)
         piper_voices = await tts.list_voices()
-        for v in piper_voices:
-            v["provider"] = "piper"
-            # Extract language from Wyoming 'languages' list and normalize to 2-letter code
-            langs = v.get("languages", [])
-            if langs and isinstance(langs, list) and isinstance(langs[0], dict):
-                lang_code = langs[0].get("code", "en")
-                v["language"] = lang_code[:2] if lang_code else "en"
-            else:
-                v["language"] = v.get("language", "en")
-            all_voices.append(v)
     except Exception:
-        pass
+        return []
+    for v in piper_voices:
+        v["provider"] = "piper"
+        # Extract language from Wyoming 'languages' list and normalize to 2-letter code
+        langs = v.get("languages", [])
+        if langs and isinstance(langs, list) and isinstance(langs[0], dict):
+            lang_code = langs[0].get("code", "en")
+            v["language"] = lang_code[:2] if lang_code else "en"
+        else:
+            v["language"] = v.get("language", "en")
+    return piper_voices
 
-    # Include system default voice
-    db = get_db()
-    row = db.execute("SELECT value FROM system_settings WHERE key = 'default_tts_voice'").fetchone()
-    system_default = row["value"] if row else ""
+
+@router.get("/tts/voices")
+async def list_tts_voices(admin: dict = Depends(require_admin)):
+    """List available TTS voices from Qwen3-TTS + Kokoro + Orpheus + Piper."""
+    # Query every provider at once: latency is the slowest one, not the sum.
+    # The system default voice is read in a worker thread alongside them.
+    system_default, *results = await asyncio.gather(
+        asyncio.to_thread(_load_default_voice),
+        _fetch_qwen_voices(),
+        _fetch_kokoro_voices(),
+        _fetch_orpheus_voices(),
+        _fetch_piper_voices(),
+    )
+    all_voices = [v for voices in results for v in voices]
 
     return {"voices": all_voices, "system_default": system_default}
 
 
+def _load_default_voice() -> str:
+    return _h._settings().get("default_tts_voice", "")
+
+
+def _store_default_voice(voice: str) -> None:
+    _h._put_setting("default_tts_voice", voice)
+
+
+def _load_satellite_voice(satellite_id: str) -> str:
+    db = get_db()
+    row = db.execute("SELECT tts_voice FROM satellites WHERE id = ?", (satellite_id,)).fetchone()
+    return (row["tts_voice"] or "") if row else ""
+
+
 @router.put("/tts/default_voice")
 async def set_default_voice(body: dict, admin: dict = Depends(require_admin)):
     """Set the system-wide default TTS voice. Body: {\"voice\": \"af_bella\"}"""
@@ -114,17 +187,11 @@ async def set_default_voice(body: dict, admin: dict = Depends(require_admin)):
     if not voice:
         return {"error": "voice is required"}, 400
 
-    db = get_db()
-    db.execute(
-        "INSERT OR REPLACE INTO system_settings (key, value, updated_at) VALUES ('default_tts_voice', ?, CURRENT_TIMESTAMP)",
-        (voice,),
-    )
-    db.commit()
+    await asyncio.to_thread(_store_default_voice, voice)
 
     logger.info("System default TTS voice set to: %s", voice)
 
     # Kick off background regeneration of cached audio for the new voice
-    import asyncio
     asyncio.create_task(_regenerate_cache_for_voice(voice))
 
     return {"default_voice": voice}
@@ -166,56 +233,289 @@ async def regenerate_tts_cache(body: dict, admin: dict = Depends(require_admin))
     """
     voice = body.get("voice", "")
     if not voice:
-        db = get_db()
-        row = db.execute("SELECT value FROM system_settings WHERE key = 'default_tts_voice'").fetchone()
-        voice = row["value"] if row else ""
+        voice = await asyncio.to_thread(_load_default_voice)
     if not voice:
         return {"error": "No voice specified and no system default set"}, 400
 
-    import asyncio
     asyncio.create_task(_regenerate_cache_for_voice(voice))
     return {"status": "regenerating", "voice": voice}
 
 
-@router.post("/tts/preview")
-async def preview_tts(body: dict, admin: dict = Depends(require_admin)):
-    """Synthesize text and return WAV audio for browser playback or push to satellite."""
-    import io
-    import wave
-    from fastapi.responses import Response
-    from cortex.voice.wyoming import WyomingClient, WyomingError
+# PCM bytes per TTS_CHUNK frame.  Satellites just append chunks to a buffer,
+# so larger frames only cut per-frame overhead; the first still ships as
+# soon as the backend produces audio.
+_SATELLITE_CHUNK_BYTES = 16384
 
-    text = body.get("text", "Hello, I am Atlas.")
-    voice = body.get("voice")
-    target = body.get("target", "browser")  # "browser" or satellite_id
+# Synthesized chunks buffered between the backend reader and the satellite
+# sender.  Bounded so a slow satellite back-pressures synthesis.
+_PIPELINE_DEPTH = 4
+
+
+def _preview_backend(voice: str | None) -> str:
+    """Return the backend that owns *voice*: ``orpheus``, ``kokoro`` or ``piper``."""
+    if voice and voice.replace("orpheus_", "") in _orpheus_catalogue()[1]:
+        return "orpheus"
+    if voice and voice.startswith(_KOKORO_PREFIXES):
+        return "kokoro"
+    return "piper"
+
+
+def _split_wav_header(chunk: bytes) -> tuple[dict, bytes]:
+    """Parse a RIFF header at the start of *chunk*; return (audio_info, pcm)."""
+    data_at = chunk.find(b"data", 12)
+    if data_at < 0:
+        return {"rate": 24000, "width": 2, "channels": 1}, chunk
+    info = {
+        "channels": int.from_bytes(chunk[22:24], "little"),
+        "rate": int.from_bytes(chunk[24:28], "little"),
+        "width": int.from_bytes(chunk[34:36], "little") // 8,
+    }
+    return info, chunk[data_at + 8:]
+
+
+async def _orpheus_stream(text: str, voice: str | None):
+    """Yield ``(pcm_chunk, audio_info)`` from Orpheus as it is generated."""
+    from cortex.voice.providers import get_tts_provider, _env_config
+
+    provider = get_tts_provider(_env_config())
+    info = None
+    async with contextlib.aclosing(provider.synthesize(text, voice=voice)) as stream:
+        async for chunk in stream:
+            if info is None:
+                if chunk[:4] == b"RIFF":
+                    info, chunk = _split_wav_header(chunk)
+                else:
+                    info = {"rate": 24000, "width": 2, "channels": 1}  # SNAC decoder output
+            if chunk:
+                yield chunk, info
+
+
+def _piper_stream(text: str, voice: str | None, host: str, port: int, read_timeout: float):
+    """Return Piper's ``(pcm_chunk, audio_info)`` stream over Wyoming."""
+    from cortex.voice.wyoming import WyomingClient
+
+    tts = WyomingClient(host, port, timeout=2.0, read_timeout=read_timeout, write_timeout=5.0)
+    return tts.synthesize_stream(text, voice=voice)
+
+
+async def _open_stream(pairs):
+    """Wait for the first chunk of a ``(chunk, info)`` stream.
+
+    Returns ``(info, chunks)`` where *chunks* replays the first chunk and
+    then the rest, or ``None`` if the stream ended without audio.
+    """
+    try:
+        first, info = await pairs.__anext__()
+    except StopAsyncIteration:
+        return None
+    return info, _Replay(first, pairs)
+
+
+class _Replay:
+    """The *chunks* half of :func:`_open_stream`: the first chunk, then the rest.
+
+    ``aclose()`` closes the backend stream (socket/HTTP) even when iteration
+    never started, e.g. for a hedging loser.
+    """
+
+    __slots__ = ("_first", "_pairs")
+
+    def __init__(self, first: bytes, pairs) -> None:
+        self._first: bytes | None = first
+        self._pairs = pairs
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> bytes:
+        if self._first is not None:
+            chunk, self._first = self._first, None
+            return chunk
+        chunk, _ = await self._pairs.__anext__()
+        return chunk
+
+    async def aclose(self) -> None:
+        await self._pairs.aclose()
+
+
+async def _close_stream(stream) -> None:
+    """Close an ``(info, chunks)`` stream from :func:`_open_stream` unread."""
+    await stream[1].aclose()
+
+
+_TTS_END_FRAME = orjson.dumps({"type": "TTS_END"}).decode()
+
+
+@functools.lru_cache(maxsize=32)
+def _tts_start_frame(rate: int, fmt: str) -> str:
+    """Encoded TTS_START frame; previews only ever use a handful of formats."""
+    return orjson.dumps({"type": "TTS_START", "sample_rate": rate, "format": fmt}).decode()
+
+
+async def _stream_to_satellite(conn, rate: int, width: int, channels: int,
+                               chunk_iter, fmt: str | None = None) -> bytes:
+    """Push audio to a satellite as it arrives, in <= 16 KiB TTS_CHUNK frames.
+
+    Reading *chunk_iter* runs in its own task, so the backend keeps
+    synthesizing while earlier chunks are on the wire.  Returns everything
+    that was sent so the caller can cache it.
+    """
+    await conn.send_raw(_tts_start_frame(rate, fmt or f"pcm_{rate}_{width*8}bit_{channels}ch"))
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=_PIPELINE_DEPTH)
+
+    async def produce():
+        try:
+            async for chunk in chunk_iter:
+                await queue.put(chunk)
+        finally:
+            # Release the backend stream however we got here
+            await chunk_iter.aclose()
+            # Wake the sender on success or failure; a cancelled producer
+            # means the sender is already gone
+            if not asyncio.current_task().cancelling():
+                await queue.put(None)
+
+    producer = asyncio.create_task(produce())
+    sent = []
+    try:
+        while (chunk := await queue.get()) is not None:
+            mv = memoryview(chunk)  # slices share the buffer, no copy per frame
+            for off in range(0, len(chunk), _SATELLITE_CHUNK_BYTES):
+                await conn.send_audio_chunk(mv[off:off + _SATELLITE_CHUNK_BYTES])
+            sent.append(chunk)
+        await producer  # surface synthesis errors
+    except BaseException:
+        # Still end the stream, but a dead socket must not replace the
+        # error that got us here
+        with contextlib.suppress(Exception):
+            await conn.send_raw(_TTS_END_FRAME)
+        raise
+    finally:
+        producer.cancel()
+        # Already awaited on success; otherwise its error is secondary
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await producer
+    await conn.send_raw(_TTS_END_FRAME)
+    return b"".join(sent)
+
+
+async def _once(data: bytes):
+    yield data
+
+
+def _wav_bytes(pcm: bytes, rate: int, width: int, channels: int) -> bytes:
+    """Frame *pcm* as a WAV file by prepending a canonical 44-byte RIFF header."""
+    import struct
+
+    block_align = width * channels
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + len(pcm), b"WAVE",
+        b"fmt ", 16, 1, channels, rate, rate * block_align, block_align, width * 8,
+        b"data", len(pcm),
+    )
+    return header + pcm
+
+
+def _hedge_enabled() -> bool:
+    """``TTS_HEDGE=1`` races Orpheus against Piper for previews with no voice."""
+    return os.environ.get("TTS_HEDGE", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+async def _first_result(*aws, ok=bool, discard=None):
+    """Run *aws* concurrently and return the first result passing *ok*.
+
+    The losers are cancelled and awaited.  If nothing passes, the last
+    result that did not raise is returned, or the last error re-raised if
+    they all did.  *discard*, if given, is awaited with every other result
+    a loser had already produced (e.g. to close an opened stream).
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    result = error = None
+    returned = False
+    try:
+        for fut in asyncio.as_completed(tasks):
+            try:
+                result = await fut
+            except Exception as e:
+                logger.warning("Hedged TTS backend failed: %s", e)
+                error = e
+                continue
+            if ok(result):
+                return result
+            returned = True
+    finally:
+        for task in tasks:
+            task.cancel()
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        if discard is not None:
+            for outcome in outcomes:
+                if outcome is not None and outcome is not result \
+                        and not isinstance(outcome, BaseException):
+                    await discard(outcome)
+    if not returned and error is not None:
+        raise error
+    return result
+
+
+async def _synthesize_orpheus(text: str, voice: str | None) -> tts_cache.AudioEntry:
+    chunks = []
+    info = {"rate": 24000, "width": 2, "channels": 1}
+    async for chunk, info in _orpheus_stream(text, voice):
+        chunks.append(chunk)
+    return b"".join(chunks), info["rate"], info["width"], info["channels"]
+
+
+async def _synthesize_piper(text: str, voice: str | None) -> tts_cache.AudioEntry:
+    from cortex.voice.wyoming import WyomingClient
+
+    host, port = _endpoint("piper")
+    tts = WyomingClient(host, port, timeout=2.0, read_timeout=15.0, write_timeout=5.0)
+    piper_voice = voice if voice and not voice.startswith("orpheus_") else None
+    audio_data, audio_info = await tts.synthesize(text, voice=piper_voice)
+    return (
+        audio_data,
+        audio_info.get("rate", 22050),
+        audio_info.get("width", 2),
+        audio_info.get("channels", 1),
+    )
+
+
+async def _synthesize_preview(text: str, voice: str | None) -> tts_cache.AudioEntry:
+    """Synthesize *text* with the backend that owns *voice*.
+
+    A Kokoro or Orpheus failure returns empty audio rather than Piper's, so
+    the caller's fallback is never cached under this voice.  With no voice
+    and ``TTS_HEDGE`` set, Orpheus and Piper run at once and the first to
+    return audio wins.
+    """
+    from cortex.voice.wyoming import WyomingError
+
+    if not voice and _hedge_enabled():
+        try:
+            return await _first_result(
+                _synthesize_orpheus(text, None), _synthesize_piper(text, None),
+                ok=lambda entry: bool(entry[0]),
+            )
+        except WyomingError as e:
+            raise HTTPException(status_code=502, detail=f"TTS error: {e}")
 
     audio_data = b""
     rate = 22050
     width = 2
     channels = 1
+    backend = _preview_backend(voice)
 
-    # Try Orpheus for orpheus voices
-    orpheus_voices = {"tara", "leah", "jess", "leo", "dan", "mia", "zac", "zoe"}
-    use_orpheus = voice and voice.replace("orpheus_", "") in orpheus_voices
-
-    # Try Kokoro for Kokoro voices (af_*, am_*, bf_*, bm_*, jf_*, etc.)
-    kokoro_prefixes = ("af_", "am_", "bf_", "bm_", "ef_", "em_", "ff_", "gf_",
-                       "hf_", "if_", "jf_", "pf_", "zf_", "zm_")
-    use_kokoro = voice and voice.startswith(kokoro_prefixes) and not use_orpheus
-
-    if use_kokoro:
+    if backend == "kokoro":
         try:
-            from cortex.voice.kokoro import KokoroClient, KokoroError
-            kokoro_host = os.environ.get("KOKORO_HOST", "localhost")
-            kokoro_port = int(os.environ.get("KOKORO_PORT", "8880"))
-            client = KokoroClient(host=kokoro_host, port=kokoro_port)
+            from cortex.voice.kokoro import get_kokoro_client
+            kokoro_host, kokoro_port = _endpoint("kokoro")
+            client = get_kokoro_client(kokoro_host, kokoro_port, connect_timeout=2.0)
             wav_data, info = await client.synthesize(text, voice=voice, response_format="wav")
             if wav_data and wav_data[:4] == b"RIFF":
-                with wave.open(io.BytesIO(wav_data), "rb") as wf:
-                    rate = wf.getframerate()
-                    width = wf.getsampwidth()
-                    channels = wf.getnchannels()
-                    audio_data = wf.readframes(wf.getnframes())
+                # Only the header is read; the PCM is sliced off, not decoded
+                info, audio_data = _split_wav_header(wav_data)
+                rate, width, channels = info["rate"], info["width"], info["channels"]
             elif wav_data:
                 audio_data = wav_data
                 rate = info.get("rate", 24000)
@@ -223,121 +523,226 @@ async def preview_tts(body: dict, admin: dict = Depends(require_admin)):
             logger.warning("Kokoro preview failed, falling back to Piper: %s", e)
             audio_data = b""
 
-    if use_orpheus and not audio_data:
+    if backend == "orpheus":
         try:
-            from cortex.voice.providers import get_tts_provider, _env_config
-            provider = get_tts_provider(_env_config())
-            chunks = []
-            async for chunk in provider.synthesize(text, voice=voice):
-                chunks.append(chunk)
-            audio_data = b"".join(chunks)
-            if audio_data and audio_data[:4] == b"RIFF":
-                with wave.open(io.BytesIO(audio_data), "rb") as wf:
-                    rate = wf.getframerate()
-                    width = wf.getsampwidth()
-                    channels = wf.getnchannels()
-                    audio_data = wf.readframes(wf.getnframes())
-            elif audio_data:
-                rate = 24000  # SNAC decoder output
+            audio_data, rate, width, channels = await _synthesize_orpheus(text, voice)
         except Exception as e:
             logger.warning("Orpheus preview failed, falling back to Piper: %s", e)
             audio_data = b""
 
-    # Piper fallback
-    if not audio_data:
-        host = os.environ.get("PIPER_HOST", os.environ.get("TTS_HOST", "localhost"))
-        port = int(os.environ.get("PIPER_PORT", os.environ.get("TTS_PORT", "10200")))
-        tts = WyomingClient(host, port, timeout=30.0)
-        piper_voice = voice if voice and not voice.startswith("orpheus_") else None
+    if backend == "piper":
         try:
-            audio_data, audio_info = await tts.synthesize(text, voice=piper_voice)
+            audio_data, rate, width, channels = await _synthesize_piper(text, voice)
         except WyomingError as e:
             raise HTTPException(status_code=502, detail=f"TTS error: {e}")
-        rate = audio_info.get("rate", 22050)
-        width = audio_info.get("width", 2)
-        channels = audio_info.get("channels", 1)
 
-    if not audio_data:
-        raise HTTPException(status_code=500, detail="TTS returned empty audio")
+    return audio_data, rate, width, channels
+
+
+async def _synthesize_fallback(text: str, voice: str | None) -> tts_cache.AudioEntry:
+    """Piper audio for a Kokoro/Orpheus voice whose own backend failed."""
+    from cortex.voice.wyoming import WyomingError
+
+    try:
+        return await _synthesize_piper(text, voice)
+    except WyomingError as e:
+        raise HTTPException(status_code=502, detail=f"TTS error: {e}")
+
+
+async def _open_preview_stream(text: str, voice: str | None):
+    """Start live Orpheus/Piper synthesis for a satellite push.
+
+    Returns ``(info, chunks, owned)``, or ``None`` for Kokoro voices —
+    Kokoro answers with one complete WAV, so it goes through the buffered
+    path.  *owned* is false when Piper stood in for a failed Orpheus voice,
+    so the caller knows not to cache the audio under that voice.  With no
+    voice and ``TTS_HEDGE`` set, whichever of Orpheus and Piper produces
+    its first chunk sooner is streamed.
+    """
+    from cortex.voice.wyoming import WyomingError
+
+    host, port = _endpoint("piper")
+    if not voice and _hedge_enabled():
+        try:
+            stream = await _first_result(
+                _open_stream(_orpheus_stream(text, None)),
+                _open_stream(_piper_stream(text, None, host, port, 15.0)),
+                discard=_close_stream,
+            )
+        except WyomingError as e:
+            raise HTTPException(status_code=502, detail=f"TTS error: {e}")
+        return (*stream, True) if stream else None
+
+    backend = _preview_backend(voice)
+    if backend == "kokoro":
+        return None
+    if backend == "orpheus":
+        try:
+            stream = await _open_stream(_orpheus_stream(text, voice))
+            if stream:
+                return (*stream, True)
+        except Exception as e:
+            logger.warning("Orpheus preview failed, falling back to Piper: %s", e)
+
+    piper_voice = voice if voice and not voice.startswith("orpheus_") else None
+    try:
+        stream = await _open_stream(_piper_stream(text, piper_voice, host, port, 15.0))
+    except WyomingError as e:
+        raise HTTPException(status_code=502, detail=f"TTS error: {e}")
+    return (*stream, backend == "piper") if stream else None
+
+
+class _StreamFailed(Exception):
+    """The TTS backend failed after its stream had started."""
+
+
+async def _backend_chunks(chunks):
+    """Pass *chunks* through, re-raising backend errors as :class:`_StreamFailed`.
+
+    Keeps a synthesis failure apart from a failed satellite send.
+    """
+    try:
+        async for chunk in chunks:
+            yield chunk
+    except Exception as e:
+        raise _StreamFailed(str(e)) from e
+    finally:
+        await chunks.aclose()
+
+
+@router.post("/tts/preview")
+async def preview_tts(body: dict, admin: dict = Depends(require_admin)):
+    """Synthesize text and return WAV audio for browser playback or push to satellite."""
+    from fastapi.responses import Response
+
+    text = body.get("text", "Hello, I am Atlas.")
+    voice = body.get("voice")
+    target = body.get("target", "browser")  # "browser" or satellite_id
+    key = tts_cache.cache_key("preview", text, voice)
 
     if target != "browser":
         # Push to satellite speaker at native TTS rate (hardware handles conversion)
-        import base64
         conn = _connected_satellites_ref().get(target)
         if not conn:
             raise HTTPException(status_code=404, detail="Satellite not connected")
-        await conn.send({"type": "TTS_START", "sample_rate": rate, "format": f"pcm_{rate}_{width*8}bit_{channels}ch"})
-        for off in range(0, len(audio_data), 4096):
-            await conn.send({"type": "TTS_CHUNK", "audio": base64.b64encode(audio_data[off:off+4096]).decode()})
-        await conn.send({"type": "TTS_END"})
+        # Stream live audio so the speaker starts on the first chunk
+        stream = None if tts_cache.get(key) else await _open_preview_stream(text, voice)
+        if stream:
+            info, chunks, owned = stream
+            rate, width, channels = info.get("rate", 22050), info.get("width", 2), info.get("channels", 1)
+            try:
+                audio_data = await _stream_to_satellite(
+                    conn, rate, width, channels, _backend_chunks(chunks),
+                )
+            except _StreamFailed as e:
+                if not (owned and _preview_backend(voice) == "orpheus"):
+                    raise HTTPException(status_code=502, detail=f"TTS error: {e}")
+                # The clip was cut short: send the whole thing again from Piper
+                logger.warning("Orpheus preview failed mid-stream, falling back to Piper: %s", e)
+                audio_data, rate, width, channels = await _synthesize_fallback(text, voice)
+                await _stream_to_satellite(conn, rate, width, channels, _once(audio_data))
+                return {"sent": True, "bytes": len(audio_data)}
+            if owned:
+                tts_cache.put(key, (audio_data, rate, width, channels))
+            return {"sent": True, "bytes": len(audio_data)}
+
+    audio_data, rate, width, channels = await tts_cache.get_or_synth(
+        key, lambda: _synthesize_preview(text, voice),
+    )
+    if not audio_data and _preview_backend(voice) != "piper":
+        # Uncached, so the voice's own backend is asked again next time
+        audio_data, rate, width, channels = await _synthesize_fallback(text, voice)
+
+    if not audio_data:
+        raise HTTPException(status_code=500, detail="TTS returned empty audio")
+
+    if target != "browser":
+        await _stream_to_satellite(conn, rate, width, channels, _once(audio_data))
         return {"sent": True, "bytes": len(audio_data)}
 
     # Return WAV for browser playback
-    buf = io.BytesIO()
-    with wave.open(buf, "wb") as wf:
-        wf.setnchannels(channels)
-        wf.setsampwidth(width)
-        wf.setframerate(rate)
-        wf.writeframes(audio_data)
-    wav_bytes = buf.getvalue()
-
-    return Response(content=wav_bytes, media_type="audio/wav",
+    return Response(content=_wav_bytes(audio_data, rate, width, channels), media_type="audio/wav",
                     headers={"Content-Disposition": "inline; filename=preview.wav"})
 
 
+async def _synthesize_filler(text: str, voice: str | None) -> tts_cache.AudioEntry:
+    from cortex.voice.wyoming import WyomingClient
+
+    host, port = _endpoint("wyoming")
+    tts = WyomingClient(host, port, timeout=2.0, read_timeout=15.0, write_timeout=5.0)
+    audio_data, audio_info = await tts.synthesize(text, voice=voice)
+    return (
+        audio_data,
+        audio_info.get("rate", 22050),
+        audio_info.get("width", 2),
+        audio_info.get("channels", 1),
+    )
+
+
 @router.post("/tts/filler_preview")
 async def preview_filler(body: dict, admin: dict = Depends(require_admin)):
     """Synthesize a filler phrase and optionally push to satellite."""
     from cortex.filler import select_filler
-    from cortex.voice.wyoming import WyomingClient
+    from cortex.filler.cache import get_filler_cache
 
     sentiment = body.get("sentiment", "greeting")
     target = body.get("target", "browser")
 
-    # Pick a filler
-    filler_text = select_filler(sentiment, confidence=0.8, user_id="admin")
-    if not filler_text:
-        filler_text = "Hmm, let me think..."
-
-    host = os.environ.get("TTS_HOST", "localhost")
-    port = int(os.environ.get("TTS_PORT", "10200"))
-    tts = WyomingClient(host, port, timeout=15.0)
-
     # Use the target satellite's configured voice (if pushing to a satellite)
     voice = body.get("voice")
     if not voice and target != "browser":
-        from cortex.db import get_db
         try:
-            db = get_db()
-            row = db.execute("SELECT tts_voice FROM satellites WHERE id = ?", (target,)).fetchone()
-            voice = (row["tts_voice"] or "") if row else ""
+            voice = await asyncio.to_thread(_load_satellite_voice, target)
         except Exception:
             voice = ""
-    audio_data, audio_info = await tts.synthesize(filler_text, voice=voice or None)
+
+    # Prefer a filler pre-synthesized at startup (the audio the pipeline
+    # actually plays) when it was made with the requested voice
+    warm = get_filler_cache()
+    filler = warm.peek(sentiment) if warm.ready and (not voice or voice == warm.voice) else None
+    key = None
+    if filler:
+        filler_text = filler.phrase
+        entry = (filler.audio, filler.sample_rate, 2, 1)
+    else:
+        # Pick a filler
+        filler_text = select_filler(sentiment, confidence=0.8, user_id="admin")
+        if not filler_text:
+            filler_text = "Hmm, let me think..."
+        # Filler phrases come from a small fixed set, so nearly every call is a hit
+        key = tts_cache.cache_key("filler", filler_text, voice)
+        entry = tts_cache.get(key)
 
     if target != "browser":
-        import base64
         from cortex.satellite.websocket import get_connection
-        rate = audio_info.get("rate", 22050)
         conn = get_connection(target)
         if not conn:
             raise HTTPException(status_code=404, detail="Satellite not connected")
-        await conn.send({"type": "TTS_START", "sample_rate": rate, "format": f"pcm_{rate//1000}k_16bit_mono"})
-        for off in range(0, len(audio_data), 4096):
-            await conn.send({"type": "TTS_CHUNK", "audio": base64.b64encode(audio_data[off:off+4096]).decode()})
-        await conn.send({"type": "TTS_END"})
+        if entry:
+            audio_data, rate, width, channels = entry
+            chunks = _once(audio_data)
+        else:
+            host, port = _endpoint("wyoming")
+            stream = await _open_stream(_piper_stream(filler_text, voice or None, host, port, 15.0))
+            if not stream:
+                raise HTTPException(status_code=500, detail="TTS returned empty audio")
+            info, chunks = stream
+            rate, width, channels = info.get("rate", 22050), info.get("width", 2), info.get("channels", 1)
+        audio_data = await _stream_to_satellite(
+            conn, rate, width, channels, chunks, fmt=f"pcm_{rate//1000}k_16bit_mono",
+        )
+        if key:
+            tts_cache.put(key, (audio_data, rate, width, channels))
         return {"sent": True, "filler": filler_text}
 
-    import io
-    import wave
+    if entry is None:
+        entry = await tts_cache.get_or_synth(
+            key, lambda: _synthesize_filler(filler_text, voice or None),
+        )
+    audio_data, rate, width, channels = entry
+
     from fastapi.responses import Response
-    buf = io.BytesIO()
-    with wave.open(buf, "wb") as wf:
-        wf.setnchannels(audio_info.get("channels", 1))
-        wf.setsampwidth(audio_info.get("width", 2))
-        wf.setframerate(audio_info.get("rate", 22050))
-        wf.writeframes(audio_data)
-    return Response(content=buf.getvalue(), media_type="audio/wav")
+    return Response(content=_wav_bytes(audio_data, rate, width, channels), media_type="audio/wav")
 
 
 def _connected_satellites_ref():
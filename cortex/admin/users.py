@@ -2,65 +2,74 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 
 from cortex.admin import helpers as _h
 from cortex.admin.helpers import require_admin
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(_h.writes(
+    "user_profiles", "parental_controls", "parental_restricted_actions", "emotional_profiles",
+))])
 
 
 # ── User CRUD ─────────────────────────────────────────────────────
 
 
 @router.get("/users")
-async def list_users(
+def list_users(
     _: dict = Depends(require_admin),
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=100),
+    cursor: str | None = None,
 ):
+    """List users, most recently updated first (``cursor`` pages by keyset)."""
     conn = _h._db()
-    offset = (page - 1) * per_page
     total = conn.execute("SELECT COUNT(*) FROM user_profiles").fetchone()[0]
+    seek_sql, seek_params = _h._seek(cursor, "updated_at", "user_id")
+    offset = 0 if cursor else (page - 1) * per_page
     cur = conn.execute(
-        "SELECT * FROM user_profiles ORDER BY updated_at DESC LIMIT ? OFFSET ?",
-        (per_page, offset),
+        f"SELECT * FROM user_profiles WHERE 1=1{seek_sql} "
+        "ORDER BY updated_at DESC, user_id DESC LIMIT ? OFFSET ?",
+        seek_params + [per_page, offset],
     )
-    return {"users": _h._rows(cur), "total": total, "page": page, "per_page": per_page}
+    users = _h._rows(cur)
+    return {
+        "users": users, "total": total, "page": page, "per_page": per_page,
+        "next_cursor": _h._next_cursor(users, per_page, "updated_at", "user_id"),
+    }
 
 
 @router.get("/users/{user_id}")
-async def get_user(user_id: str, _: dict = Depends(require_admin)):
+def get_user(user_id: str, _: dict = Depends(require_admin)):
     conn = _h._db()
-    cur = conn.execute("SELECT * FROM user_profiles WHERE user_id = ?", (user_id,))
-    user = _h._row(cur)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    # Attach emotional profile
-    cur = conn.execute("SELECT * FROM emotional_profiles WHERE user_id = ?", (user_id,))
-    user["emotional_profile"] = _h._row(cur)
-
-    # Attach parental controls
-    cur = conn.execute("SELECT * FROM parental_controls WHERE child_user_id = ?", (user_id,))
-    user["parental_controls"] = _h._row(cur)
-
-    # Attach topics
-    cur = conn.execute(
-        "SELECT topic, mention_count, last_mentioned FROM user_topics WHERE user_id = ? ORDER BY mention_count DESC LIMIT 20",
-        (user_id,),
-    )
-    user["topics"] = _h._rows(cur)
+    with _h._read_snapshot(conn):
+        cur = conn.execute("SELECT * FROM user_profiles WHERE user_id = ?", (user_id,))
+        user = _h._row(cur)
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        # Attach emotional profile
+        cur = conn.execute("SELECT * FROM emotional_profiles WHERE user_id = ?", (user_id,))
+        user["emotional_profile"] = _h._row(cur)
+
+        # Attach parental controls
+        cur = conn.execute("SELECT * FROM parental_controls WHERE child_user_id = ?", (user_id,))
+        user["parental_controls"] = _h._row(cur)
+
+        # Attach topics
+        cur = conn.execute(
+            "SELECT topic, mention_count, last_mentioned FROM user_topics WHERE user_id = ? ORDER BY mention_count DESC LIMIT 20",
+            (user_id,),
+        )
+        user["topics"] = _h._rows(cur)
 
-    # Attach activity hours
-    cur = conn.execute(
-        "SELECT hour, interaction_count FROM user_activity_hours WHERE user_id = ? ORDER BY hour",
-        (user_id,),
-    )
-    user["activity_hours"] = _h._rows(cur)
+        # Attach activity hours
+        cur = conn.execute(
+            "SELECT hour, interaction_count FROM user_activity_hours WHERE user_id = ? ORDER BY hour",
+            (user_id,),
+        )
+        user["activity_hours"] = _h._rows(cur)
 
     return user
 
@@ -71,7 +80,7 @@ class UserCreate(BaseModel):
 
 
 @router.post("/users")
-async def create_user(body: UserCreate, _: dict = Depends(require_admin)):
+def create_user(body: UserCreate, _: dict = Depends(require_admin)):
     """Create a new user profile."""
     import uuid
     conn = _h._db()
@@ -103,21 +112,21 @@ class UserUpdate(BaseModel):
 
 
 @router.patch("/users/{user_id}")
-async def update_user(user_id: str, update: UserUpdate, _: dict = Depends(require_admin)):
+def update_user(user_id: str, update: UserUpdate, _: dict = Depends(require_admin)):
     conn = _h._db()
     # exclude_unset allows explicit empty strings (e.g. clearing preferred_voice)
     fields = {k: v for k, v in update.model_dump(exclude_unset=True).items()}
     if not fields:
         raise HTTPException(status_code=400, detail="No fields to update")
 
-    fields["updated_at"] = datetime.now(timezone.utc).isoformat()
-    set_clause = ", ".join(f"{k} = ?" for k in fields)
-    values = list(fields.values()) + [user_id]
-    conn.execute(f"UPDATE user_profiles SET {set_clause} WHERE user_id = ?", values)
+    cols = tuple(sorted(fields))
+    cur = conn.execute(
+        _h._update_sql("user_profiles", cols, "user_id", touch="updated_at", returning=True),
+        [fields[c] for c in cols] + [user_id],
+    )
+    user = _h._row(cur)
     conn.commit()
-
-    cur = conn.execute("SELECT * FROM user_profiles WHERE user_id = ?", (user_id,))
-    return _h._row(cur)
+    return user
 
 
 class SetAgeRequest(BaseModel):
@@ -126,7 +135,7 @@ class SetAgeRequest(BaseModel):
 
 
 @router.post("/users/{user_id}/age")
-async def set_user_age(user_id: str, req: SetAgeRequest, _: dict = Depends(require_admin)):
+def set_user_age(user_id: str, req: SetAgeRequest, _: dict = Depends(require_admin)):
     from cortex.profiles import set_user_age as _set_age
     conn = _h._db()
     result = _set_age(conn, user_id, birth_year=req.birth_year, birth_month=req.birth_month)
@@ -134,12 +143,12 @@ async def set_user_age(user_id: str, req: SetAgeRequest, _: dict = Depends(requi
 
 
 @router.delete("/users/{user_id}")
-async def delete_user(user_id: str, _: dict = Depends(require_admin)):
+def delete_user(user_id: str, _: dict = Depends(require_admin)):
     conn = _h._db()
-    conn.execute("DELETE FROM user_profiles WHERE user_id = ?", (user_id,))
-    conn.execute("DELETE FROM emotional_profiles WHERE user_id = ?", (user_id,))
-    conn.execute("DELETE FROM parental_controls WHERE child_user_id = ?", (user_id,))
-    conn.commit()
+    # trg_user_profiles_delete clears parental controls and the emotional
+    # profile first; topics, restricted actions, ... follow via ON DELETE CASCADE.
+    with conn:
+        conn.execute("DELETE FROM user_profiles WHERE user_id = ?", (user_id,))
     return {"ok": True}
 
 
@@ -156,7 +165,7 @@ class ParentalControlsRequest(BaseModel):
 
 
 @router.get("/users/{user_id}/parental")
-async def get_parental_controls(user_id: str, _: dict = Depends(require_admin)):
+def get_parental_controls(user_id: str, _: dict = Depends(require_admin)):
     conn = _h._db()
     cur = conn.execute("SELECT * FROM parental_controls WHERE child_user_id = ?", (user_id,))
     controls = _h._row(cur)
@@ -177,34 +186,35 @@ async def get_parental_controls(user_id: str, _: dict = Depends(require_admin)):
 
 
 @router.post("/users/{user_id}/parental")
-async def set_parental_controls(
+def set_parental_controls(
     user_id: str, req: ParentalControlsRequest, _: dict = Depends(require_admin)
 ):
     conn = _h._db()
-    conn.execute(
-        """INSERT INTO parental_controls (child_user_id, parent_user_id, content_filter_level,
-           allowed_hours_start, allowed_hours_end) VALUES (?, ?, ?, ?, ?)
-           ON CONFLICT(child_user_id) DO UPDATE SET
-           parent_user_id=excluded.parent_user_id,
-           content_filter_level=excluded.content_filter_level,
-           allowed_hours_start=excluded.allowed_hours_start,
-           allowed_hours_end=excluded.allowed_hours_end""",
-        (user_id, req.parent_user_id, req.content_filter_level,
-         req.allowed_hours_start, req.allowed_hours_end),
-    )
-    # Restricted actions
-    conn.execute("DELETE FROM parental_restricted_actions WHERE child_user_id = ?", (user_id,))
-    for action in req.restricted_actions:
-        conn.execute(
+    with conn:  # one transaction: upsert + replace restricted actions
+        cur = conn.execute(
+            """INSERT INTO parental_controls (child_user_id, parent_user_id, content_filter_level,
+               allowed_hours_start, allowed_hours_end) VALUES (?, ?, ?, ?, ?)
+               ON CONFLICT(child_user_id) DO UPDATE SET
+               parent_user_id=excluded.parent_user_id,
+               content_filter_level=excluded.content_filter_level,
+               allowed_hours_start=excluded.allowed_hours_start,
+               allowed_hours_end=excluded.allowed_hours_end
+               RETURNING *""",
+            (user_id, req.parent_user_id, req.content_filter_level,
+             req.allowed_hours_start, req.allowed_hours_end),
+        )
+        controls = _h._row(cur)
+        conn.execute("DELETE FROM parental_restricted_actions WHERE child_user_id = ?", (user_id,))
+        conn.executemany(
             "INSERT INTO parental_restricted_actions (child_user_id, action) VALUES (?, ?)",
-            (user_id, action),
+            [(user_id, action) for action in req.restricted_actions],
         )
-    conn.commit()
-    return {"ok": True}
+    controls["restricted_actions"] = req.restricted_actions
+    return {"ok": True, "controls": controls}
 
 
 @router.delete("/users/{user_id}/parental")
-async def remove_parental_controls(user_id: str, _: dict = Depends(require_admin)):
+def remove_parental_controls(user_id: str, _: dict = Depends(require_admin)):
     conn = _h._db()
     conn.execute("DELETE FROM parental_controls WHERE child_user_id = ?", (user_id,))
     conn.commit()
@@ -220,7 +230,7 @@ class SetUserAuthRequest(BaseModel):
 
 
 @router.get("/users/{user_id}/auth")
-async def get_user_auth_config(user_id: str, _: dict = Depends(require_admin)):
+def get_user_auth_config(user_id: str, _: dict = Depends(require_admin)):
     """Get the chat auth configuration for a user."""
     from cortex.auth_user import get_user_auth
     mgr = get_user_auth()
@@ -243,7 +253,7 @@ async def get_user_auth_config(user_id: str, _: dict = Depends(require_admin)):
 
 
 @router.post("/users/{user_id}/auth")
-async def set_user_auth(
+def set_user_auth(
     user_id: str, body: SetUserAuthRequest, _: dict = Depends(require_admin)
 ):
     """Set authentication method for a chat user."""
@@ -276,7 +286,7 @@ async def set_user_auth(
 
 
 @router.get("/users/{user_id}/trusted-devices")
-async def list_trusted_devices(user_id: str, _: dict = Depends(require_admin)):
+def list_trusted_devices(user_id: str, _: dict = Depends(require_admin)):
     """List trusted devices for a chat user."""
     from cortex.auth_user import get_user_auth
     mgr = get_user_auth()
@@ -287,7 +297,7 @@ async def list_trusted_devices(user_id: str, _: dict = Depends(require_admin)):
 
 
 @router.delete("/users/{user_id}/trusted-devices/{fingerprint}")
-async def remove_trusted_device(
+def remove_trusted_device(
     user_id: str, fingerprint: str, _: dict = Depends(require_admin)
 ):
     """Remove a trusted device for a chat user."""
@@ -7,13 +7,16 @@ immediately via the admin panel.
 
 from __future__ import annotations
 
+import functools
 import hashlib
+import hmac
 import logging
 import os
 import secrets
 import sqlite3
+import threading
 import time
-from datetime import datetime, timezone
+from collections import OrderedDict
 
 import bcrypt
 import jwt
@@ -25,6 +28,7 @@ log = logging.getLogger(__name__)
 # ── Configuration ─────────────────────────────────────────────────
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRY_SECONDS = int(os.environ.get("CORTEX_JWT_EXPIRY", "86400"))  # 24h
+_DEFAULT_ADMIN_PASSWORD = "atlas-admin"
 
 _bearer = HTTPBearer(auto_error=False)
 
@@ -113,8 +117,32 @@ def hash_password(password: str) -> str:
     return bcrypt.hashpw(_prepare_password(password), bcrypt.gensalt()).decode()
 
 
+# Recently verified (password, hash) pairs, so repeat checks skip bcrypt.
+# Keyed by an HMAC under a per-process random key — the password itself is
+# never stored — and tied to the hash, so a password change misses.
+_VERIFY_CACHE_TTL = 60.0  # seconds
+_VERIFY_CACHE_MAX = 256
+_verify_key = secrets.token_bytes(32)
+_verified: OrderedDict[bytes, float] = OrderedDict()
+_verified_lock = threading.Lock()
+
+
 def verify_password(password: str, hashed: str) -> bool:
-    return bcrypt.checkpw(_prepare_password(password), hashed.encode())
+    pw_bytes = _prepare_password(password)
+    digest = hmac.digest(_verify_key, pw_bytes + b"\0" + hashed.encode(), "sha256")
+    now = time.monotonic()
+    with _verified_lock:
+        expiry = _verified.get(digest)
+    if expiry is not None and now < expiry:
+        return True
+    if not bcrypt.checkpw(pw_bytes, hashed.encode()):
+        return False
+    with _verified_lock:
+        _verified[digest] = now + _VERIFY_CACHE_TTL
+        _verified.move_to_end(digest)
+        while len(_verified) > _VERIFY_CACHE_MAX:
+            _verified.popitem(last=False)
+    return True
 
 
 # ── JWT helpers ───────────────────────────────────────────────────
@@ -129,7 +157,35 @@ def create_token(user_id: int, username: str) -> str:
     return jwt.encode(payload, get_jwt_secret(), algorithm=JWT_ALGORITHM)
 
 
+# Decoded payloads of recently verified tokens, keyed by (secret, token) so a
+# rotated secret never matches: key → (payload, cached-until).  The admin UI
+# polls with one token all day, so most requests skip the signature check
+# and JSON parse.
+_TOKEN_CACHE_TTL = 60.0  # seconds
+_TOKEN_CACHE_MAX = 4096
+_decoded: OrderedDict[tuple[str, str], tuple[dict, float]] = OrderedDict()
+_decoded_lock = threading.Lock()
+
+
 def decode_token(token: str) -> dict:
+    key = (get_jwt_secret(), token)
+    now = time.time()
+    with _decoded_lock:
+        hit = _decoded.get(key)
+    if hit is not None:
+        payload, until = hit
+        if now < until and payload.get("exp", now + 1) > now:
+            return dict(payload)
+    payload = _decode_token(token)
+    with _decoded_lock:
+        _decoded[key] = (payload, now + _TOKEN_CACHE_TTL)
+        _decoded.move_to_end(key)
+        while len(_decoded) > _TOKEN_CACHE_MAX:
+            _decoded.popitem(last=False)
+    return dict(payload)
+
+
+def _decode_token(token: str) -> dict:
     try:
         payload = jwt.decode(token, get_jwt_secret(), algorithms=[JWT_ALGORITHM])
     except jwt.ExpiredSignatureError:
@@ -159,13 +215,19 @@ async def require_admin(
 
 # ── Database helpers ──────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
+def _default_admin_hash() -> str:
+    """bcrypt hash of the seed password, computed at most once per process."""
+    return hash_password(_DEFAULT_ADMIN_PASSWORD)
+
+
 def seed_admin(conn: sqlite3.Connection) -> None:
     """Create the default admin user if no admin exists yet."""
-    row = conn.execute("SELECT COUNT(*) FROM admin_users").fetchone()
-    if row[0] == 0:
+    row = conn.execute("SELECT EXISTS (SELECT 1 FROM admin_users)").fetchone()
+    if not row[0]:
         conn.execute(
             "INSERT INTO admin_users (username, password_hash) VALUES (?, ?)",
-            ("admin", hash_password("atlas-admin")),
+            ("admin", _default_admin_hash()),
         )
         conn.commit()
 
@@ -184,8 +246,7 @@ def authenticate(conn: sqlite3.Connection, username: str, password: str) -> dict
         return None
     # Touch last_login
     conn.execute(
-        "UPDATE admin_users SET last_login = ? WHERE id = ?",
-        (datetime.now(timezone.utc).isoformat(), row["id"]),
+        "UPDATE admin_users SET last_login = CURRENT_TIMESTAMP WHERE id = ?", (row["id"],)
     )
     conn.commit()
     return {"id": row["id"], "username": row["username"]}
@@ -94,15 +94,7 @@ class AvatarState:
                 "head_tilt": self.expression.head_tilt,
                 "blink_rate": self.expression.blink_rate,
             },
-            "viseme_queue": [
-                {
-                    "viseme": f.viseme,
-                    "start_ms": f.start_ms,
-                    "duration_ms": f.duration_ms,
-                    "intensity": f.intensity,
-                }
-                for f in self.viseme_queue
-            ],
+            "viseme_queue": [f.to_dict() for f in self.viseme_queue],
             "is_speaking": self.is_speaking,
             "is_listening": self.is_listening,
         }
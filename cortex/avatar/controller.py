@@ -58,15 +58,7 @@ def send_visemes(room: str | None, text: str) -> None:
         from cortex.avatar.broadcast import broadcast_viseme_sequence, get_connected_rooms
 
         frames = text_to_visemes(text)
-        frame_dicts: list[dict[str, Any]] = [
-            {
-                "viseme": f.viseme,
-                "start_ms": f.start_ms,
-                "duration_ms": f.duration_ms,
-                "intensity": f.intensity,
-            }
-            for f in frames
-        ]
+        frame_dicts: list[dict[str, Any]] = [f.to_dict() for f in frames]
         rooms = get_connected_rooms()
         logger.info("avatar: %d visemes → room=%s (connected: %s)", len(frame_dicts), room, rooms)
         asyncio.ensure_future(broadcast_viseme_sequence(room, frame_dicts))
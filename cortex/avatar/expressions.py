@@ -4,6 +4,7 @@ OWNERSHIP: This module owns all expression definitions and resolution logic.
 """
 from __future__ import annotations
 
+import functools
 import logging
 import re
 from dataclasses import dataclass
@@ -11,9 +12,9 @@ from dataclasses import dataclass
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AvatarExpression:
-    """Facial expression parameters for avatar rendering."""
+    """Facial expression parameters for avatar rendering (immutable, shared)."""
     name: str
     eyebrow_raise: float   # -1.0 (frown) to 1.0 (raise)
     eye_squint: float       # 0.0–1.0
@@ -80,18 +81,24 @@ def resolve_from_sentiment(sentiment: str, confidence: float = 1.0) -> AvatarExp
     When confidence < 1.0, blends toward neutral proportionally.
     """
     expr_name = _SENTIMENT_EXPRESSION.get(sentiment, "neutral")
-    base = EXPRESSIONS[expr_name]
     if confidence < 1.0:
-        neutral = EXPRESSIONS["neutral"]
-        return AvatarExpression(
-            name=base.name,
-            eyebrow_raise=neutral.eyebrow_raise + (base.eyebrow_raise - neutral.eyebrow_raise) * confidence,
-            eye_squint=neutral.eye_squint + (base.eye_squint - neutral.eye_squint) * confidence,
-            mouth_smile=neutral.mouth_smile + (base.mouth_smile - neutral.mouth_smile) * confidence,
-            head_tilt=neutral.head_tilt + (base.head_tilt - neutral.head_tilt) * confidence,
-            blink_rate=neutral.blink_rate + (base.blink_rate - neutral.blink_rate) * confidence,
-        )
-    return base
+        # Quantised so per-utterance updates hit the cache
+        return _blend_toward_neutral(expr_name, round(confidence, 2))
+    return EXPRESSIONS[expr_name]
+
+
+@functools.lru_cache(maxsize=256)
+def _blend_toward_neutral(expr_name: str, confidence: float) -> AvatarExpression:
+    base = EXPRESSIONS[expr_name]
+    neutral = EXPRESSIONS["neutral"]
+    return AvatarExpression(
+        name=base.name,
+        eyebrow_raise=neutral.eyebrow_raise + (base.eyebrow_raise - neutral.eyebrow_raise) * confidence,
+        eye_squint=neutral.eye_squint + (base.eye_squint - neutral.eye_squint) * confidence,
+        mouth_smile=neutral.mouth_smile + (base.mouth_smile - neutral.mouth_smile) * confidence,
+        head_tilt=neutral.head_tilt + (base.head_tilt - neutral.head_tilt) * confidence,
+        blink_rate=neutral.blink_rate + (base.blink_rate - neutral.blink_rate) * confidence,
+    )
 
 
 def resolve_from_content(text: str) -> AvatarExpression | None:
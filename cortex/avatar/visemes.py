@@ -4,20 +4,30 @@ OWNERSHIP: This module owns phoneme mapping and viseme frame generation.
 """
 from __future__ import annotations
 
+import functools
 import logging
+import re
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VisemeFrame:
-    """A single viseme keyframe for lip-sync animation."""
+    """A single viseme keyframe for lip-sync animation (immutable, shared)."""
     viseme: str        # "PP", "AA", "IDLE", etc.
     start_ms: int      # start time in milliseconds
     duration_ms: int   # how long to hold this viseme
     intensity: float   # 0.0–1.0 mouth openness
 
+    def to_dict(self) -> dict[str, str | int | float]:
+        return {
+            "viseme": self.viseme,
+            "start_ms": self.start_ms,
+            "duration_ms": self.duration_ms,
+            "intensity": self.intensity,
+        }
+
 
 VISEME_MAP: dict[str, str] = {
     "sil": "IDLE",
@@ -44,6 +54,13 @@ VISEME_CATEGORIES: set[str] = {
 
 _VOWEL_VISEMES: set[str] = {"AA", "EH", "IH", "OH", "OU"}
 
+# phoneme → (viseme, mouth intensity): vowels open wider, silence is closed
+_IDLE_FRAME: tuple[str, float] = ("IDLE", 0.0)
+_PHONEME_VISEME: dict[str, tuple[str, float]] = {
+    ph: _IDLE_FRAME if v == "IDLE" else (v, 0.7 if v in _VOWEL_VISEMES else 0.4)
+    for ph, v in VISEME_MAP.items()
+}
+
 _DIGRAPH_MAP: list[tuple[str, str]] = [
     ("th", "T"), ("sh", "S"), ("ch", "S"), ("ph", "f"),
     ("wh", "w"), ("ck", "k"), ("ng", "n"), ("qu", "k"),
@@ -59,31 +76,28 @@ _CHAR_PHONEME: dict[str, str] = {
 }
 
 
-def _text_to_phonemes(text: str) -> list[str]:
-    """Convert text to a rough phoneme sequence using character heuristics."""
-    text = text.lower().strip()
+# Digraphs first, then any single character; the regex engine does the
+# scanning instead of a per-character Python loop
+_PHONEME_TOKEN_RE = re.compile("|".join(d for d, _ in _DIGRAPH_MAP) + "|.", re.S)
+_TOKEN_PHONEME: dict[str, str] = {**_CHAR_PHONEME, **dict(_DIGRAPH_MAP)}
+
+
+@functools.lru_cache(maxsize=1024)
+def _text_to_phonemes(text: str) -> tuple[str, ...]:
+    """Convert text to a rough phoneme sequence using character heuristics.
+
+    Memoised: TTS sentences and fillers repeat, and the result is immutable.
+    """
     phonemes: list[str] = []
-    i = 0
-    while i < len(text):
-        ch = text[i]
-        if not ch.isalpha():
-            if not phonemes or phonemes[-1] != "sil":
-                phonemes.append("sil")
-            i += 1
-            continue
-        matched = False
-        if i + 1 < len(text):
-            pair = text[i : i + 2]
-            for digraph, phoneme in _DIGRAPH_MAP:
-                if pair == digraph:
-                    phonemes.append(phoneme)
-                    i += 2
-                    matched = True
-                    break
-        if not matched:
-            phonemes.append(_CHAR_PHONEME.get(ch, "sil"))
-            i += 1
-    return phonemes
+    for token in _PHONEME_TOKEN_RE.findall(text.lower().strip()):
+        phoneme = _TOKEN_PHONEME.get(token)
+        if phoneme is not None:
+            phonemes.append(phoneme)
+        elif token.isalpha():
+            phonemes.append("sil")  # letter without a mapping (non-ASCII)
+        elif not phonemes or phonemes[-1] != "sil":
+            phonemes.append("sil")
+    return tuple(phonemes)
 
 
 def text_to_visemes(text: str, wpm: int = 150) -> list[VisemeFrame]:
@@ -92,9 +106,22 @@ def text_to_visemes(text: str, wpm: int = 150) -> list[VisemeFrame]:
     Uses simple character-to-phoneme heuristics.
     *wpm* controls speaking speed.
     """
+    frames = list(_viseme_frames(text, wpm))
+    if frames:
+        last = frames[-1]
+        logger.debug(
+            "text_to_visemes: %d frames, %d ms total",
+            len(frames), last.start_ms + last.duration_ms,
+        )
+    return frames
+
+
+@functools.lru_cache(maxsize=512)
+def _viseme_frames(text: str, wpm: int) -> tuple[VisemeFrame, ...]:
+    """One :class:`VisemeFrame` per phoneme of *text*, shared between callers."""
     phonemes = _text_to_phonemes(text)
     if not phonemes:
-        return []
+        return ()
 
     phonemes_per_sec = (wpm * 5) / 60
     ms_per_phoneme = int(1000 / phonemes_per_sec) if phonemes_per_sec > 0 else 80
@@ -102,17 +129,7 @@ def text_to_visemes(text: str, wpm: int = 150) -> list[VisemeFrame]:
     frames: list[VisemeFrame] = []
     cursor_ms = 0
     for ph in phonemes:
-        viseme = VISEME_MAP.get(ph, "IDLE")
-        intensity = 0.7 if viseme in _VOWEL_VISEMES else 0.4
-        if viseme == "IDLE":
-            intensity = 0.0
-        frames.append(VisemeFrame(
-            viseme=viseme,
-            start_ms=cursor_ms,
-            duration_ms=ms_per_phoneme,
-            intensity=round(intensity, 2),
-        ))
+        viseme, intensity = _PHONEME_VISEME.get(ph, _IDLE_FRAME)
+        frames.append(VisemeFrame(viseme, cursor_ms, ms_per_phoneme, intensity))
         cursor_ms += ms_per_phoneme
-
-    logger.debug("text_to_visemes: %d frames, %d ms total", len(frames), cursor_ms)
-    return frames
+    return tuple(frames)
@@ -5,7 +5,7 @@ Usage::
     python -m cortex.backup create
     python -m cortex.backup list
     python -m cortex.backup restore --latest daily
-    python -m cortex.backup restore path/to/backup.tar.gz
+    python -m cortex.backup restore path/to/backup.tar.zst
 
 See docs/backup-restore.md for full design.
 """
@@ -15,17 +15,39 @@ See docs/backup-restore.md for full design.
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import contextlib
+import functools
+import io
+import json
 import logging
 import os
 import shutil
 import sqlite3
+import subprocess
 import tarfile
 import time
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+_HAS_ZSTD = False
+try:
+    import zstandard as zstd
+    _HAS_ZSTD = True
+except ImportError:
+    pass
+
+# New archives are zstd-compressed when ``zstandard`` is installed; both
+# formats are always restorable.
+_ARCHIVE_SUFFIXES = (".tar.zst", ".tar.gz")
+_ARCHIVE_SUFFIX = ".tar.zst" if _HAS_ZSTD else ".tar.gz"
+
+# Copy/stream buffer for archive writes (tarfile defaults to 16 KB / 10 KB)
+_COPY_BUFSIZE = 1 << 20
+
 
 def _data_dir() -> Path:
     return Path(os.environ.get("CORTEX_DATA_DIR", "./data"))
@@ -40,20 +62,58 @@ def _backup_dir() -> Path:
 def create_backup(backup_type: str = "manual") -> Path:
     """Create a compressed backup snapshot.
 
+    Daily backups are deltas when a full backup's manifest is available: they
+    carry the database and config but only the ChromaDB files whose size or
+    mtime changed since that full backup, plus a ``BASE`` header naming it.
+
     Returns the path to the created archive.
     """
     data = _data_dir()
     ts = datetime.now(tz=timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-    archive_name = f"cortex_{backup_type}_{ts}.tar.gz"
-    archive_path = _backup_dir() / archive_name
 
     start = time.monotonic()
     db_path = data / "cortex.db"
     chroma_path = data / "cortex_chroma"
 
-    with tarfile.open(archive_path, "w:gz") as tar:
-        # SQLite online backup to a temp file
-        if db_path.exists():
+    files = _scan_chroma(chroma_path)
+    base = _load_manifest() if backup_type == "daily" else None
+    if base is not None:
+        archive_name = f"cortex_daily_delta_{ts}{_ARCHIVE_SUFFIX}"
+    else:
+        archive_name = f"cortex_{backup_type}_{ts}{_ARCHIVE_SUFFIX}"
+    archive_path = _backup_dir() / archive_name
+
+    with (
+        concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool,
+        _open_archive(archive_path) as tar,
+    ):
+        if base is not None:
+            previous = base["files"]
+            header = [f"BASE={base['base']}"]
+            header += [f"DELETED={name}" for name in sorted(previous.keys() - files.keys())]
+            _add_bytes(tar, "BASE", ("\n".join(header) + "\n").encode())
+
+        # SQLite online backup into memory, overlapped with the ChromaDB reads
+        db_snapshot = None
+        if db_path.exists() and hasattr(sqlite3.Connection, "serialize"):
+            db_snapshot = pool.submit(_snapshot_db, db_path)
+
+        # ChromaDB directory (only changed files in a delta)
+        if base is not None:
+            for name, stat in files.items():
+                if previous.get(name) != stat:
+                    tar.add(data / name, arcname=name, recursive=False)
+        elif chroma_path.exists():
+            tar.add(chroma_path, arcname="cortex_chroma")
+
+        # Config
+        env_path = data.parent / "cortex.env"
+        if env_path.exists():
+            tar.add(env_path, arcname="cortex.env")
+
+        if db_snapshot is not None:
+            _add_bytes(tar, "cortex.db", db_snapshot.result())
+        elif db_path.exists():
             tmp_db = data / f"cortex_backup_{ts}.db"
             try:
                 src = sqlite3.connect(str(db_path))
@@ -66,14 +126,9 @@ def create_backup(backup_type: str = "manual") -> Path:
                 if tmp_db.exists():
                     tmp_db.unlink()
 
-        # ChromaDB directory
-        if chroma_path.exists():
-            tar.add(chroma_path, arcname="cortex_chroma")
-
-        # Config
-        env_path = data.parent / "cortex.env"
-        if env_path.exists():
-            tar.add(env_path, arcname="cortex.env")
+    if base is None:
+        _save_manifest(archive_name, files)
+    _find_latest_cached.cache_clear()
 
     duration_ms = int((time.monotonic() - start) * 1000)
     size_bytes = archive_path.stat().st_size
@@ -94,7 +149,7 @@ def restore_backup(path: Path | None = None, backup_type: str | None = None) ->
     """Restore from a backup archive.
 
     Args:
-        path:        Explicit path to a .tar.gz archive.
+        path:        Explicit path to a .tar.zst or .tar.gz archive.
         backup_type: If ``path`` is None, restore the latest of this type
                      (``"daily"``, ``"weekly"``, ``"monthly"``, ``"manual"``).
     """
@@ -110,17 +165,7 @@ def restore_backup(path: Path | None = None, backup_type: str | None = None) ->
     data = _data_dir()
     logger.info("Restoring from %s ...", path.name)
 
-    with tarfile.open(path, "r:gz") as tar:
-        # Use data filter (Python 3.12+) to prevent path traversal attacks
-        try:
-            tar.extractall(data, filter="data")  # type: ignore[call-arg]
-        except TypeError:
-            # Fallback for Python < 3.12: validate member paths manually
-            for member in tar.getmembers():
-                member_path = (data / member.name).resolve()
-                if not str(member_path).startswith(str(data.resolve())):
-                    raise ValueError(f"Unsafe path in archive: {member.name}")
-            tar.extractall(data)  # noqa: S202
+    _extract(path, data)
 
     logger.info("Restore complete.")
 
@@ -147,13 +192,187 @@ def list_backups() -> list[dict]:
 # Helpers
 # ──────────────────────────────────────────────────────────────────
 
+def _snapshot_db(db_path: Path) -> bytes:
+    """Online-backup *db_path* into memory and return the serialised image."""
+    src = sqlite3.connect(str(db_path))
+    mem = sqlite3.connect(":memory:")
+    try:
+        src.backup(mem)
+        return mem.serialize()
+    finally:
+        mem.close()
+        src.close()
+
+
+def _add_bytes(tar: tarfile.TarFile, name: str, payload: bytes) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(payload)
+    info.mtime = int(time.time())
+    info.mode = 0o644
+    tar.addfile(info, io.BytesIO(payload))
+
+
+@contextlib.contextmanager
+def _open_archive(archive_path: Path) -> Iterator[tarfile.TarFile]:
+    """Open *archive_path* for writing as a compressed tar.
+
+    ``.tar.zst`` archives are compressed by multi-threaded zstd at level 3.
+    For ``.tar.gz``, when ``pigz`` is installed the uncompressed tar stream is
+    piped through it so compression runs on every core; otherwise tarfile's
+    own zlib is used at level 1.
+    """
+    if archive_path.name.endswith(".tar.zst"):
+        with open(archive_path, "wb") as out:
+            with zstd.ZstdCompressor(level=3, threads=-1).stream_writer(out) as comp:
+                with tarfile.open(
+                    fileobj=comp, mode="w|", bufsize=_COPY_BUFSIZE, copybufsize=_COPY_BUFSIZE,
+                ) as tar:
+                    yield tar
+        return
+
+    pigz = shutil.which("pigz")
+    if pigz is None:
+        with tarfile.open(
+            archive_path, "w:gz", compresslevel=1, copybufsize=_COPY_BUFSIZE,
+        ) as tar:
+            yield tar
+        return
+
+    with open(archive_path, "wb") as out:
+        proc = subprocess.Popen(
+            [pigz, "-p", str(os.cpu_count() or 1), "-c"],
+            stdin=subprocess.PIPE,
+            stdout=out,
+        )
+        try:
+            with tarfile.open(
+                fileobj=proc.stdin, mode="w|", bufsize=_COPY_BUFSIZE, copybufsize=_COPY_BUFSIZE,
+            ) as tar:
+                yield tar
+        finally:
+            proc.stdin.close()
+            returncode = proc.wait()
+    if returncode != 0:
+        raise OSError(f"pigz exited with status {returncode} writing {archive_path.name}")
+
+
+@contextlib.contextmanager
+def _read_archive(path: Path) -> Iterator[tarfile.TarFile]:
+    """Open a ``.tar.zst`` or ``.tar.gz`` archive for one sequential pass."""
+    if not path.name.endswith(".tar.zst"):
+        with tarfile.open(path, "r|gz") as tar:
+            yield tar
+        return
+    if not _HAS_ZSTD:
+        raise RuntimeError(f"{path.name} is zstd-compressed; install 'zstandard' to restore it")
+    with open(path, "rb") as fh, zstd.ZstdDecompressor().stream_reader(fh) as reader:
+        with tarfile.open(fileobj=reader, mode="r|") as tar:
+            yield tar
+
+
+def _extract(path: Path, data: Path) -> None:
+    """Extract *path* into *data*, applying a delta's base archive first."""
+    with _read_archive(path) as tar:
+        header = _read_header(tar)
+        if header is not None:
+            base_path = path.with_name(header["BASE"][0])
+            if not base_path.exists():
+                raise FileNotFoundError(
+                    f"Base archive {base_path.name} for delta {path.name} is missing"
+                )
+            _extract(base_path, data)
+
+        # Archives are read as a stream, so members are extracted as they are
+        # reached rather than collected up front.
+        members = (m for m in tar if m.name != "BASE")
+        # Use data filter (Python 3.12+) to prevent path traversal attacks
+        try:
+            tar.extractall(data, members=members, filter="data")  # type: ignore[call-arg]
+        except TypeError:
+            # Fallback for Python < 3.12: validate member paths manually
+            checked = (m for m in members if _safe_path(data, m.name))
+            tar.extractall(data, members=checked)  # noqa: S202
+
+    if header is not None:
+        for name in header.get("DELETED", []):
+            _safe_path(data, name).unlink(missing_ok=True)
+
+
+def _read_header(tar: tarfile.TarFile) -> dict[str, list[str]] | None:
+    """Return a delta archive's ``BASE`` header (always its first member)."""
+    first = tar.next()
+    if first is None or first.name != "BASE":
+        return None
+    header: dict[str, list[str]] = {}
+    for line in tar.extractfile(first).read().decode().splitlines():
+        key, _, value = line.partition("=")
+        header.setdefault(key, []).append(value)
+    return header
+
+
+def _safe_path(data: Path, name: str) -> Path:
+    member_path = (data / name).resolve()
+    if not str(member_path).startswith(str(data.resolve())):
+        raise ValueError(f"Unsafe path in archive: {name}")
+    return member_path
+
+
+def _scan_chroma(chroma_path: Path) -> dict[str, list[int]]:
+    """Map each ChromaDB file's archive name to its ``[size, mtime_ns]``."""
+    files: dict[str, list[int]] = {}
+    root = chroma_path.parent
+    for dirpath, _dirnames, filenames in os.walk(chroma_path):
+        for filename in filenames:
+            st = os.stat(os.path.join(dirpath, filename))
+            name = Path(dirpath, filename).relative_to(root).as_posix()
+            files[name] = [st.st_size, st.st_mtime_ns]
+    return files
+
+
+def _manifest_path() -> Path:
+    return _backup_dir() / "manifest.json"
+
+
+def _load_manifest() -> dict | None:
+    """Return the last full backup's manifest, or None if it cannot be used."""
+    try:
+        manifest = json.loads(_manifest_path().read_text())
+    except (OSError, ValueError):
+        return None
+    if not (_backup_dir() / manifest.get("base", "")).is_file():
+        return None
+    return manifest
+
+
+def _save_manifest(archive_name: str, files: dict[str, list[int]]) -> None:
+    _manifest_path().write_text(json.dumps({"base": archive_name, "files": files}))
+
+
 def _find_latest(backup_type: str) -> Path | None:
-    backups = sorted(
-        _backup_dir().glob(f"cortex_{backup_type}_*.tar.gz"),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )
-    return backups[0] if backups else None
+    # Adding or removing an archive bumps the directory mtime, so an unchanged
+    # mtime means the previous scan is still valid.
+    backup_dir = _backup_dir()
+    key = (str(backup_dir), backup_type, backup_dir.stat().st_mtime_ns)
+    latest = _find_latest_cached(*key)
+    if latest is not None and not latest.exists():
+        # Removed within the filesystem's mtime granularity
+        _find_latest_cached.cache_clear()
+        latest = _find_latest_cached(*key)
+    return latest
+
+
+@functools.lru_cache(maxsize=32)
+def _find_latest_cached(backup_dir: str, backup_type: str, dir_mtime_ns: int) -> Path | None:
+    # One directory pass; DirEntry caches its stat, so no per-archive Path.stat()
+    prefix = f"cortex_{backup_type}_"
+    with os.scandir(backup_dir) as it:
+        entries = [
+            (e.stat().st_mtime, e.name) for e in it
+            if e.name.startswith(prefix) and e.name.endswith(_ARCHIVE_SUFFIXES)
+        ]
+    if not entries:
+        return None
+    return Path(backup_dir) / max(entries)[1]
 
 
 def _log_backup(archive_path: Path, backup_type: str, size_bytes: int, duration_ms: int) -> None:
@@ -161,16 +380,20 @@ def _log_backup(archive_path: Path, backup_type: str, size_bytes: int, duration_
     if not db_path.exists():
         return
     try:
-        conn = sqlite3.connect(str(db_path))
-        conn.execute(
-            """
-            INSERT INTO backup_log (archive_path, backup_type, size_bytes, duration_ms, success)
-            VALUES (?, ?, ?, ?, TRUE)
-            """,
-            (str(archive_path), backup_type, size_bytes, duration_ms),
-        )
-        conn.commit()
-        conn.close()
+        # Short-lived on purpose: restore rewrites cortex.db in place, so no
+        # connection may outlive a call.  WAL + synchronous=NORMAL (as the
+        # server uses) keeps the commit from forcing a full fsync.
+        with contextlib.closing(sqlite3.connect(str(db_path))) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                conn.execute(
+                    """
+                    INSERT INTO backup_log (archive_path, backup_type, size_bytes, duration_ms, success)
+                    VALUES (?, ?, ?, ?, TRUE)
+                    """,
+                    (str(archive_path), backup_type, size_bytes, duration_ms),
+                )
     except Exception as exc:
         logger.debug("Could not log backup: %s", exc)
 
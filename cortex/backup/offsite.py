@@ -3,14 +3,35 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import logging
 import re
 import time
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Remote transfers/deletes in flight at once (network-bound, so overlap RTTs)
+_MAX_CONCURRENCY = 4
+
+_ARCHIVE_SUFFIXES = (".tar.zst", ".tar.gz")
+
+# Remote listings are reused this long (seconds); each one is an ssh/smb round trip
+_LIST_CACHE_TTL = 30.0
+
+_RSYNC_STATS_RE = re.compile(
+    r"Number of regular files transferred:\s*(\d+)|Total transferred file size:\s*([\d,]+)"
+)
+
+
+def _archive_ts(name: str) -> str:
+    """Return the timestamp suffix of an archive *name* (sorts chronologically)."""
+    for suffix in _ARCHIVE_SUFFIXES:
+        name = name.removesuffix(suffix)
+    return name.rpartition("_")[2]
+
 
 class OffsiteBackupError(Exception):
     """Base error for offsite backup operations."""
@@ -36,6 +57,7 @@ class OffsiteBackup:
         self.smb_share = smb_share
         self.smb_user = smb_user
         self.smb_password = smb_password
+        self._list_cache: tuple[float, list[dict]] | None = None
 
     # ------------------------------------------------------------------ #
     # Public API
@@ -57,15 +79,17 @@ class OffsiteBackup:
         else:
             result = await self._smb_sync(local_path)
 
+        self.clear_remote_cache()
         result["duration_ms"] = int((time.monotonic() - start) * 1000)
         return result
 
     async def list_remote_backups(self) -> list[dict]:
-        """List backups on the remote server."""
-        if self.method == "rsync":
-            return await self._rsync_list()
-        else:
-            return await self._smb_list()
+        """List backups on the remote server (cached for ``_LIST_CACHE_TTL``)."""
+        return list(await self._cached_list())
+
+    def clear_remote_cache(self) -> None:
+        """Forget the cached remote listing so the next call refetches it."""
+        self._list_cache = None
 
     async def apply_retention(
         self, daily: int = 7, weekly: int = 4, monthly: int = 12
@@ -73,7 +97,8 @@ class OffsiteBackup:
         """Apply retention policy on remote — delete old backups.
 
         Keeps the most recent *daily* daily backups, *weekly* weekly backups,
-        and *monthly* monthly backups.
+        and *monthly* monthly backups.  Full archives that kept daily deltas
+        depend on are never deleted.
 
         Returns: ``{kept, deleted}``
         """
@@ -97,10 +122,11 @@ class OffsiteBackup:
             else:
                 by_type["other"].append(b)
 
-        # Sort each category by name (which includes timestamp) descending
+        # Sort each category by timestamp descending; the prefix differs within
+        # a category (cortex_daily_ vs cortex_daily_delta_), so not by name
         limits = {"daily": daily, "weekly": weekly, "monthly": monthly, "other": daily}
         for btype, items in by_type.items():
-            items.sort(key=lambda x: x.get("name", ""), reverse=True)
+            items.sort(key=lambda x: _archive_ts(x.get("name", "")), reverse=True)
             limit = limits.get(btype, daily)
             for i, item in enumerate(items):
                 if i < limit:
@@ -108,17 +134,33 @@ class OffsiteBackup:
                 else:
                     to_delete.append(item["name"])
 
+        # Deltas only restore on top of their base: keep the newest full
+        # archive and the full archive each kept delta was taken against
+        deltas = [name for name in to_keep if "_delta_" in name]
+        if deltas:
+            fulls = sorted(
+                (b["name"] for b in backups if "_delta_" not in b["name"]), key=_archive_ts
+            )
+            full_ts = [_archive_ts(name) for name in fulls]
+            protected = set(fulls[-1:])
+            for name in deltas:
+                i = bisect.bisect_right(full_ts, _archive_ts(name))
+                if i:
+                    protected.add(fulls[i - 1])
+            to_keep |= protected
+            to_delete = [name for name in to_delete if name not in protected]
+
         # Delete excess backups
+        delete = self._rsync_delete if self.method == "rsync" else self._smb_delete
+        results = await self._bounded_gather(delete, to_delete)
+        if to_delete:
+            self.clear_remote_cache()
         deleted = 0
-        for name in to_delete:
-            try:
-                if self.method == "rsync":
-                    await self._rsync_delete(name)
-                else:
-                    await self._smb_delete(name)
+        for name, result in zip(to_delete, results):
+            if isinstance(result, OffsiteBackupError):
+                logger.warning("Failed to delete remote backup %s: %s", name, result)
+            else:
                 deleted += 1
-            except OffsiteBackupError as exc:
-                logger.warning("Failed to delete remote backup %s: %s", name, exc)
 
         return {"kept": len(to_keep), "deleted": deleted}
 
@@ -132,13 +174,25 @@ class OffsiteBackup:
         except Exception:
             return False
 
+    async def _cached_list(self, ttl: float = _LIST_CACHE_TTL) -> list[dict]:
+        now = time.monotonic()
+        if self._list_cache is not None and now - self._list_cache[0] < ttl:
+            return self._list_cache[1]
+        if self.method == "rsync":
+            backups = await self._rsync_list()
+        else:
+            backups = await self._smb_list()
+        self._list_cache = (now, backups)
+        return backups
+
     # ------------------------------------------------------------------ #
     # Rsync helpers
     # ------------------------------------------------------------------ #
 
     async def _rsync_sync(self, local_path: Path) -> dict:
         """Run rsync to sync local backups to remote."""
-        cmd = ["rsync", "-avz", "--stats"]
+        # Summary stats only — no per-file lines to pipe, decode and scan
+        cmd = ["rsync", "-az", "--info=stats2,progress0"]
         if self.ssh_key:
             cmd.extend(["-e", f"ssh -i {self.ssh_key} -o StrictHostKeyChecking=no"])
         cmd.extend([f"{local_path}/", self.remote_path])
@@ -147,19 +201,17 @@ class OffsiteBackup:
 
         files_synced = 0
         bytes_transferred = 0
-        for line in stdout.splitlines():
-            m = re.search(r"Number of regular files transferred:\s*(\d+)", line)
-            if m:
+        for m in _RSYNC_STATS_RE.finditer(stdout):
+            if m.group(1):
                 files_synced = int(m.group(1))
-            m = re.search(r"Total transferred file size:\s*([\d,]+)", line)
-            if m:
-                bytes_transferred = int(m.group(1).replace(",", ""))
+            else:
+                bytes_transferred = int(m.group(2).replace(",", ""))
 
         return {"files_synced": files_synced, "bytes_transferred": bytes_transferred}
 
     async def _rsync_list(self) -> list[dict]:
         """List files on the rsync remote."""
-        cmd = ["rsync", "--list-only"]
+        cmd = ["rsync", "--list-only", "--no-motd"]
         if self.ssh_key:
             cmd.extend(["-e", f"ssh -i {self.ssh_key} -o StrictHostKeyChecking=no"])
         cmd.append(self.remote_path)
@@ -170,7 +222,7 @@ class OffsiteBackup:
         for line in stdout.splitlines():
             # rsync --list-only format: permissions size date time name
             parts = line.split(None, 4)
-            if len(parts) >= 5 and parts[4].endswith(".tar.gz"):
+            if len(parts) >= 5 and parts[4].endswith(_ARCHIVE_SUFFIXES):
                 results.append({
                     "name": parts[4].strip(),
                     "size": int(parts[1].replace(",", "")) if parts[1].replace(",", "").isdigit() else 0,
@@ -194,7 +246,7 @@ class OffsiteBackup:
     async def _rsync_health(self) -> bool:
         """Check connectivity via rsync --list-only."""
         try:
-            await self._rsync_list()
+            await self._cached_list()
             return True
         except OffsiteBackupError:
             return False
@@ -208,18 +260,19 @@ class OffsiteBackup:
         if not self.smb_share:
             raise OffsiteBackupError("smb_share is required for SMB method")
 
-        files = list(local_path.glob("*.tar.gz"))
+        async def _upload(f: Path) -> int:
+            await self._run_subprocess(self._smb_cmd(f'put "{f}" "{self.remote_path}/{f.name}"'))
+            return f.stat().st_size
+
+        files = [f for suffix in _ARCHIVE_SUFFIXES for f in local_path.glob(f"*{suffix}")]
         files_synced = 0
         bytes_transferred = 0
-
-        for f in files:
-            cmd = self._smb_cmd(f'put "{f}" "{self.remote_path}/{f.name}"')
-            try:
-                await self._run_subprocess(cmd)
+        for f, result in zip(files, await self._bounded_gather(_upload, files)):
+            if isinstance(result, OffsiteBackupError):
+                logger.warning("SMB upload failed for %s: %s", f.name, result)
+            else:
                 files_synced += 1
-                bytes_transferred += f.stat().st_size
-            except OffsiteBackupError as exc:
-                logger.warning("SMB upload failed for %s: %s", f.name, exc)
+                bytes_transferred += result
 
         return {"files_synced": files_synced, "bytes_transferred": bytes_transferred}
 
@@ -234,7 +287,7 @@ class OffsiteBackup:
         results: list[dict] = []
         for line in stdout.splitlines():
             line = line.strip()
-            if line.endswith(".tar.gz") or ".tar.gz" in line:
+            if any(suffix in line for suffix in _ARCHIVE_SUFFIXES):
                 parts = line.split()
                 if parts:
                     name = parts[0]
@@ -254,7 +307,7 @@ class OffsiteBackup:
     async def _smb_health(self) -> bool:
         """Check SMB connectivity."""
         try:
-            await self._smb_list()
+            await self._cached_list()
             return True
         except OffsiteBackupError:
             return False
@@ -270,9 +323,29 @@ class OffsiteBackup:
         return cmd
 
     # ------------------------------------------------------------------ #
-    # Subprocess helper
+    # Subprocess helpers
     # ------------------------------------------------------------------ #
 
+    @staticmethod
+    async def _bounded_gather(
+        func: Callable[[Any], Awaitable[Any]], items: list[Any], limit: int = _MAX_CONCURRENCY,
+    ) -> list[Any]:
+        """Run ``func(item)`` for every item, at most *limit* at a time.
+
+        Results keep the order of *items*; an :class:`OffsiteBackupError` is
+        returned in place of its result, any other exception propagates.
+        """
+        sem = asyncio.Semaphore(limit)
+
+        async def _one(item: Any) -> Any:
+            async with sem:
+                try:
+                    return await func(item)
+                except OffsiteBackupError as exc:
+                    return exc
+
+        return list(await asyncio.gather(*(_one(item) for item in items)))
+
     @staticmethod
     async def _run_subprocess(cmd: list[str]) -> tuple[str, str]:
         """Run a command and return (stdout, stderr). Raises on non-zero exit."""
@@ -7,9 +7,9 @@ wired into the Layer 2 plugin dispatch.
 from __future__ import annotations
 
 import logging
+import os.path
 import re
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -36,6 +36,10 @@ def match_backup_intent(message: str) -> str | None:
     Returns:
         ``"create"``, ``"last"``, ``"list"``, or ``None``.
     """
+    # Every intent needs "backup"/"back up", so most messages stop here
+    # without running any pattern.
+    if "back" not in message.lower():
+        return None
     if _BACKUP_NOW.search(message):
         return "create"
     if _LAST_BACKUP.search(message):
@@ -88,18 +92,22 @@ async def _handle_create(conn: Any, offsite: Any) -> str:
         return f"Backup failed: {exc}"
 
 
+# Shared by the "last" and "list" intents, so both reuse one prepared statement
+_RECENT_SQL = (
+    "SELECT archive_path, created_at, size_bytes, success FROM backup_log "
+    "ORDER BY created_at DESC LIMIT 5"
+)
+
+
 def _handle_last(conn: Any) -> str:
     """Report when the last backup was made."""
     if conn is None:
         return "I can't check — no database connection."
     try:
-        row = conn.execute(
-            "SELECT archive_path, created_at, success FROM backup_log "
-            "ORDER BY created_at DESC LIMIT 1"
-        ).fetchone()
+        row = conn.execute(_RECENT_SQL).fetchone()
         if row is None:
             return "No backups have been made yet."
-        name = Path(row["archive_path"]).name
+        name = os.path.basename(row["archive_path"] or "")
         status = "successful" if row["success"] else "failed"
         return f"The last backup was {name} on {row['created_at']} ({status})."
     except Exception as exc:
@@ -112,15 +120,12 @@ def _handle_list(conn: Any) -> str:
     if conn is None:
         return "I can't check — no database connection."
     try:
-        rows = conn.execute(
-            "SELECT archive_path, created_at, size_bytes, success FROM backup_log "
-            "ORDER BY created_at DESC LIMIT 5"
-        ).fetchall()
+        rows = conn.execute(_RECENT_SQL).fetchall()
         if not rows:
             return "No backups found."
         lines = [f"Last {len(rows)} backups:"]
         for r in rows:
-            name = Path(r["archive_path"]).name
+            name = os.path.basename(r["archive_path"] or "")
             size_mb = (r["size_bytes"] or 0) / (1024 * 1024)
             status = "✓" if r["success"] else "✗"
             lines.append(f"  {status} {name} ({size_mb:.1f} MB)")
@@ -45,9 +45,16 @@ class TokenBudget:
         return max(0, self.total - used)
 
 
+_CHARS_PER_TOKEN = 4
+
+# compact_context switches to NumPy bookkeeping from this many turns; below
+# it the array setup costs more than the Python loop saves
+_VECTORISE_MIN_TURNS = 64
+
+
 def estimate_tokens(text: str) -> int:
     """Rough token estimate: ~4 chars per token (good enough for budgeting)."""
-    return max(1, len(text) // 4)
+    return max(1, len(text) // _CHARS_PER_TOKEN)
 
 
 def compute_budget(
@@ -83,16 +90,18 @@ def trim_history(
     if not history:
         return history
 
-    total = sum(estimate_tokens(m["content"]) for m in history)
+    tokens = [estimate_tokens(m["content"]) for m in history]
+    total = sum(tokens)
     if total <= max_tokens:
         return history
 
-    # Drop oldest turns until we fit
-    trimmed = list(history)
-    while trimmed and sum(estimate_tokens(m["content"]) for m in trimmed) > max_tokens:
-        trimmed.pop(0)
+    # Drop oldest turns until we fit (running total, one estimate per turn)
+    drop = 0
+    while drop < len(tokens) and total > max_tokens:
+        total -= tokens[drop]
+        drop += 1
 
-    return trimmed
+    return history[drop:]
 
 
 # ──────────────────────────────────────────────────────────────────
@@ -107,49 +116,40 @@ class ContextLimits:
     recommended_model_class: str = "14B-30B"
 
 
+# (min VRAM MB, default context, thinking context, recommended model class),
+# checked top-down; the last row also covers anything smaller
+_VRAM_TIERS: tuple[tuple[int, int, int, str], ...] = (
+    (24000, 32768, 65536, "30B-70B"),
+    (16000, 16384, 32768, "14B-30B"),
+    (8000, 8192, 16384, "7B-14B"),
+    (4000, 4096, 8192, "1B-7B"),
+    (0, 2048, 4096, "1B-3B"),
+)
+_CPU_TIER = (0, 4096, 8192, "3B-7B (Q4)")
+
+
 def limits_from_hardware(hardware: dict[str, Any]) -> ContextLimits:
     """Derive context limits from detected hardware.
 
     *hardware* is the dict returned by :func:`cortex.install.hardware.detect_hardware`.
     """
-    limits = ContextLimits()
     gpus = hardware.get("gpus", [])
-    best = None
-    for gpu in gpus:
-        if not gpu.get("is_igpu", False):
-            if best is None or gpu["vram_mb"] > best["vram_mb"]:
-                best = gpu
+    best = max(
+        (gpu for gpu in gpus if not gpu.get("is_igpu", False)),
+        key=lambda gpu: gpu["vram_mb"],
+        default=None,
+    )
     if best is None and gpus:
         best = gpus[0]
 
     if best:
         vram = best["vram_mb"]
-        if vram >= 24000:
-            limits.default_context = 32768
-            limits.thinking_context = 65536
-            limits.recommended_model_class = "30B-70B"
-        elif vram >= 16000:
-            limits.default_context = 16384
-            limits.thinking_context = 32768
-            limits.recommended_model_class = "14B-30B"
-        elif vram >= 8000:
-            limits.default_context = 8192
-            limits.thinking_context = 16384
-            limits.recommended_model_class = "7B-14B"
-        elif vram >= 4000:
-            limits.default_context = 4096
-            limits.thinking_context = 8192
-            limits.recommended_model_class = "1B-7B"
-        else:
-            limits.default_context = 2048
-            limits.thinking_context = 4096
-            limits.recommended_model_class = "1B-3B"
+        tier = next((t for t in _VRAM_TIERS if vram >= t[0]), _VRAM_TIERS[-1])
     else:
-        # CPU-only
-        limits.default_context = 4096
-        limits.thinking_context = 8192
-        limits.recommended_model_class = "3B-7B (Q4)"
+        tier = _CPU_TIER
 
+    limits = ContextLimits()
+    _, limits.default_context, limits.thinking_context, limits.recommended_model_class = tier
     return limits
 
 
@@ -157,6 +157,11 @@ def limits_from_hardware(hardware: dict[str, Any]) -> ContextLimits:
 # Checkpoint summarization
 # ──────────────────────────────────────────────────────────────────
 
+# Per-turn and total character caps on the LLM summarization prompt
+_SUMMARY_TURN_CHARS = 500
+_SUMMARY_PROMPT_CHARS = 8000
+
+
 async def summarize_checkpoint(
     history: list[dict],
     provider: Any = None,
@@ -173,28 +178,36 @@ async def summarize_checkpoint(
     turns = history[:max_turns]
 
     if provider is not None:
-        combined = "\n".join(
-            f"{m.get('role', 'unknown')}: {m.get('content', '')}" for m in turns
-        )
-        prompt = (
-            "Summarize the following conversation into a brief paragraph "
-            "capturing the key topics and conclusions:\n\n" + combined
-        )
-        try:
-            return await provider.generate(prompt)
-        except Exception:
-            logger.warning("LLM summarization failed, falling back to extractive summary")
+        parts = [
+            f"{m.get('role', 'unknown')}: {m.get('content', '')[:_SUMMARY_TURN_CHARS]}"
+            for m in turns
+        ]
+        # Oversized transcripts go straight to the extractive summary rather
+        # than into an LLM call that may not fit the provider's context
+        if sum(map(len, parts)) <= _SUMMARY_PROMPT_CHARS:
+            prompt = (
+                "Summarize the following conversation into a brief paragraph "
+                "capturing the key topics and conclusions:\n\n" + "\n".join(parts)
+            )
+            try:
+                return await provider.generate(prompt)
+            except Exception:
+                logger.warning("LLM summarization failed, falling back to extractive summary")
 
     # Extractive fallback: first sentence of each assistant turn
+    return " ".join(_first_sentences(turns))
+
+
+def _first_sentences(turns: list[dict]) -> list[str]:
+    """First sentence of each assistant turn (text up to the first ``.``)."""
     sentences: list[str] = []
     for m in turns:
         if m.get("role") == "assistant":
-            content = m.get("content", "").strip()
-            if content:
-                first = content.split(".")[0].strip()
-                if first:
-                    sentences.append(first + ".")
-    return " ".join(sentences) if sentences else ""
+            # partition stops at the first "." instead of splitting the whole reply
+            first = m.get("content", "").strip().partition(".")[0].strip()
+            if first:
+                sentences.append(first + ".")
+    return sentences
 
 
 # ──────────────────────────────────────────────────────────────────
@@ -218,7 +231,19 @@ def compact_context(
         return history, ""
 
     max_tokens = limits.default_context
-    total = sum(estimate_tokens(m.get("content", "")) for m in history)
+    vectorise = len(history) >= _VECTORISE_MIN_TURNS
+    if vectorise:
+        import numpy as np  # lazy: only long histories need it
+
+        # Per-turn estimates as one array (estimate_tokens, element-wise)
+        lengths = np.fromiter(
+            (len(m.get("content", "")) for m in history), dtype=np.int64, count=len(history),
+        )
+        tokens = np.maximum(1, lengths // _CHARS_PER_TOKEN)
+        total = int(tokens.sum())
+    else:
+        tokens = [estimate_tokens(m.get("content", "")) for m in history]
+        total = sum(tokens)
     existing_checkpoint = " ".join(checkpoints) if checkpoints else ""
 
     if total <= max_tokens:
@@ -226,26 +251,22 @@ def compact_context(
 
     # Keep recent turns that fit in budget
     budget = max_tokens // 2  # reserve half for recent turns
-    recent: list[dict] = []
-    used = 0
-    for m in reversed(history):
-        t = estimate_tokens(m.get("content", ""))
-        if used + t > budget and recent:
-            break
-        recent.insert(0, m)
-        used += t
+    # Newest-first running totals: keep every turn that fits, but at least one
+    if vectorise:
+        used = np.cumsum(tokens[::-1])
+        keep = max(1, int(np.searchsorted(used, budget, side="right")))
+    else:
+        keep = used = 0
+        for t in reversed(tokens):
+            if used + t > budget and keep:
+                break
+            keep += 1
+            used += t
+    recent = history[len(history) - keep:]
 
     # Summarize the older turns we're dropping
-    older = history[: len(history) - len(recent)]
-    sentences: list[str] = []
-    for m in older:
-        if m.get("role") == "assistant":
-            content = m.get("content", "").strip()
-            if content:
-                first = content.split(".")[0].strip()
-                if first:
-                    sentences.append(first + ".")
-    new_checkpoint = " ".join(sentences)
+    older = history[: len(history) - keep]
+    new_checkpoint = " ".join(_first_sentences(older))
 
     if existing_checkpoint:
         new_checkpoint = existing_checkpoint + " " + new_checkpoint if new_checkpoint else existing_checkpoint
@@ -271,3 +292,16 @@ def recover_overflow(
 
     target = limits.default_context // 2
     return trim_history(history, target)
+
+
+__all__ = [
+    "TokenBudget",
+    "estimate_tokens",
+    "compute_budget",
+    "trim_history",
+    "ContextLimits",
+    "limits_from_hardware",
+    "summarize_checkpoint",
+    "compact_context",
+    "recover_overflow",
+]
@@ -21,6 +21,22 @@ from pathlib import Path
 _DB_PATH: Path | None = None
 _LOCAL = threading.local()
 
+# Applied to every new connection.  WAL lets readers proceed while a writer
+# holds the lock; NORMAL sync is durable under WAL and skips per-commit fsync.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",  # wait out a concurrent writer, not SQLITE_BUSY
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA cache_size=-64000",  # ~64 MB page cache
+)
+
+# Per-connection prepared-statement cache (sqlite3 defaults to 128).  Admin
+# and pipeline queries are fixed strings, so every repeat skips the parse.
+_CACHED_STATEMENTS = 256
+
 
 def _db_path() -> Path:
     global _DB_PATH
@@ -38,14 +54,21 @@ def set_db_path(path: str | Path) -> None:
     _LOCAL = threading.local()
 
 
+def get_db_path() -> Path:
+    """Return the active database path."""
+    return _db_path()
+
+
 def get_db() -> sqlite3.Connection:
-    """Return a per-thread SQLite connection (WAL mode, FK enabled)."""
+    """Return a per-thread SQLite connection (WAL mode, FK enabled, tuned)."""
     conn = getattr(_LOCAL, "conn", None)
     if conn is None:
-        conn = sqlite3.connect(str(_db_path()), check_same_thread=False)
+        conn = sqlite3.connect(
+            str(_db_path()), check_same_thread=False, cached_statements=_CACHED_STATEMENTS,
+        )
         conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA foreign_keys=ON")
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
         _LOCAL.conn = conn
     return conn
 
@@ -57,6 +80,9 @@ def init_db(path: str | Path | None = None) -> None:
     conn = get_db()
     _create_schema(conn)
     conn.commit()
+    # Refresh planner statistics where they are stale or missing (no-op on a
+    # fresh database) so new indexes get picked over table scans
+    conn.execute("PRAGMA optimize")
 
 
 _SCHEMA_SQL = """
@@ -72,7 +98,8 @@ CREATE TABLE IF NOT EXISTS ha_devices (
     discovered_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     last_seen      TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
-CREATE INDEX IF NOT EXISTS idx_devices_domain ON ha_devices(domain);
+CREATE INDEX IF NOT EXISTS idx_devices_domain_name ON ha_devices(domain, friendly_name);
+DROP INDEX IF EXISTS idx_devices_domain;  -- prefix of idx_devices_domain_name
 CREATE INDEX IF NOT EXISTS idx_devices_area   ON ha_devices(area_id);
 
 CREATE TABLE IF NOT EXISTS device_aliases (
@@ -107,7 +134,9 @@ CREATE TABLE IF NOT EXISTS command_patterns (
     created_at           TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 CREATE INDEX IF NOT EXISTS idx_patterns_domain ON command_patterns(entity_domain);
-CREATE INDEX IF NOT EXISTS idx_patterns_source ON command_patterns(source);
+CREATE INDEX IF NOT EXISTS idx_patterns_hits   ON command_patterns(hit_count, id);
+CREATE INDEX IF NOT EXISTS idx_patterns_source_hits ON command_patterns(source, hit_count, id);
+DROP INDEX IF EXISTS idx_patterns_source;  -- prefix of idx_patterns_source_hits
 
 -- ───────── Interactions ─────────
 
@@ -131,11 +160,14 @@ CREATE TABLE IF NOT EXISTS interactions (
     created_at       TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (pattern_id) REFERENCES command_patterns(id)
 );
-CREATE INDEX IF NOT EXISTS idx_interactions_layer   ON interactions(matched_layer);
-CREATE INDEX IF NOT EXISTS idx_interactions_user    ON interactions(user_id);
 CREATE INDEX IF NOT EXISTS idx_interactions_created ON interactions(created_at);
-CREATE INDEX IF NOT EXISTS idx_interactions_fallthrough ON interactions(matched_layer, created_at)
-    WHERE matched_layer = 'llm';
+CREATE INDEX IF NOT EXISTS idx_interactions_user_created ON interactions(user_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_interactions_layer_created ON interactions(matched_layer, created_at);
+-- Leading prefixes of the composites above; every turn inserts a row here,
+-- so each extra b-tree is a write on the hot path
+DROP INDEX IF EXISTS idx_interactions_layer;
+DROP INDEX IF EXISTS idx_interactions_user;
+DROP INDEX IF EXISTS idx_interactions_fallthrough;
 
 CREATE TABLE IF NOT EXISTS interaction_entities (
     interaction_id INTEGER NOT NULL,
@@ -213,6 +245,7 @@ CREATE TABLE IF NOT EXISTS emotional_profiles (
     last_evolved_at      TIMESTAMP,
     created_at           TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
+CREATE INDEX IF NOT EXISTS idx_emotional_last ON emotional_profiles(last_interaction);
 
 CREATE TABLE IF NOT EXISTS filler_phrases (
     id         INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -236,6 +269,7 @@ CREATE TABLE IF NOT EXISTS user_topics (
     PRIMARY KEY (user_id, topic),
     FOREIGN KEY (user_id) REFERENCES emotional_profiles(user_id) ON DELETE CASCADE
 );
+CREATE INDEX IF NOT EXISTS idx_topics_user_count ON user_topics(user_id, mention_count DESC);
 
 CREATE TABLE IF NOT EXISTS user_activity_hours (
     user_id           TEXT NOT NULL,
@@ -265,6 +299,7 @@ CREATE TABLE IF NOT EXISTS user_profiles (
     FOREIGN KEY (parent_user_id) REFERENCES user_profiles(user_id)
 );
 CREATE INDEX IF NOT EXISTS idx_profiles_age_group ON user_profiles(age_group);
+CREATE INDEX IF NOT EXISTS idx_profiles_updated ON user_profiles(updated_at, user_id);
 
 CREATE TABLE IF NOT EXISTS parental_controls (
     child_user_id        TEXT PRIMARY KEY,
@@ -277,6 +312,16 @@ CREATE TABLE IF NOT EXISTS parental_controls (
     FOREIGN KEY (parent_user_id) REFERENCES user_profiles(user_id)
 );
 
+-- Deleting a user clears their per-user rows in the same statement.
+-- emotional_profiles has no FK to user_profiles (it can exist first), and a
+-- trigger applies to existing databases where retrofitting CASCADE cannot.
+CREATE TRIGGER IF NOT EXISTS trg_user_profiles_delete
+BEFORE DELETE ON user_profiles
+BEGIN
+    DELETE FROM parental_controls WHERE child_user_id = OLD.user_id;
+    DELETE FROM emotional_profiles WHERE user_id = OLD.user_id;
+END;
+
 CREATE TABLE IF NOT EXISTS parental_allowed_devices (
     child_user_id TEXT NOT NULL,
     entity_id     TEXT NOT NULL,
@@ -416,6 +461,7 @@ CREATE TABLE IF NOT EXISTS evolution_log (
     total_interactions_today INTEGER,
     notes                   TEXT
 );
+CREATE INDEX IF NOT EXISTS idx_evolution_log_run ON evolution_log(run_at);
 
 CREATE TABLE IF NOT EXISTS mistake_log (
     id                 INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -433,6 +479,8 @@ CREATE TABLE IF NOT EXISTS mistake_log (
 );
 CREATE INDEX IF NOT EXISTS idx_mistakes_category   ON mistake_log(mistake_category);
 CREATE INDEX IF NOT EXISTS idx_mistakes_unresolved ON mistake_log(resolved) WHERE resolved = FALSE;
+CREATE INDEX IF NOT EXISTS idx_mistakes_created    ON mistake_log(created_at);
+CREATE INDEX IF NOT EXISTS idx_mistakes_resolved_created ON mistake_log(resolved, created_at);
 
 CREATE TABLE IF NOT EXISTS mistake_tags (
     mistake_id INTEGER NOT NULL,
@@ -456,6 +504,7 @@ CREATE TABLE IF NOT EXISTS backup_log (
     error_message TEXT,
     created_at    TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
+CREATE INDEX IF NOT EXISTS idx_backup_log_created ON backup_log(created_at);
 
 -- ───────── Hardware & Context ─────────
 
@@ -577,6 +626,9 @@ CREATE TABLE IF NOT EXISTS guardrail_events (
     content_tier  TEXT DEFAULT 'unknown',
     created_at    TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
+CREATE INDEX IF NOT EXISTS idx_guardrail_created  ON guardrail_events(created_at);
+CREATE INDEX IF NOT EXISTS idx_guardrail_category ON guardrail_events(category, created_at);
+CREATE INDEX IF NOT EXISTS idx_guardrail_user     ON guardrail_events(user_id, created_at);
 
 CREATE TABLE IF NOT EXISTS jailbreak_patterns (
     id            INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -895,6 +947,9 @@ CREATE TABLE IF NOT EXISTS routine_runs (
     steps_completed INTEGER DEFAULT 0,
     error_message TEXT DEFAULT ''
 );
+CREATE INDEX IF NOT EXISTS idx_routine_steps_routine ON routine_steps(routine_id, step_order);
+CREATE INDEX IF NOT EXISTS idx_routine_triggers_routine ON routine_triggers(routine_id);
+CREATE INDEX IF NOT EXISTS idx_routine_runs_routine ON routine_runs(routine_id, started_at);
 
 -- Story Time Engine
 CREATE TABLE IF NOT EXISTS stories (
@@ -1000,6 +1055,7 @@ CREATE TABLE IF NOT EXISTS evolution_runs (
     completed_at TEXT,
     created_at TEXT DEFAULT CURRENT_TIMESTAMP
 );
+CREATE INDEX IF NOT EXISTS idx_evolution_runs_created ON evolution_runs(created_at, id);
 
 CREATE TABLE IF NOT EXISTS evolution_metrics (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -1053,6 +1109,8 @@ CREATE TABLE IF NOT EXISTS media_playback_history (
     duration_listened REAL DEFAULT 0,
     completed INTEGER DEFAULT 0
 );
+CREATE INDEX IF NOT EXISTS idx_playback_played ON media_playback_history(played_at);
+CREATE INDEX IF NOT EXISTS idx_playback_user_played ON media_playback_history(user_id, played_at);
 
 CREATE TABLE IF NOT EXISTS media_preferences (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -1241,12 +1299,11 @@ def _seed_default_avatar_flags(conn: sqlite3.Connection) -> None:
         ("global", "satellite_mode", 0),
         ("global", "dev_mode", 0),
     ]
-    for scope, flag_name, enabled in _DEFAULT_FLAGS:
-        conn.execute(
-            "INSERT OR IGNORE INTO avatar_feature_flags (scope, flag_name, enabled) "
-            "VALUES (?, ?, ?)",
-            (scope, flag_name, enabled),
-        )
+    conn.executemany(
+        "INSERT OR IGNORE INTO avatar_feature_flags (scope, flag_name, enabled) "
+        "VALUES (?, ?, ?)",
+        _DEFAULT_FLAGS,
+    )
     conn.commit()
 
 
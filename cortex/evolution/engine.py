@@ -55,12 +55,11 @@ class EvolutionEngine:
 
     def _record_metrics(self, run_id: int, metrics: dict[str, float], domain: str = "general") -> None:
         conn = get_db()
-        for name, value in metrics.items():
-            conn.execute(
-                "INSERT INTO evolution_metrics (run_id, metric_name, metric_value, domain) "
-                "VALUES (?, ?, ?, ?)",
-                (run_id, name, value, domain),
-            )
+        conn.executemany(
+            "INSERT INTO evolution_metrics (run_id, metric_name, metric_value, domain) "
+            "VALUES (?, ?, ?, ?)",
+            [(run_id, name, value, domain) for name, value in metrics.items()],
+        )
         conn.commit()
 
     # ── Public API ───────────────────────────────────────────────────
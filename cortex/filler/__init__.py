@@ -18,7 +18,6 @@ from __future__ import annotations
 
 import random
 from collections import deque
-from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -162,8 +161,9 @@ def _pick_sentiment_filler(
             if rows:
                 # Update last_used
                 conn.execute(
-                    "UPDATE filler_phrases SET use_count = use_count + 1, last_used = ? WHERE id = ?",
-                    (datetime.now(tz=timezone.utc).isoformat(), rows["id"]),
+                    "UPDATE filler_phrases SET use_count = use_count + 1, "
+                    "last_used = strftime('%Y-%m-%dT%H:%M:%fZ', 'now') WHERE id = ?",
+                    (rows["id"],),
                 )
                 conn.commit()
                 return rows["phrase"]
@@ -202,13 +202,15 @@ def seed_default_fillers(conn: "sqlite3.Connection", user_id: str = "default") -
 
     Safe to call multiple times — skips phrases that already exist.
     """
-    for sentiment, phrases in DEFAULT_FILLERS.items():
-        for phrase in phrases:
-            conn.execute(
-                """
-                INSERT OR IGNORE INTO filler_phrases (user_id, sentiment, phrase, source)
-                VALUES (?, ?, ?, 'default')
-                """,
-                (user_id, sentiment, phrase),
-            )
+    conn.executemany(
+        """
+        INSERT OR IGNORE INTO filler_phrases (user_id, sentiment, phrase, source)
+        VALUES (?, ?, ?, 'default')
+        """,
+        [
+            (user_id, sentiment, phrase)
+            for sentiment, phrases in DEFAULT_FILLERS.items()
+            for phrase in phrases
+        ],
+    )
     conn.commit()
@@ -113,6 +113,7 @@ class FillerCache:
         self._recent: dict[str, deque[str]] = {}
         self._initialized = False
         self._initializing = False
+        self.voice: str | None = None  # voice the cached audio was made with
 
     @property
     def ready(self) -> bool:
@@ -144,6 +145,7 @@ class FillerCache:
         if not force and cache_file.exists():
             loaded = self._load_from_disk(cache_file)
             if loaded > 0:
+                self.voice = voice
                 self._initialized = True
                 self._initializing = False
                 total_bytes = sum(
@@ -180,6 +182,8 @@ class FillerCache:
                 except Exception as e:
                     logger.warning("Failed to cache filler %r: %s", phrase[:40], e)
 
+        # Only now does the cached audio belong to *voice*
+        self.voice = voice
         self._initialized = True
         self._initializing = False
 
@@ -254,6 +258,18 @@ class FillerCache:
         Falls back to 'question' if sentiment has no cached entries.
         Avoids repeating the last 3 fillers per sentiment.
         """
+        choice = self.peek(sentiment)
+        if choice is not None:
+            if sentiment not in self._recent:
+                self._recent[sentiment] = deque(maxlen=3)
+            self._recent[sentiment].append(choice.phrase)
+        return choice
+
+    def peek(self, sentiment: str) -> CachedFiller | None:
+        """Pick a filler as :meth:`get` does, without advancing the rotation.
+
+        For admin previews, so they don't change what the pipeline plays next.
+        """
         if not self._initialized:
             return None
 
@@ -261,16 +277,12 @@ class FillerCache:
         if not pool:
             return None
 
-        recent = self._recent.get(sentiment, deque(maxlen=3))
+        recent = self._recent.get(sentiment, ())
         candidates = [f for f in pool if f.phrase not in recent]
         if not candidates:
             candidates = pool
 
-        choice = random.choice(candidates)
-        if sentiment not in self._recent:
-            self._recent[sentiment] = deque(maxlen=3)
-        self._recent[sentiment].append(choice.phrase)
-        return choice
+        return random.choice(candidates)
 
     def reset(self) -> None:
         """Clear all cached fillers so ``initialize(force=True)`` can rebuild."""
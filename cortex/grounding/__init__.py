@@ -101,11 +101,10 @@ def log_mistake(
              detection_method, mistake_category, confidence_at_time),
         )
         mistake_id = cur.lastrowid
-        for tag in (tags or []):
-            conn.execute(
-                "INSERT OR IGNORE INTO mistake_tags (mistake_id, tag) VALUES (?, ?)",
-                (mistake_id, tag),
-            )
+        conn.executemany(
+            "INSERT OR IGNORE INTO mistake_tags (mistake_id, tag) VALUES (?, ?)",
+            [(mistake_id, tag) for tag in (tags or [])],
+        )
         conn.commit()
     except Exception as exc:
         logger.debug("Mistake logging failed: %s", exc)
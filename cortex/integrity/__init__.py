@@ -129,12 +129,11 @@ def compute_all_checksums() -> dict[str, str]:
 
 def store_checksums(conn: sqlite3.Connection, checksums: dict[str, str]) -> None:
     """Persist checksums to the file_checksums table."""
-    for fpath, checksum in checksums.items():
-        conn.execute(
-            "INSERT OR REPLACE INTO file_checksums (file_path, sha256_hash, zone) "
-            "VALUES (?, ?, 'frozen')",
-            (fpath, checksum),
-        )
+    conn.executemany(
+        "INSERT OR REPLACE INTO file_checksums (file_path, sha256_hash, zone) "
+        "VALUES (?, ?, 'frozen')",
+        checksums.items(),
+    )
     conn.commit()
 
 
@@ -34,6 +34,18 @@ _PAUSE_STALE_SECONDS = 30.0
 
 # ── Satellite audio streaming (protocol-specific) ────────────────
 
+async def _send_tts_chunk(conn: Any, pcm: bytes | memoryview) -> None:
+    """Send one TTS_CHUNK; binary for satellites that negotiated it."""
+    if conn.binary_audio:
+        await conn.send_audio_chunk(pcm)
+        return
+    await conn.send({
+        "type": "TTS_CHUNK",
+        "session_id": conn.session_id,
+        "audio": base64.b64encode(pcm).decode("ascii"),
+    })
+
+
 async def _stream_audio_to_satellite(
     conn: Any, audio: bytes, rate: int,
     text: str, is_filler: bool = False, auto_listen: bool = False,
@@ -48,13 +60,9 @@ async def _stream_audio_to_satellite(
         "is_filler": is_filler,
     })
     chunk_size = 4096
+    mv = memoryview(audio)  # slice without copying; b64encode reads the buffer
     for offset in range(0, len(audio), chunk_size):
-        chunk = audio[offset:offset + chunk_size]
-        await conn.send({
-            "type": "TTS_CHUNK",
-            "session_id": conn.session_id,
-            "audio": base64.b64encode(chunk).decode("ascii"),
-        })
+        await _send_tts_chunk(conn, mv[offset:offset + chunk_size])
     msg: dict[str, Any] = {
         "type": "TTS_END",
         "session_id": conn.session_id,
@@ -137,20 +145,12 @@ async def _stream_orpheus_to_satellite(
                     while len(pcm_buffer) >= 4096:
                         out = bytes(pcm_buffer[:4096])
                         pcm_buffer = pcm_buffer[4096:]
-                        await conn.send({
-                            "type": "TTS_CHUNK",
-                            "session_id": conn.session_id,
-                            "audio": base64.b64encode(out).decode("ascii"),
-                        })
+                        await _send_tts_chunk(conn, out)
                         total_bytes += len(out)
 
                 if pcm_buffer and sent_start:
                     out = bytes(pcm_buffer)
-                    await conn.send({
-                        "type": "TTS_CHUNK",
-                        "session_id": conn.session_id,
-                        "audio": base64.b64encode(out).decode("ascii"),
-                    })
+                    await _send_tts_chunk(conn, out)
                     total_bytes += len(out)
 
         if sent_start:
@@ -58,9 +58,9 @@ def update_user_profile(conn: Any, user_id: str, **fields: Any) -> None:
     if not fields:
         return
     set_clause = ", ".join(f"{k} = ?" for k in fields)
-    values = list(fields.values()) + [datetime.now(tz=timezone.utc).isoformat(), user_id]
+    values = list(fields.values()) + [user_id]
     conn.execute(
-        f"UPDATE user_profiles SET {set_clause}, updated_at = ? WHERE user_id = ?",
+        f"UPDATE user_profiles SET {set_clause}, updated_at = CURRENT_TIMESTAMP WHERE user_id = ?",
         values,
     )
     conn.commit()
@@ -217,7 +217,6 @@ def update_rapport(conn: Any, user_id: str, sentiment_score: float) -> None:
         negative_inc = 0
 
     new_score = max(0.0, min(1.0, current + delta))
-    now = datetime.now(tz=timezone.utc).isoformat()
     conn.execute(
         """
         UPDATE emotional_profiles
@@ -225,10 +224,10 @@ def update_rapport(conn: Any, user_id: str, sentiment_score: float) -> None:
             interaction_count = interaction_count + 1,
             positive_count    = positive_count + ?,
             negative_count    = negative_count + ?,
-            last_interaction  = ?
+            last_interaction  = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
         WHERE user_id = ?
         """,
-        (new_score, positive_inc, negative_inc, now, user_id),
+        (new_score, positive_inc, negative_inc, user_id),
     )
     conn.commit()
 
@@ -249,16 +248,15 @@ def record_activity_hour(conn: Any, user_id: str, hour: int) -> None:
 
 def record_topic(conn: Any, user_id: str, topic: str) -> None:
     """Increment the mention count for a topic."""
-    now = datetime.now(tz=timezone.utc).isoformat()
     conn.execute(
         """
         INSERT INTO user_topics (user_id, topic, mention_count, last_mentioned)
-        VALUES (?, ?, 1, ?)
+        VALUES (?, ?, 1, strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
         ON CONFLICT(user_id, topic) DO UPDATE SET
             mention_count  = mention_count + 1,
-            last_mentioned = ?
+            last_mentioned = excluded.last_mentioned
         """,
-        (user_id, topic, now, now),
+        (user_id, topic),
     )
     conn.commit()
 
@@ -138,11 +138,10 @@ class RoutineEngine:
     async def reorder_steps(self, routine_id: int, step_ids: list[int]) -> bool:
         """Reorder steps by providing the desired order of step IDs."""
         conn = get_db()
-        for order, step_id in enumerate(step_ids, start=1):
-            conn.execute(
-                "UPDATE routine_steps SET step_order = ? WHERE id = ? AND routine_id = ?",
-                (order, step_id, routine_id),
-            )
+        conn.executemany(
+            "UPDATE routine_steps SET step_order = ? WHERE id = ? AND routine_id = ?",
+            [(order, step_id, routine_id) for order, step_id in enumerate(step_ids, start=1)],
+        )
         conn.commit()
         return True
 
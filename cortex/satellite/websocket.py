@@ -13,6 +13,7 @@ satellite devices:
   Server → Satellite:
     ACCEPTED, TTS_START, TTS_CHUNK, TTS_END, PLAY_FILLER,
     COMMAND, CONFIG, SYNC_FILLERS (Pi)
+    binary TTS_CHUNK: 0x01 + raw PCM (Pi, when ANNOUNCE lists "binary_audio")
     registered, speaking_start, audio_chunk, speaking_end,
     led, playback_stop (ESP32)
 """
@@ -28,6 +29,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
 from cortex.db import get_db, init_db
@@ -53,6 +55,12 @@ _connected_satellites: dict[str, SatelliteConnection] = {}
 
 _MAX_PHRASE_QUEUE_SIZE = 5  # prevent memory issues from run-away queuing
 
+# TTS audio as a binary frame: this opcode byte, then raw PCM.  Satellites
+# without the "binary_audio" capability get base64 inside a JSON TTS_CHUNK.
+TTS_CHUNK_OPCODE = b"\x01"
+_TTS_CHUNK_PREFIX = b'{"type":"TTS_CHUNK","audio":"'
+_TTS_CHUNK_SUFFIX = b'"}'
+
 
 class SatelliteConnection:
     """Tracks a connected satellite's WebSocket and metadata."""
@@ -66,6 +74,7 @@ class SatelliteConnection:
         self.audio_buffer: bytearray = bytearray()
         self.audio_format: dict = {}
         self.has_wake_word: bool = False  # True if satellite has local wake word detection
+        self.binary_audio: bool = False  # True if satellite accepts binary TTS_CHUNK frames
         self.pipeline_task: asyncio.Task | None = None  # in-progress voice pipeline
         # CE-2: per-connection phrase queue for multi-question support
         self.phrase_queue: asyncio.Queue = asyncio.Queue(maxsize=_MAX_PHRASE_QUEUE_SIZE)
@@ -77,8 +86,25 @@ class SatelliteConnection:
         self.paused_at: float = 0.0              # Timestamp of pause (for staleness)
 
     async def send(self, message: dict) -> None:
-        """Send a JSON message to the satellite."""
-        await self.websocket.send_json(message)
+        """Send a JSON message to the satellite (orjson-encoded text frame)."""
+        await self.websocket.send_text(orjson.dumps(message).decode())
+
+    async def send_raw(self, frame: str) -> None:
+        """Send a pre-encoded JSON text frame as-is (hot audio paths)."""
+        await self.websocket.send_text(frame)
+
+    async def send_binary(self, data: bytes) -> None:
+        """Send a binary websocket frame."""
+        await self.websocket.send_bytes(data)
+
+    async def send_audio_chunk(self, pcm: bytes | memoryview) -> None:
+        """Send one TTS_CHUNK of PCM in the best format the satellite accepts."""
+        if self.binary_audio:
+            await self.send_binary(TTS_CHUNK_OPCODE + pcm)
+        else:
+            # base64 needs no JSON escaping, so splice it into a fixed frame
+            frame = _TTS_CHUNK_PREFIX + base64.b64encode(pcm) + _TTS_CHUNK_SUFFIX
+            await self.send_raw(frame.decode("ascii"))
 
     async def send_command(self, action: str, params: dict | None = None) -> None:
         """Send a COMMAND message."""
@@ -187,6 +213,7 @@ async def satellite_ws_handler(websocket: WebSocket) -> None:
         client_ip = websocket.client.host if websocket.client else None
         capabilities = raw.get("capabilities") or []
         conn.has_wake_word = "wake_word" in capabilities
+        conn.binary_audio = "binary_audio" in capabilities
         _update_satellite_status(
             satellite_id, "online",
             ip_address=client_ip,
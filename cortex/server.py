@@ -25,12 +25,14 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, AsyncGenerator
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 
+from cortex.admin.helpers import ORJSONResponse
 from cortex.admin_api import router as admin_router
 from cortex.auth_user import get_user_auth
 from cortex.db import get_db, init_db
@@ -122,6 +124,16 @@ async def lifespan(app: FastAPI):
 
     register_startup_task("filler-cache", _warm_filler_cache)
 
+    # Warm admin-panel singletons so the first admin request after boot
+    # doesn't pay for DB seeding or SatelliteManager construction
+    async def _warm_admin() -> None:
+        from cortex.admin.helpers import _db
+        from cortex.admin.satellites import warm_satellite_manager
+        _db()
+        await warm_satellite_manager()
+
+    register_startup_task("admin-warmup", _warm_admin)
+
     # Register knowledge sync as background service (syncs WebDAV/CalDAV)
     _knowledge_sync = None
     try:
@@ -181,12 +193,18 @@ async def lifespan(app: FastAPI):
     yield
     await stop_all()
 
+    from cortex.voice.kokoro import close_kokoro_clients
+    await close_kokoro_clients()
+
 
 # ──────────────────────────────────────────────────────────────────
 # FastAPI app
 # ──────────────────────────────────────────────────────────────────
 
-app = FastAPI(title="Atlas Cortex", version="1.0.0", lifespan=lifespan)
+app = FastAPI(
+    title="Atlas Cortex", version="1.0.0", lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # CORS for admin SPA dev server
 app.add_middleware(
@@ -523,7 +541,7 @@ async def _sse_stream(
                 }
             ],
         }
-        yield f"data: {json.dumps(data)}\n\n"
+        yield f"data: {orjson.dumps(data).decode()}\n\n"
 
     # Final chunk
     final = {
@@ -533,13 +551,13 @@ async def _sse_stream(
         "model": model,
         "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
     }
-    yield f"data: {json.dumps(final)}\n\n"
+    yield f"data: {orjson.dumps(final).decode()}\n\n"
     yield "data: [DONE]\n\n"
 
 
 def _json_response(content: str, model: str) -> JSONResponse:
     completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
-    return JSONResponse({
+    return ORJSONResponse({
         "id": completion_id,
         "object": "chat.completion",
         "created": int(time.time()),
@@ -665,10 +683,10 @@ async def authenticate_chat_user(request: Request):
             mgr.trust_device(user_id, device_fp)
         return {"ok": True, "token": token, "user": user_info}
 
-    # PIN auth
+    # PIN / password checks are bcrypt (CPU-bound) — keep them off the loop
     if user.auth_method == "pin":
         pin = body.get("pin", "")
-        if not mgr.verify_pin(user_id, pin):
+        if not await asyncio.to_thread(mgr.verify_pin, user_id, pin):
             return JSONResponse({"ok": False, "error": "Invalid PIN"})
         token = mgr.generate_session_token(user_id)
         if device_fp and body.get("trust_device"):
@@ -678,7 +696,7 @@ async def authenticate_chat_user(request: Request):
     # Password auth
     if user.auth_method == "password":
         password = body.get("password", "")
-        if not mgr.verify_password(user_id, password):
+        if not await asyncio.to_thread(mgr.verify_password, user_id, password):
             return JSONResponse({"ok": False, "error": "Invalid password"})
         token = mgr.generate_session_token(user_id)
         if device_fp and body.get("trust_device"):
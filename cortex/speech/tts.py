@@ -51,8 +51,8 @@ async def synthesize_speech(
     # --- Fast path: Kokoro first for instant answers/fillers ---
     if fast or _TTS_PROVIDER == "kokoro":
         try:
-            from cortex.voice.kokoro import KokoroClient
-            kokoro = KokoroClient(_KOKORO_HOST, _KOKORO_PORT, timeout=15.0)
+            from cortex.voice.kokoro import get_kokoro_client
+            kokoro = get_kokoro_client(_KOKORO_HOST, _KOKORO_PORT, timeout=15.0)
             kokoro_voice = voice if voice and not voice.startswith(("orpheus_", "qwen3_")) else KOKORO_VOICE
             raw, info = await kokoro.synthesize(text, voice=kokoro_voice, response_format="wav")
             if raw:
@@ -123,8 +123,8 @@ async def synthesize_speech(
     # --- Kokoro (fallback if GPU providers fail) ---
     if not fast:
         try:
-            from cortex.voice.kokoro import KokoroClient
-            kokoro = KokoroClient(_KOKORO_HOST, _KOKORO_PORT, timeout=15.0)
+            from cortex.voice.kokoro import get_kokoro_client
+            kokoro = get_kokoro_client(_KOKORO_HOST, _KOKORO_PORT, timeout=15.0)
             kokoro_voice = voice if voice and not voice.startswith(("orpheus_", "qwen3_")) else KOKORO_VOICE
             raw, info = await kokoro.synthesize(text, voice=kokoro_voice, response_format="wav")
             if raw:
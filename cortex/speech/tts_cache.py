@@ -0,0 +1,61 @@
+"""In-memory LRU cache for synthesized TTS audio.
+
+Admin previews and filler phrases ask the TTS backend for the same text
+and voice over and over.  Entries hold raw PCM plus its format so a hit
+skips the backend entirely and goes straight to WAV framing or the
+satellite push.  Pre-generated audio on disk lives in :mod:`cortex.speech.cache`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+# (pcm, sample rate, sample width in bytes, channels)
+AudioEntry = tuple[bytes, int, int, int]
+
+MAX_ENTRIES = 512
+
+_cache: OrderedDict[str, AudioEntry] = OrderedDict()
+
+
+def cache_key(*parts: str | None) -> str:
+    """Hash the synthesis inputs (e.g. kind, text, voice) into a cache key."""
+    raw = "|".join(p or "" for p in parts)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get(key: str) -> AudioEntry | None:
+    entry = _cache.get(key)
+    if entry is not None:
+        _cache.move_to_end(key)
+    return entry
+
+
+def put(key: str, entry: AudioEntry) -> None:
+    _cache[key] = entry
+    _cache.move_to_end(key)
+    while len(_cache) > MAX_ENTRIES:
+        _cache.popitem(last=False)
+
+
+def clear() -> None:
+    _cache.clear()
+
+
+async def get_or_synth(
+    key: str, synth: Callable[[], Awaitable[AudioEntry]]
+) -> AudioEntry:
+    """Return the cached audio for *key*, or await *synth()* and cache it.
+
+    Failures propagate and empty audio is returned but not stored, so a
+    flaky backend is retried on the next request.
+    """
+    entry = get(key)
+    if entry is not None:
+        return entry
+    entry = await synth()
+    if entry[0]:
+        put(key, entry)
+    return entry
@@ -7,6 +7,7 @@ models like Orpheus for real-time voice assistant use.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Optional
 
@@ -18,9 +19,46 @@ logger = logging.getLogger(__name__)
 class KokoroClient:
     """HTTP client for Kokoro-FastAPI server."""
 
-    def __init__(self, host: str = "localhost", port: int = 8880, timeout: float = 30.0):
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 8880,
+        timeout: float = 30.0,
+        connect_timeout: float | None = None,
+    ):
         self.base_url = f"http://{host}:{port}"
-        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.timeout = aiohttp.ClientTimeout(total=timeout, connect=connect_timeout)
+        # aiohttp sessions are bound to the loop that created them
+        self._sessions: dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the keep-alive session for the running event loop.
+
+        Each loop gets its own session, so callers on different loops never
+        close each other's.  Sessions left by loops that have since closed
+        are dropped when a new one is opened.
+        """
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            await self._drop_dead_sessions()
+            session = self._sessions[loop] = aiohttp.ClientSession(timeout=self.timeout)
+        return session
+
+    async def _drop_dead_sessions(self) -> None:
+        for loop in [loop for loop in self._sessions if loop.is_closed()]:
+            session = self._sessions.pop(loop)
+            try:
+                await session.close()
+            except Exception as exc:
+                logger.debug("Could not close stale Kokoro session: %s", exc)
+
+    async def close(self) -> None:
+        """Close the running loop's session and any left by closed loops."""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+        await self._drop_dead_sessions()
 
     async def synthesize(
         self,
@@ -42,45 +80,81 @@ class KokoroClient:
             "speed": speed,
         }
 
-        async with aiohttp.ClientSession(timeout=self.timeout) as session:
-            async with session.post(
-                f"{self.base_url}/v1/audio/speech",
-                json=payload,
-            ) as resp:
-                if resp.status != 200:
-                    body = await resp.text()
-                    raise KokoroError(f"Kokoro API error {resp.status}: {body[:200]}")
+        session = await self._get_session()
+        async with session.post(
+            f"{self.base_url}/v1/audio/speech",
+            json=payload,
+        ) as resp:
+            if resp.status != 200:
+                body = await resp.text()
+                raise KokoroError(f"Kokoro API error {resp.status}: {body[:200]}")
 
-                audio_data = await resp.read()
+            audio_data = await resp.read()
 
-                # Kokoro outputs 24kHz audio by default
-                info = {
-                    "rate": 24000,
-                    "format": response_format,
-                    "channels": 1,
-                    "sample_width": 2,
-                }
+            # Kokoro outputs 24kHz audio by default
+            info = {
+                "rate": 24000,
+                "format": response_format,
+                "channels": 1,
+                "sample_width": 2,
+            }
 
-                return audio_data, info
+            return audio_data, info
 
     async def list_voices(self) -> list[str]:
         """Get available voice names."""
-        async with aiohttp.ClientSession(timeout=self.timeout) as session:
-            async with session.get(f"{self.base_url}/v1/audio/voices") as resp:
-                if resp.status != 200:
-                    return []
-                data = await resp.json()
-                return data.get("voices", [])
+        session = await self._get_session()
+        async with session.get(f"{self.base_url}/v1/audio/voices") as resp:
+            if resp.status != 200:
+                return []
+            data = await resp.json()
+            return data.get("voices", [])
 
     async def health(self) -> bool:
         """Check if Kokoro server is responding."""
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
-                async with session.get(f"{self.base_url}/v1/audio/voices") as resp:
-                    return resp.status == 200
+            session = await self._get_session()
+            async with session.get(
+                f"{self.base_url}/v1/audio/voices",
+                timeout=aiohttp.ClientTimeout(total=5),
+            ) as resp:
+                return resp.status == 200
         except Exception:
             return False
 
 
 class KokoroError(Exception):
     """Kokoro TTS error."""
+
+
+# Shared clients keyed by (host, port, timeout, connect_timeout) so admin
+# requests reuse warm keep-alive connections instead of a new TCP handshake
+# per call.
+_clients: dict[tuple[str, int, float, float | None], KokoroClient] = {}
+
+
+def get_kokoro_client(
+    host: str,
+    port: int,
+    timeout: float = 30.0,
+    connect_timeout: float | None = None,
+) -> KokoroClient:
+    """Return the shared :class:`KokoroClient` for *host*:*port*.
+
+    *connect_timeout* defaults to no separate limit; interactive callers
+    that would rather fail over quickly pass a short one.
+    """
+    key = (host, port, timeout, connect_timeout)
+    client = _clients.get(key)
+    if client is None:
+        client = _clients[key] = KokoroClient(
+            host, port, timeout=timeout, connect_timeout=connect_timeout
+        )
+    return client
+
+
+async def close_kokoro_clients() -> None:
+    """Close every shared client's session (server shutdown)."""
+    for client in _clients.values():
+        await client.close()
+    _clients.clear()
@@ -1,4 +1,4 @@
-"""Kokoro TTS provider — wraps KokoroClient as a TTSProvider (C11).
+"""Kokoro TTS provider — wraps the shared KokoroClient as a TTSProvider (C11).
 
 Kokoro-82M is the primary TTS engine for Atlas Cortex. It runs on CPU
 with sub-2s synthesis for typical sentences (200ms base + 180ms/word).
@@ -15,7 +15,7 @@ from __future__ import annotations
 import os
 
 from cortex.voice.base import TTSProvider
-from cortex.voice.kokoro import KokoroClient
+from cortex.voice.kokoro import get_kokoro_client
 
 
 class KokoroTTSProvider(TTSProvider):
@@ -29,7 +29,7 @@ class KokoroTTSProvider(TTSProvider):
         self.default_voice = cfg.get(
             "KOKORO_VOICE", os.environ.get("KOKORO_VOICE", "af_bella")
         )
-        self._client = KokoroClient(self.host, self.port)
+        self._client = get_kokoro_client(self.host, self.port)
 
     async def synthesize(
         self,
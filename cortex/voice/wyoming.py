@@ -25,11 +25,21 @@ class WyomingError(Exception):
 class WyomingClient:
     """Client for Wyoming-compatible STT/TTS services."""
 
-    def __init__(self, host: str, port: int, timeout: float = _DEFAULT_TIMEOUT) -> None:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        timeout: float = _DEFAULT_TIMEOUT,
+        read_timeout: float | None = None,
+        write_timeout: float | None = None,
+    ) -> None:
         self.host = host
         self.port = port
-        self.timeout = timeout
-        self.read_timeout = max(timeout, 60.0)  # STT may need longer
+        self.timeout = timeout  # connect timeout
+        # Per-event read timeout; STT may need longer than the connect budget
+        self.read_timeout = read_timeout if read_timeout is not None else max(timeout, 60.0)
+        # Per-event send timeout, so a peer that stops reading can't stall us
+        self.write_timeout = write_timeout if write_timeout is not None else timeout
 
     # ── STT ────────────────────────────────────────────────────────
 
@@ -180,7 +190,10 @@ class WyomingClient:
             writer.write(data_bytes)
         if payload:
             writer.write(payload)
-        await writer.drain()
+        try:
+            await asyncio.wait_for(writer.drain(), timeout=self.write_timeout)
+        except asyncio.TimeoutError as exc:
+            raise WyomingError(f"Timed out sending {event_type} to {self.host}:{self.port}") from exc
 
     async def _read_event(self, reader: asyncio.StreamReader) -> tuple[str, dict, bytes | None]:
         """Read a Wyoming event. Returns (type, data_dict, payload_bytes)."""
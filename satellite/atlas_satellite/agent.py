@@ -30,7 +30,7 @@ from .led import LEDController, create_led
 from .mdns import SatelliteAnnouncer, ServerDiscovery
 from .vad import VoiceActivityDetector, _rms
 from .wake_word import WakeWordDetector
-from .ws_client import SatelliteWSClient
+from .ws_client import TTS_CHUNK_OPCODE, SatelliteWSClient
 
 logger = logging.getLogger(__name__)
 
@@ -256,7 +256,7 @@ class SatelliteAgent:
 
     def _detect_capabilities(self) -> list[str]:
         """Detect what this satellite can do."""
-        caps = ["audio_capture", "audio_playback"]
+        caps = ["audio_capture", "audio_playback", "binary_audio"]
         if self.config.wake_word_enabled:
             caps.append("wake_word")
         if self.config.led_type != "none":
@@ -277,6 +277,7 @@ class SatelliteAgent:
         """Register handlers for server → satellite messages."""
         self.ws.on("TTS_START", self._on_tts_start)
         self.ws.on("TTS_CHUNK", self._on_tts_chunk)
+        self.ws.on_binary(TTS_CHUNK_OPCODE, self._on_tts_pcm)
         self.ws.on("TTS_END", self._on_tts_end)
         self.ws.on("PLAY_FILLER", self._on_play_filler)
         self.ws.on("COMMAND", self._on_command)
@@ -525,6 +526,10 @@ class SatelliteAgent:
         if audio_b64:
             self._tts_buffer.extend(base64.b64decode(audio_b64))
 
+    async def _on_tts_pcm(self, pcm: bytes) -> None:
+        """Received a binary TTS_CHUNK: raw PCM, no decoding needed."""
+        self._tts_buffer.extend(pcm)
+
     async def _on_tts_end(self, msg: dict) -> None:
         """TTS stream complete — play the buffered audio."""
         is_filler = msg.get("is_filler", False)
@@ -3,6 +3,9 @@
 Handles the satellite side of the protocol:
   Satellite → Server: ANNOUNCE, WAKE, AUDIO_START/CHUNK/END, STATUS, HEARTBEAT, BARGE_IN
   Server → Satellite: ACCEPTED, TTS_START/CHUNK/END, PLAY_FILLER, COMMAND, CONFIG, SYNC_FILLERS
+
+Binary server frames start with a one-byte opcode; ``0x01`` is a TTS_CHUNK
+carrying raw PCM (sent when ANNOUNCE lists the ``binary_audio`` capability).
 """
 
 from __future__ import annotations
@@ -21,6 +24,9 @@ from websockets.asyncio.client import ClientConnection
 logger = logging.getLogger(__name__)
 
 MessageHandler = Callable[[dict], Awaitable[None]]
+BinaryHandler = Callable[[bytes], Awaitable[None]]
+
+TTS_CHUNK_OPCODE = 0x01
 
 
 class SatelliteWSClient:
@@ -43,6 +49,7 @@ class SatelliteWSClient:
         self._ws: Optional[ClientConnection] = None
         self._session_id: Optional[str] = None
         self._handlers: dict[str, MessageHandler] = {}
+        self._binary_handlers: dict[int, BinaryHandler] = {}
         self._connected = False
         self._reconnect_delay = 2
         self._max_reconnect_delay = 60
@@ -51,6 +58,10 @@ class SatelliteWSClient:
         """Register a handler for a server message type."""
         self._handlers[msg_type] = handler
 
+    def on_binary(self, opcode: int, handler: BinaryHandler) -> None:
+        """Register a handler for binary frames starting with *opcode*."""
+        self._binary_handlers[opcode] = handler
+
     async def connect(self) -> bool:
         """Connect to the Atlas server and complete handshake."""
         try:
@@ -178,6 +189,9 @@ class SatelliteWSClient:
             return
         try:
             async for raw in self._ws:
+                if isinstance(raw, bytes):
+                    await self._dispatch_binary(raw)
+                    continue
                 msg = json.loads(raw)
                 msg_type = msg.get("type", "")
                 handler = self._handlers.get(msg_type)
@@ -195,6 +209,18 @@ class SatelliteWSClient:
         finally:
             self._connected = False
 
+    async def _dispatch_binary(self, frame: bytes) -> None:
+        if not frame:
+            return
+        handler = self._binary_handlers.get(frame[0])
+        if not handler:
+            logger.debug("Unhandled binary opcode: 0x%02x", frame[0])
+            return
+        try:
+            await handler(frame[1:])
+        except Exception:
+            logger.exception("Handler error for binary opcode 0x%02x", frame[0])
+
     async def disconnect(self) -> None:
         if self._ws:
             await self._ws.close()
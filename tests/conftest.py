@@ -1,6 +1,8 @@
 """pytest configuration for Atlas Cortex tests."""
 
 import asyncio
+import os
+
 import pytest
 
 
@@ -9,3 +11,15 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "asyncio: mark test as async"
     )
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_data_dir(tmp_path_factory):
+    """Keep tests that fall back to the default data dir out of ./data."""
+    previous = os.environ.get("CORTEX_DATA_DIR")
+    os.environ["CORTEX_DATA_DIR"] = str(tmp_path_factory.mktemp("cortex_data"))
+    yield
+    if previous is None:
+        os.environ.pop("CORTEX_DATA_DIR", None)
+    else:
+        os.environ["CORTEX_DATA_DIR"] = previous
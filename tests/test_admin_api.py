@@ -44,6 +44,36 @@ class TestPasswordHashing:
         h = hash_password("secret123")
         assert not verify_password("wrong", h)
 
+    def test_repeat_verify_skips_bcrypt(self):
+        from unittest.mock import patch
+
+        import cortex.auth as auth
+
+        h = hash_password("secret123")
+        assert verify_password("secret123", h)
+        with patch.object(auth.bcrypt, "checkpw") as m_check:
+            assert verify_password("secret123", h)
+            m_check.assert_not_called()
+            # Wrong passwords and other hashes still go to bcrypt
+            m_check.return_value = False
+            assert not verify_password("wrong", h)
+            assert not verify_password("secret123", hash_password("secret123"))
+            assert m_check.call_count == 2
+
+    def test_verify_cache_expires(self):
+        import time
+        from unittest.mock import patch
+
+        import cortex.auth as auth
+
+        h = hash_password("secret123")
+        assert verify_password("secret123", h)
+        later = time.monotonic() + auth._VERIFY_CACHE_TTL + 1
+        with patch.object(auth.time, "monotonic", return_value=later), \
+                patch.object(auth.bcrypt, "checkpw", return_value=True) as m_check:
+            assert verify_password("secret123", h)
+        m_check.assert_called_once()
+
 
 class TestJWT:
     def test_create_and_decode(self):
@@ -57,6 +87,33 @@ class TestJWT:
         with pytest.raises(HTTPException):
             decode_token("garbage.token.here")
 
+    def test_repeat_decode_is_cached(self):
+        from unittest.mock import patch
+
+        import cortex.auth as auth
+
+        token = create_token(1, "admin")
+        first = decode_token(token)
+        with patch.object(auth.jwt, "decode") as m_decode:
+            assert decode_token(token) == first
+        m_decode.assert_not_called()
+
+    def test_cached_token_rechecked_after_expiry(self):
+        from unittest.mock import patch
+
+        from fastapi import HTTPException
+
+        import cortex.auth as auth
+
+        token = create_token(1, "admin")
+        payload = decode_token(token)
+        expired = HTTPException(status_code=401, detail="Token expired")
+        with patch.object(auth.time, "time", return_value=payload["exp"] + 1), \
+                patch.object(auth, "_decode_token", side_effect=expired) as m_decode:
+            with pytest.raises(HTTPException, match="expired"):
+                decode_token(token)
+        m_decode.assert_called_once_with(token)
+
 
 class TestSeedAdmin:
     def test_seeds_default_admin(self, db):
@@ -71,6 +128,19 @@ class TestSeedAdmin:
         count = db.execute("SELECT COUNT(*) FROM admin_users").fetchone()[0]
         assert count == 1
 
+    def test_default_hash_computed_once(self, tmp_path):
+        from unittest.mock import patch
+        from cortex import auth
+
+        auth._default_admin_hash.cache_clear()
+        with patch.object(auth, "hash_password", wraps=hash_password) as m_hash:
+            for name in ("a.db", "b.db"):
+                init_db(tmp_path / name)
+                conn = sqlite3.connect(str(tmp_path / name))
+                seed_admin(conn)
+                assert conn.execute("SELECT COUNT(*) FROM admin_users").fetchone()[0] == 1
+        assert m_hash.call_count == 1
+
 
 class TestAuthenticate:
     def test_valid_login(self, db):
@@ -88,6 +158,116 @@ class TestAuthenticate:
         assert authenticate(db, "nobody", "anything") is None
 
 
+class TestDbHelper:
+    def test_init_runs_once_per_path(self, db_path):
+        from unittest.mock import patch
+        from cortex.admin import helpers
+
+        helpers._ready_paths.discard(db_path)
+        with patch.object(helpers, "init_db") as m_init, \
+             patch.object(helpers, "seed_admin") as m_seed:
+            helpers._db()
+            helpers._db()
+        assert m_init.call_count == 1
+        assert m_seed.call_count == 1
+
+    def test_settings_cached_and_written_through(self, db_path, db):
+        from cortex.admin import helpers
+
+        assert "theme" not in helpers._settings()
+        # Out-of-band writes are not seen: reads come from memory
+        db.execute("INSERT INTO system_settings (key, value) VALUES ('theme', 'raw')")
+        db.commit()
+        assert "theme" not in helpers._settings()
+
+        helpers._put_setting("theme", "dark")
+        assert helpers._settings()["theme"] == "dark"
+        row = db.execute("SELECT value FROM system_settings WHERE key = 'theme'").fetchone()
+        assert row["value"] == "dark"
+
+    def test_settings_reloaded_after_invalidation(self, db_path, db):
+        from cortex.admin import helpers
+
+        assert "theme" not in helpers._settings()
+        db.execute("INSERT INTO system_settings (key, value) VALUES ('theme', 'raw')")
+        db.commit()
+        helpers.invalidate_response_cache(frozenset({"jailbreak_patterns"}))
+        assert "theme" not in helpers._settings()
+        helpers.invalidate_response_cache(frozenset({"system_settings"}))
+        assert helpers._settings()["theme"] == "raw"
+
+    def test_update_sql_memoised(self):
+        from cortex.admin import helpers
+
+        sql = helpers._update_sql("user_profiles", ("age", "display_name"), "user_id")
+        assert sql == "UPDATE user_profiles SET age = ?, display_name = ? WHERE user_id = ?"
+        assert helpers._update_sql("user_profiles", ("age", "display_name"), "user_id") is sql
+
+    def test_rows_fixed_matches_rows(self):
+        from cortex.admin import helpers
+
+        conn = sqlite3.connect(":memory:")
+        conn.row_factory = sqlite3.Row
+        sql = "SELECT 1 AS a, 'x' AS b UNION ALL SELECT 2, 'y'"
+        fixed = helpers._rows_fixed(conn.execute(sql), ("a", "b"))
+        assert fixed == helpers._rows(conn.execute(sql))
+        assert fixed == [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}]
+
+    def test_row_helpers_without_result_set(self):
+        from cortex.admin import helpers
+
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE t (a)")
+        assert helpers._rows(conn.execute("INSERT INTO t VALUES (1)")) == []
+        assert helpers._row(conn.execute("INSERT INTO t VALUES (2)")) is None
+        assert helpers._row(conn.execute("SELECT a FROM t WHERE a = 3")) is None
+        assert helpers._row(conn.execute("SELECT a FROM t ORDER BY a")) == {"a": 1}
+
+    def test_filters_skip_unset_values(self):
+        from cortex.admin import helpers
+
+        cols, params = helpers._filters(("a", None), ("b", ""), ("c", False), ("d", "x"))
+        assert cols == ("c", "d")
+        assert params == [False, "x"]
+
+    def test_list_sql_memoised(self):
+        from cortex.admin import helpers
+
+        count_sql, page_sql = helpers._list_sql("t", ("a", "b"), "id DESC")
+        assert count_sql == "SELECT COUNT(*) FROM t WHERE a = ? AND b = ?"
+        assert page_sql == (
+            "SELECT * FROM t WHERE a = ? AND b = ? ORDER BY id DESC LIMIT ? OFFSET ?"
+        )
+        assert helpers._list_sql("t", (), "id DESC")[0] == "SELECT COUNT(*) FROM t WHERE 1=1"
+        assert helpers._list_sql("t", ("a", "b"), "id DESC")[1] is page_sql
+
+    def test_read_snapshot_wraps_one_transaction(self):
+        from cortex.admin import helpers
+
+        conn = sqlite3.connect(":memory:")
+        with helpers._read_snapshot(conn):
+            assert conn.in_transaction
+            conn.execute("SELECT 1").fetchall()
+        assert not conn.in_transaction
+
+    def test_read_snapshot_reuses_open_transaction(self):
+        from cortex.admin import helpers
+
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE t (x)")
+        conn.execute("INSERT INTO t VALUES (1)")
+        with helpers._read_snapshot(conn):
+            pass
+        assert conn.in_transaction  # caller's pending write left alone
+
+    def test_new_path_reinitialises(self, tmp_path):
+        from cortex.admin import helpers
+
+        set_db_path(tmp_path / "other.db")
+        conn = helpers._db()
+        assert conn.execute("SELECT COUNT(*) FROM admin_users").fetchone()[0] == 1
+
+
 # ── Admin API integration tests ───────────────────────────────────
 
 @pytest.fixture()
@@ -152,6 +332,16 @@ class TestDashboardEndpoint:
         assert "total_users" in data
         assert "total_interactions" in data
 
+    def test_dashboard_counts(self, client, auth_header, db):
+        db.execute("INSERT INTO user_profiles (user_id, display_name) VALUES ('u1', 'A')")
+        db.execute("INSERT INTO jailbreak_patterns (pattern) VALUES ('x.*y')")
+        db.commit()
+        data = client.get("/admin/dashboard", headers=auth_header).json()
+        assert data["total_users"] == 1
+        assert data["jailbreak_patterns"] == 1
+        assert data["devices"] == 0
+        assert data["voice_enrollments"] == 0
+
 
 class TestUsersEndpoint:
     def _insert_user(self, db_path, user_id="u1", name="Derek"):
@@ -194,11 +384,47 @@ class TestUsersEndpoint:
         assert resp.status_code == 200
         assert resp.json()["vocabulary_level"] == "advanced"
 
+    def test_update_user_touches_updated_at(self, client, auth_header, db_path):
+        self._insert_user(db_path)
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("UPDATE user_profiles SET updated_at = '2000-01-01 00:00:00'")
+        conn.commit()
+        conn.close()
+        resp = client.patch(
+            "/admin/users/u1", json={"display_name": "D"}, headers=auth_header
+        )
+        assert resp.json()["updated_at"] > "2000-01-01 00:00:00"
+
     def test_delete_user(self, client, auth_header, db_path):
         self._insert_user(db_path)
         resp = client.delete("/admin/users/u1", headers=auth_header)
         assert resp.status_code == 200
 
+    def test_delete_user_clears_dependent_rows(self, client, auth_header, db_path, db):
+        self._insert_user(db_path, "parent")
+        self._insert_user(db_path)
+        db.execute("INSERT INTO emotional_profiles (user_id) VALUES ('u1')")
+        db.execute("INSERT INTO user_topics (user_id, topic) VALUES ('u1', 'space')")
+        db.execute(
+            "INSERT INTO parental_controls (child_user_id, parent_user_id) VALUES ('u1', 'parent')"
+        )
+        db.execute(
+            "INSERT INTO parental_restricted_actions (child_user_id, action) VALUES ('u1', 'x')"
+        )
+        db.commit()
+        resp = client.delete("/admin/users/u1", headers=auth_header)
+        assert resp.status_code == 200
+        for table, col in [
+            ("user_profiles", "user_id"), ("emotional_profiles", "user_id"),
+            ("user_topics", "user_id"), ("parental_controls", "child_user_id"),
+            ("parental_restricted_actions", "child_user_id"),
+        ]:
+            count = db.execute(f"SELECT COUNT(*) FROM {table} WHERE {col} = 'u1'").fetchone()[0]
+            assert count == 0, table
+        assert db.execute(
+            "SELECT COUNT(*) FROM user_profiles WHERE user_id = 'parent'"
+        ).fetchone()[0] == 1
+
 
 class TestSafetyEndpoints:
     def test_list_events_empty(self, client, auth_header):
@@ -223,6 +449,179 @@ class TestSafetyEndpoints:
         assert resp.status_code == 200
 
 
+class TestETag:
+    def test_get_sets_etag(self, client, auth_header):
+        resp = client.get("/admin/safety/patterns", headers=auth_header)
+        assert resp.status_code == 200
+        assert resp.headers["etag"].startswith('"')
+
+    def test_matching_etag_returns_304(self, client, auth_header):
+        etag = client.get("/admin/system/models", headers=auth_header).headers["etag"]
+        resp = client.get(
+            "/admin/system/models", headers={**auth_header, "If-None-Match": etag}
+        )
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["etag"] == etag
+
+    def test_changed_body_gets_new_etag(self, client, auth_header):
+        etag = client.get("/admin/safety/patterns", headers=auth_header).headers["etag"]
+        client.post("/admin/safety/patterns", json={"pattern": "new.*"}, headers=auth_header)
+        resp = client.get(
+            "/admin/safety/patterns", headers={**auth_header, "If-None-Match": etag}
+        )
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
+
+
+class TestResponseClass:
+    def test_admin_routes_render_with_orjson(self, client, auth_header):
+        from unittest.mock import patch
+        from cortex.admin.helpers import ORJSONResponse
+
+        rendered = []
+        original = ORJSONResponse.render
+
+        def spy(self, content):
+            rendered.append(content)
+            return original(self, content)
+
+        with patch.object(ORJSONResponse, "render", spy):
+            resp = client.get("/admin/dashboard", headers=auth_header)
+        assert resp.status_code == 200
+        assert rendered and "total_users" in rendered[0]
+
+    def test_render_non_str_keys(self):
+        from cortex.admin.helpers import ORJSONResponse
+
+        assert ORJSONResponse({1: "a"}).body == b'{"1":"a"}'
+
+
+class TestResponseCache:
+    def test_cached_until_write(self, client, auth_header, db):
+        assert client.get("/admin/dashboard", headers=auth_header).json()["total_users"] == 0
+        db.execute("INSERT INTO user_profiles (user_id, display_name) VALUES ('u1', 'A')")
+        db.commit()
+        # Out-of-band insert is not visible until the TTL expires or an admin write
+        assert client.get("/admin/dashboard", headers=auth_header).json()["total_users"] == 0
+        client.post("/admin/safety/patterns", json={"pattern": "p.*"}, headers=auth_header)
+        data = client.get("/admin/dashboard", headers=auth_header).json()
+        assert data["total_users"] == 1
+        assert data["jailbreak_patterns"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_right_after_write_is_fresh(self, client, auth_header):
+        """A GET issued the moment a write's response arrives sees the write."""
+        from httpx import ASGITransport, AsyncClient
+
+        app, seen = client.app, []
+
+        async def get_patterns():
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as ac:
+                resp = await ac.get("/admin/safety/patterns", headers=auth_header)
+            return [p["pattern"] for p in resp.json()["patterns"]]
+
+        async def get_after_post(scope, receive, send):
+            async def wrapped(message):
+                await send(message)
+                if (scope["method"] == "POST" and message["type"] == "http.response.body"
+                        and not message.get("more_body")):
+                    seen.append(await get_patterns())
+            await app(scope, receive, wrapped)
+
+        assert await get_patterns() == []
+        async with AsyncClient(transport=ASGITransport(app=get_after_post), base_url="http://t") as ac:
+            resp = await ac.post("/admin/safety/patterns", json={"pattern": "p.*"}, headers=auth_header)
+        assert resp.status_code == 200
+        assert seen == [["p.*"]]
+
+    def test_write_keeps_unrelated_entries(self, client, auth_header, db):
+        assert client.get("/admin/system/backups", headers=auth_header).json()["backups"] == []
+        db.execute(
+            "INSERT INTO backup_log (backup_type, archive_path) VALUES ('full', '/tmp/b.tar.gz')"
+        )
+        db.commit()
+        # Safety writes touch jailbreak_patterns only, so backups stay cached
+        client.post("/admin/safety/patterns", json={"pattern": "p.*"}, headers=auth_header)
+        assert client.get("/admin/system/backups", headers=auth_header).json()["backups"] == []
+
+    def test_invalidate_by_table(self):
+        from cortex.admin import helpers
+
+        helpers._response_cache.clear()
+        reads = helpers._response_reads
+        helpers._response_cache.update({
+            ("m", "reads_a", "db", ()): ("a", 1e18),
+            ("m", "reads_b", "db", ()): ("b", 1e18),
+            ("m", "undeclared", "db", ()): ("c", 1e18),
+        })
+        try:
+            reads[("m", "reads_a")] = frozenset({"a"})
+            reads[("m", "reads_b")] = frozenset({"b"})
+            helpers.invalidate_response_cache(frozenset({"a"}))
+            assert list(helpers._response_cache) == [("m", "reads_b", "db", ())]
+        finally:
+            reads.pop(("m", "reads_a"), None)
+            reads.pop(("m", "reads_b"), None)
+            helpers._response_cache.clear()
+
+    def test_expired_entry_refetched(self, client, auth_header, db):
+        from cortex.admin import helpers
+
+        client.get("/admin/system/backups", headers=auth_header)
+        for key, (data, _expiry) in list(helpers._response_cache.items()):
+            helpers._response_cache[key] = (data, 0.0)
+        db.execute(
+            "INSERT INTO backup_log (backup_type, archive_path) VALUES ('full', '/tmp/b.tar.gz')"
+        )
+        db.commit()
+        resp = client.get("/admin/system/backups", headers=auth_header)
+        assert len(resp.json()["backups"]) == 1
+
+    def test_cached_payload_is_immutable(self):
+        from cortex.admin import helpers
+
+        @helpers.cached_response()
+        def handler():
+            return {"items": [1]}
+
+        try:
+            first = handler()
+            first.body = b"{}"
+            assert handler().body == b'{"items":[1]}'
+            assert handler() is not handler()
+        finally:
+            helpers._response_cache.clear()
+
+    def test_result_computed_across_invalidation_not_stored(self):
+        from cortex.admin import helpers
+
+        calls = []
+
+        @helpers.cached_response()
+        def handler():
+            calls.append(1)
+            if len(calls) == 1:
+                helpers.invalidate_response_cache()  # a write lands mid-read
+            return {"n": len(calls)}
+
+        try:
+            assert handler().body == b'{"n":1}'
+            assert handler().body == b'{"n":2}'
+            assert handler().body == b'{"n":2}'
+        finally:
+            helpers._response_cache.clear()
+
+    def test_query_params_in_key(self, client, auth_header, db):
+        db.executemany(
+            "INSERT INTO backup_log (backup_type, archive_path) VALUES ('full', ?)",
+            [(f"/tmp/b{i}.tar.gz",) for i in range(3)],
+        )
+        db.commit()
+        assert len(client.get("/admin/system/backups?limit=1", headers=auth_header).json()["backups"]) == 1
+        assert len(client.get("/admin/system/backups?limit=3", headers=auth_header).json()["backups"]) == 3
+
+
 class TestVoiceEndpoints:
     def test_list_speakers_empty(self, client, auth_header):
         resp = client.get("/admin/voice/speakers", headers=auth_header)
@@ -241,6 +640,22 @@ class TestDeviceEndpoints:
         assert resp.status_code == 200
         assert resp.json()["total"] == 0
 
+    def test_patterns_cursor_walk(self, client, auth_header, db):
+        db.executemany(
+            "INSERT INTO command_patterns (pattern, intent, hit_count) VALUES (?, 'x', ?)",
+            [(f"p{i}", hits) for i, hits in enumerate([3, 7, 3, 1, 7])],
+        )
+        db.commit()
+        seen, cursor = [], None
+        while True:
+            params = {"per_page": 2, **({"cursor": cursor} if cursor else {})}
+            body = client.get("/admin/devices/patterns", params=params, headers=auth_header).json()
+            seen += [(p["hit_count"], p["id"]) for p in body["patterns"]]
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+        assert seen == [(7, 5), (7, 2), (3, 3), (3, 1), (1, 4)]
+
 
 class TestEvolutionEndpoints:
     def test_list_profiles_empty(self, client, auth_header):
@@ -115,6 +115,19 @@ class TestEvolutionRuns:
         assert resp.status_code == 200
         assert resp.json()["total"] == 2
 
+    def test_list_runs_cursor_walk(self, client, auth_header, db_path):
+        for _ in range(3):
+            _insert_run(db_path, "analysis", "completed")
+        first = client.get("/admin/evolution/runs?per_page=2", headers=auth_header).json()
+        assert [r["id"] for r in first["runs"]] == [3, 2]
+        second = client.get(
+            "/admin/evolution/runs",
+            params={"per_page": 2, "cursor": first["next_cursor"]},
+            headers=auth_header,
+        ).json()
+        assert [r["id"] for r in second["runs"]] == [1]
+        assert second["next_cursor"] is None
+
     def test_list_runs_filter_type(self, client, auth_header, db_path):
         _insert_run(db_path, "analysis", "completed")
         _insert_run(db_path, "training", "running")
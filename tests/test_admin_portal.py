@@ -354,6 +354,21 @@ class TestUsersList:
         assert body["page"] == 1
         assert body["per_page"] == 2
 
+    async def test_list_cursor(self, client, auth_header, db_path):
+        for i in range(3):
+            _insert_user(db_path, f"u{i}", f"User{i}")
+        first = (await client.get(
+            "/admin/users", params={"per_page": 2}, headers=auth_header
+        )).json()
+        second = (await client.get(
+            "/admin/users",
+            params={"per_page": 2, "cursor": first["next_cursor"]},
+            headers=auth_header,
+        )).json()
+        ids = [u["user_id"] for u in first["users"] + second["users"]]
+        assert sorted(ids) == ["u0", "u1", "u2"]
+        assert second["next_cursor"] is None
+
     async def test_list_no_auth(self, client):
         resp = await client.get("/admin/users")
         assert resp.status_code == 401
@@ -533,6 +548,8 @@ class TestParentalControls:
         )
         assert resp.status_code == 200
         assert resp.json()["ok"] is True
+        assert resp.json()["controls"]["allowed_hours_start"] == "08:00"
+        assert resp.json()["controls"]["restricted_actions"] == ["device_control"]
 
         # Get controls
         resp2 = await client.get("/admin/users/child-1/parental", headers=auth_header)
@@ -563,6 +580,40 @@ class TestParentalControls:
         resp2 = await client.get("/admin/users/child-1/parental", headers=auth_header)
         assert resp2.json()["controls"]["content_filter_level"] == "moderate"
 
+    async def test_restricted_actions_replaced(self, client, auth_header, db_path):
+        _insert_user(db_path, "child-1", "Kid")
+        _insert_user(db_path, "p1", "Parent")
+        for actions in (["a", "b", "c"], ["c", "d"]):
+            await client.post(
+                "/admin/users/child-1/parental",
+                json={"parent_user_id": "p1", "restricted_actions": actions},
+                headers=auth_header,
+            )
+        resp = await client.get("/admin/users/child-1/parental", headers=auth_header)
+        assert sorted(resp.json()["controls"]["restricted_actions"]) == ["c", "d"]
+
+    async def test_delete_child_with_controls(self, client, auth_header, db_path, db):
+        _insert_user(db_path, "child-1", "Kid")
+        _insert_user(db_path, "p1", "Parent")
+        _insert_emotional_profile(db_path, "child-1")
+        await client.post(
+            "/admin/users/child-1/parental",
+            json={"parent_user_id": "p1", "restricted_actions": ["a"]},
+            headers=auth_header,
+        )
+        resp = await client.delete("/admin/users/child-1", headers=auth_header)
+        assert resp.status_code == 200
+        for table, col in (
+            ("user_profiles", "user_id"),
+            ("emotional_profiles", "user_id"),
+            ("parental_controls", "child_user_id"),
+            ("parental_restricted_actions", "child_user_id"),
+        ):
+            count = db.execute(
+                f"SELECT COUNT(*) FROM {table} WHERE {col} = 'child-1'"
+            ).fetchone()[0]
+            assert count == 0, table
+
     async def test_remove_controls(self, client, auth_header, db_path):
         _insert_user(db_path, "child-1", "Kid")
         _insert_user(db_path, "p1", "Parent")
@@ -641,6 +692,27 @@ class TestSafetyEvents:
         assert body["total"] == 5
         assert len(body["events"]) == 2
 
+    async def test_events_cursor_walk(self, client, auth_header, db_path):
+        for _ in range(5):
+            _insert_safety_event(db_path)
+        seen, cursor = [], None
+        while True:
+            params = {"per_page": 2, **({"cursor": cursor} if cursor else {})}
+            body = (await client.get(
+                "/admin/safety/events", params=params, headers=auth_header
+            )).json()
+            seen += [e["id"] for e in body["events"]]
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+        assert seen == [5, 4, 3, 2, 1]
+
+    async def test_events_bad_cursor(self, client, auth_header):
+        resp = await client.get(
+            "/admin/safety/events", params={"cursor": "!!"}, headers=auth_header
+        )
+        assert resp.status_code == 400
+
     async def test_events_no_auth(self, client):
         resp = await client.get("/admin/safety/events")
         assert resp.status_code == 401
@@ -710,6 +782,22 @@ class TestSafetyPatterns:
         resp = await client.get("/admin/safety/patterns")
         assert resp.status_code == 401
 
+    async def test_bulk_add_patterns(self, client, auth_header):
+        await client.post(
+            "/admin/safety/patterns", json={"pattern": "dup"}, headers=auth_header
+        )
+        resp = await client.post(
+            "/admin/safety/patterns/bulk",
+            json=[{"pattern": "a"}, {"pattern": "b", "source": "import"}, {"pattern": "dup"}],
+            headers=auth_header,
+        )
+        assert resp.status_code == 200
+        assert resp.json() == {"ok": True, "added": 2, "skipped": 1}
+        patterns = (await client.get("/admin/safety/patterns", headers=auth_header)).json()["patterns"]
+        by_pattern = {p["pattern"]: p for p in patterns}
+        assert set(by_pattern) == {"a", "b", "dup"}
+        assert by_pattern["b"]["source"] == "import"
+
 
 # ════════════════════════════════════════════════════════════════════
 # 6. VOICE / SPEAKERS (VoiceView)
@@ -754,6 +842,31 @@ class TestVoiceSpeakers:
         )
         assert resp.status_code == 400
 
+    async def test_update_speaker_invalid_threshold(self, client, auth_header, db_path):
+        _insert_user(db_path, "u1", "Derek")
+        _insert_speaker(db_path, "spk-1", "u1", "Derek")
+        resp = await client.patch(
+            "/admin/voice/speakers/spk-1",
+            json={"confidence_threshold": "high"},
+            headers=auth_header,
+        )
+        assert resp.status_code == 422
+
+    async def test_update_speaker_ignores_unknown_fields(self, client, auth_header, db, db_path):
+        _insert_user(db_path, "u1", "Derek")
+        _insert_speaker(db_path, "spk-1", "u1", "Derek")
+        resp = await client.patch(
+            "/admin/voice/speakers/spk-1",
+            json={"confidence_threshold": 0.9, "embedding": "x"},
+            headers=auth_header,
+        )
+        assert resp.status_code == 200
+        row = db.execute(
+            "SELECT confidence_threshold, embedding FROM speaker_profiles WHERE id = 'spk-1'"
+        ).fetchone()
+        assert row["confidence_threshold"] == 0.9
+        assert row["embedding"] == b"\x00" * 16
+
     async def test_delete_speaker(self, client, auth_header, db_path):
         _insert_user(db_path, "u1", "Derek")
         _insert_speaker(db_path, "spk-1", "u1", "Derek")
@@ -773,6 +886,13 @@ class TestVoiceSpeakers:
 class TestTTSVoices:
     """GET /admin/tts/voices — voice listing from TTS providers."""
 
+    @pytest.fixture(autouse=True)
+    async def _close_kokoro(self):
+        from cortex.voice.kokoro import close_kokoro_clients
+
+        yield
+        await close_kokoro_clients()
+
     async def test_list_tts_voices(self, client, auth_header):
         """Voices endpoint should return even when providers are offline."""
         resp = await client.get("/admin/tts/voices", headers=auth_header)
@@ -782,11 +902,471 @@ class TestTTSVoices:
         assert isinstance(body["voices"], list)
         assert "system_default" in body
 
+    async def test_providers_queried_concurrently(self, client, auth_header):
+        import asyncio
+        from unittest.mock import patch
+
+        from cortex.admin import tts
+
+        started = []
+
+        def _slow(name):
+            async def fetch():
+                started.append(name)
+                await asyncio.sleep(0.05)
+                # Every provider must have started before any one finishes
+                assert len(started) == 4
+                return [{"name": name}]
+            return fetch
+
+        with patch.object(tts, "_fetch_qwen_voices", _slow("q")), \
+                patch.object(tts, "_fetch_kokoro_voices", _slow("k")), \
+                patch.object(tts, "_fetch_orpheus_voices", _slow("o")), \
+                patch.object(tts, "_fetch_piper_voices", _slow("p")):
+            resp = await client.get("/admin/tts/voices", headers=auth_header)
+        assert resp.status_code == 200
+        assert [v["name"] for v in resp.json()["voices"]] == ["q", "k", "o", "p"]
+
     async def test_tts_voices_no_auth(self, client):
         resp = await client.get("/admin/tts/voices")
         assert resp.status_code == 401
 
 
+class TestTTSSatelliteStreaming:
+    """POST /admin/tts/preview with a satellite target streams chunks."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        from cortex.speech import tts_cache
+
+        tts_cache.clear()
+        yield
+        tts_cache.clear()
+
+    async def test_piper_chunks_forwarded_then_cached(self, client, auth_header):
+        import base64
+        import json
+        from unittest.mock import AsyncMock, patch
+
+        from cortex.admin import tts
+
+        from cortex.satellite.websocket import SatelliteConnection
+
+        ws = AsyncMock()
+        sat = SatelliteConnection(ws, "sat-1")
+        calls = []
+
+        async def fake_stream(text, voice, host, port, read_timeout):
+            calls.append(text)
+            info = {"rate": 22050, "width": 2, "channels": 1}
+            yield b"a" * 20000, info
+            yield b"b" * 10, info
+
+        with patch.object(tts, "_connected_satellites_ref", return_value={"sat-1": sat}), \
+                patch.object(tts, "_piper_stream", fake_stream):
+            for _ in range(2):
+                resp = await client.post(
+                    "/admin/tts/preview",
+                    json={"text": "hi", "target": "sat-1"},
+                    headers=auth_header,
+                )
+                assert resp.json() == {"sent": True, "bytes": 20010}
+
+        assert calls == ["hi"]  # second push served from the cache
+        frames = [json.loads(c.args[0]) for c in ws.send_text.await_args_list]
+        types = [f["type"] for f in frames]
+        # Live: 20000 bytes split at 16 KiB, then the 10-byte chunk
+        assert types[:5] == ["TTS_START", "TTS_CHUNK", "TTS_CHUNK", "TTS_CHUNK", "TTS_END"]
+        # Cached: one 20010-byte buffer, also split at 16 KiB
+        assert types[5:] == ["TTS_START", "TTS_CHUNK", "TTS_CHUNK", "TTS_END"]
+        pcm = b"".join(base64.b64decode(f["audio"]) for f in frames[:5] if "audio" in f)
+        assert pcm == b"a" * 20000 + b"b" * 10
+
+    async def test_binary_audio_satellite_gets_binary_frames(self, client, auth_header):
+        import json
+        from unittest.mock import AsyncMock, patch
+
+        from cortex.admin import tts
+        from cortex.satellite.websocket import SatelliteConnection
+
+        ws = AsyncMock()
+        sat = SatelliteConnection(ws, "sat-1")
+        sat.binary_audio = True
+
+        async def fake_stream(text, voice, host, port, read_timeout):
+            yield b"a" * 20000, {"rate": 22050, "width": 2, "channels": 1}
+
+        with patch.object(tts, "_connected_satellites_ref", return_value={"sat-1": sat}), \
+                patch.object(tts, "_piper_stream", fake_stream):
+            resp = await client.post(
+                "/admin/tts/preview",
+                json={"text": "hi", "target": "sat-1"},
+                headers=auth_header,
+            )
+        assert resp.json() == {"sent": True, "bytes": 20000}
+
+        control = [json.loads(c.args[0])["type"] for c in ws.send_text.await_args_list]
+        assert control == ["TTS_START", "TTS_END"]
+        frames = [c.args[0] for c in ws.send_bytes.await_args_list]
+        assert [len(f) for f in frames] == [16385, 3617]
+        assert all(f[:1] == b"\x01" for f in frames)
+        assert b"".join(f[1:] for f in frames) == b"a" * 20000
+
+    async def test_piper_fallback_not_cached_for_orpheus_voice(self, client, auth_header):
+        from unittest.mock import AsyncMock, patch
+
+        from cortex.admin import tts
+        from cortex.satellite.websocket import SatelliteConnection
+
+        sat = SatelliteConnection(AsyncMock(), "sat-1")
+        calls = []
+
+        async def broken_orpheus(text, voice):
+            raise RuntimeError("orpheus down")
+            yield
+
+        async def fake_stream(text, voice, host, port, read_timeout):
+            calls.append(text)
+            yield b"p" * 10, {"rate": 22050, "width": 2, "channels": 1}
+
+        with patch.object(tts, "_connected_satellites_ref", return_value={"sat-1": sat}), \
+                patch.object(tts, "_preview_backend", return_value="orpheus"), \
+                patch.object(tts, "_orpheus_stream", broken_orpheus), \
+                patch.object(tts, "_piper_stream", fake_stream):
+            for _ in range(2):
+                resp = await client.post(
+                    "/admin/tts/preview",
+                    json={"text": "hi", "voice": "orpheus_tara", "target": "sat-1"},
+                    headers=auth_header,
+                )
+                assert resp.json() == {"sent": True, "bytes": 10}
+
+        # Piper stood in both times; its audio was never cached as Orpheus
+        assert calls == ["hi", "hi"]
+
+    async def test_orpheus_failing_mid_stream_resends_with_piper(self, client, auth_header):
+        import json
+        from unittest.mock import AsyncMock, patch
+
+        from cortex.admin import tts
+        from cortex.satellite.websocket import SatelliteConnection
+        from cortex.speech import tts_cache
+
+        ws = AsyncMock()
+        sat = SatelliteConnection(ws, "sat-1")
+
+        async def dying_orpheus(text, voice):
+            yield b"o" * 10, {"rate": 24000, "width": 2, "channels": 1}
+            raise RuntimeError("orpheus died")
+
+        piper = AsyncMock(return_value=(b"p" * 30, 22050, 2, 1))
+        with patch.object(tts, "_connected_satellites_ref", return_value={"sat-1": sat}), \
+                patch.object(tts, "_preview_backend", return_value="orpheus"), \
+                patch.object(tts, "_orpheus_stream", dying_orpheus), \
+                patch.object(tts, "_synthesize_piper", piper):
+            resp = await client.post(
+                "/admin/tts/preview",
+                json={"text": "hi", "voice": "orpheus_tara", "target": "sat-1"},
+                headers=auth_header,
+            )
+        assert resp.status_code == 200
+        assert resp.json() == {"sent": True, "bytes": 30}
+        types = [json.loads(c.args[0])["type"] for c in ws.send_text.await_args_list]
+        # Truncated Orpheus clip, then the full Piper clip
+        assert types == ["TTS_START", "TTS_CHUNK", "TTS_END", "TTS_START", "TTS_CHUNK", "TTS_END"]
+        assert tts_cache.get(tts_cache.cache_key("preview", "hi", "orpheus_tara")) is None
+
+    async def test_piper_failing_mid_stream_is_502(self, client, auth_header):
+        from unittest.mock import AsyncMock, patch
+
+        from cortex.admin import tts
+        from cortex.satellite.websocket import SatelliteConnection
+
+        sat = SatelliteConnection(AsyncMock(), "sat-1")
+
+        async def dying_piper(text, voice, host, port, read_timeout):
+            yield b"p" * 10, {"rate": 22050, "width": 2, "channels": 1}
+            raise ConnectionError("piper died")
+
+        with patch.object(tts, "_connected_satellites_ref", return_value={"sat-1": sat}), \
+                patch.object(tts, "_piper_stream", dying_piper):
+            resp = await client.post(
+                "/admin/tts/preview",
+                json={"text": "hi", "target": "sat-1"},
+                headers=auth_header,
+            )
+        assert resp.status_code == 502
+
+    async def test_synthesis_overlaps_send(self):
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from cortex.admin.tts import _stream_to_satellite
+
+        events = []
+
+        async def chunks():
+            for i in range(3):
+                events.append(f"synth{i}")
+                yield bytes([i])
+
+        async def slow_send(pcm):
+            events.append(f"send{pcm[0]}")
+            await asyncio.sleep(0.01)
+
+        conn = AsyncMock()
+        conn.send_audio_chunk = slow_send
+        data = await _stream_to_satellite(conn, 22050, 2, 1, chunks())
+        assert data == b"\x00\x01\x02"
+        # Later chunks were synthesized while the first was still sending
+        assert events.index("synth2") < events.index("send1")
+
+    async def test_synthesis_error_still_ends_stream(self):
+        import json
+        from unittest.mock import AsyncMock
+
+        from cortex.admin.tts import _stream_to_satellite
+
+        async def chunks():
+            yield b"a"
+            raise RuntimeError("backend died")
+
+        conn = AsyncMock()
+        with pytest.raises(RuntimeError, match="backend died"):
+            await _stream_to_satellite(conn, 22050, 2, 1, chunks())
+        conn.send_audio_chunk.assert_awaited_once()
+        assert json.loads(conn.send_raw.await_args_list[-1].args[0]) == {"type": "TTS_END"}
+
+    async def test_failed_send_closes_backend_stream(self):
+        from unittest.mock import AsyncMock
+
+        from cortex.admin.tts import _stream_to_satellite
+
+        closed = []
+
+        async def chunks():
+            try:
+                while True:
+                    yield b"a"
+            finally:
+                closed.append(True)
+
+        conn = AsyncMock()
+        conn.send_audio_chunk.side_effect = ConnectionError("satellite gone")
+        # TTS_START goes out, then the TTS_END on the dead socket fails too
+        conn.send_raw.side_effect = [None, ConnectionError("still gone")]
+        with pytest.raises(ConnectionError, match="satellite gone"):
+            await _stream_to_satellite(conn, 22050, 2, 1, chunks())
+        assert closed == [True]
+
+    def test_tts_start_frame_cached(self):
+        import json
+
+        from cortex.admin.tts import _tts_start_frame
+
+        frame = _tts_start_frame(22050, "pcm_22050_16bit_1ch")
+        assert frame is _tts_start_frame(22050, "pcm_22050_16bit_1ch")
+        assert json.loads(frame) == {
+            "type": "TTS_START", "sample_rate": 22050, "format": "pcm_22050_16bit_1ch",
+        }
+
+    async def test_hedged_preview_takes_first_audio(self, monkeypatch):
+        import asyncio
+        from unittest.mock import patch
+
+        from cortex.admin import tts
+
+        cancelled = []
+
+        async def slow_orpheus(text, voice):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append("orpheus")
+                raise
+            return b"o", 24000, 2, 1
+
+        async def fast_piper(text, voice):
+            return b"p", 22050, 2, 1
+
+        monkeypatch.setenv("TTS_HEDGE", "1")
+        with patch.object(tts, "_synthesize_orpheus", slow_orpheus), \
+                patch.object(tts, "_synthesize_piper", fast_piper):
+            assert await tts._synthesize_preview("hi", None) == (b"p", 22050, 2, 1)
+            await asyncio.sleep(0)
+            assert cancelled == ["orpheus"]
+
+            # A specific voice keeps the single-backend path
+            monkeypatch.setattr(tts, "_synthesize_orpheus", fast_piper)
+            entry = await tts._synthesize_preview("hi", "orpheus_tara")
+            assert entry[0] == b"p"
+
+    async def test_failed_owner_backend_returns_no_audio(self):
+        from unittest.mock import AsyncMock, patch
+
+        from cortex.admin import tts
+
+        piper = AsyncMock(return_value=(b"p", 22050, 2, 1))
+        with patch.object(tts, "_preview_backend", return_value="orpheus"), \
+                patch.object(tts, "_synthesize_orpheus", AsyncMock(side_effect=RuntimeError("down"))), \
+                patch.object(tts, "_synthesize_piper", piper):
+            entry = await tts._synthesize_preview("hi", "orpheus_tara")
+            assert entry[0] == b""
+            piper.assert_not_awaited()
+            # The Piper stand-in comes from the caller, outside the cache
+            assert await tts._synthesize_fallback("hi", "orpheus_tara") == (b"p", 22050, 2, 1)
+
+    async def test_first_result_skips_failures_and_empty(self):
+        from cortex.admin.tts import _first_result
+
+        async def boom():
+            raise RuntimeError("down")
+
+        async def empty():
+            return b""
+
+        async def audio():
+            return b"x"
+
+        assert await _first_result(boom(), empty(), audio()) == b"x"
+        assert await _first_result(boom(), empty()) == b""
+        with pytest.raises(RuntimeError):
+            await _first_result(boom())
+
+    async def test_hedge_loser_stream_is_closed(self):
+        from cortex.admin.tts import _close_stream, _first_result, _open_stream
+
+        closed = []
+
+        async def backend(name):
+            try:
+                yield name.encode(), {"rate": 22050, "width": 2, "channels": 1}
+                yield b"more", {"rate": 22050, "width": 2, "channels": 1}
+            finally:
+                closed.append(name)
+
+        info, chunks = await _first_result(
+            _open_stream(backend("orpheus")), _open_stream(backend("piper")),
+            discard=_close_stream,
+        )
+        # The loser had opened its stream too; it is closed, the winner is not
+        assert closed == ["piper"]
+        assert [c async for c in chunks] == [b"orpheus", b"more"]
+        assert closed == ["piper", "orpheus"]
+
+    def test_endpoint_env_fallback_and_cache(self, monkeypatch):
+        from cortex.admin.tts import _endpoint, _reset_endpoints
+
+        monkeypatch.delenv("PIPER_HOST", raising=False)
+        monkeypatch.delenv("PIPER_PORT", raising=False)
+        monkeypatch.setenv("TTS_HOST", "tts-box")
+        monkeypatch.setenv("TTS_PORT", "10300")
+        _reset_endpoints()
+        try:
+            assert _endpoint("piper") == ("tts-box", 10300)
+            monkeypatch.setenv("PIPER_HOST", "piper-box")
+            assert _endpoint("piper") == ("tts-box", 10300)  # cached
+            _reset_endpoints()
+            assert _endpoint("piper") == ("piper-box", 10300)
+        finally:
+            monkeypatch.undo()
+            _reset_endpoints()
+
+    def test_preview_backend_routing(self):
+        from cortex.admin.tts import _preview_backend
+
+        assert _preview_backend("tara") == "orpheus"
+        assert _preview_backend("orpheus_zoe") == "orpheus"
+        assert _preview_backend("af_bella") == "kokoro"
+        assert _preview_backend("en_US-lessac-medium") == "piper"
+        assert _preview_backend(None) == "piper"
+
+    def test_split_wav_header(self):
+        import io
+        import wave
+
+        from cortex.admin.tts import _split_wav_header
+
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(24000)
+            wf.writeframes(b"\x01\x02" * 8)
+        info, pcm = _split_wav_header(buf.getvalue())
+        assert info == {"channels": 1, "rate": 24000, "width": 2}
+        assert pcm == b"\x01\x02" * 8
+
+    def test_wav_bytes_matches_wave_module(self):
+        import io
+        import wave
+
+        from cortex.admin.tts import _wav_bytes
+
+        pcm = b"\x01\x02\x03\x04" * 10
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as wf:
+            wf.setnchannels(2)
+            wf.setsampwidth(2)
+            wf.setframerate(22050)
+            wf.writeframes(pcm)
+        assert _wav_bytes(pcm, 22050, 2, 2) == buf.getvalue()
+
+
+class TestTTSFillerPreview:
+    """POST /admin/tts/filler_preview"""
+
+    async def test_serves_prewarmed_filler(self, client, auth_header):
+        import io
+        import wave
+        from unittest.mock import AsyncMock, patch
+
+        from cortex.admin import tts
+        from cortex.filler.cache import CachedFiller, FillerCache
+
+        warm = FillerCache()
+        warm._cache["greeting"] = [CachedFiller("Hey there!", b"\x00\x01" * 50, 24000, 4.2)]
+        warm._initialized = True
+        warm.voice = "af_bella"
+        synth = AsyncMock()
+        with patch("cortex.filler.cache.get_filler_cache", return_value=warm), \
+                patch.object(tts, "_synthesize_filler", synth):
+            resp = await client.post(
+                "/admin/tts/filler_preview",
+                json={"sentiment": "greeting", "voice": "af_bella"},
+                headers=auth_header,
+            )
+        assert resp.status_code == 200
+        synth.assert_not_awaited()
+        with wave.open(io.BytesIO(resp.content), "rb") as wf:
+            assert wf.getframerate() == 24000
+            assert wf.readframes(wf.getnframes()) == b"\x00\x01" * 50
+
+    async def test_other_voice_synthesizes(self, client, auth_header):
+        from unittest.mock import AsyncMock, patch
+
+        from cortex.admin import tts
+        from cortex.filler.cache import CachedFiller, FillerCache
+        from cortex.speech import tts_cache
+
+        tts_cache.clear()
+        warm = FillerCache()
+        warm._cache["greeting"] = [CachedFiller("Hey there!", b"\x00\x01", 24000, 0.1)]
+        warm._initialized = True
+        warm.voice = "af_bella"
+        synth = AsyncMock(return_value=(b"\x02\x03", 22050, 2, 1))
+        with patch("cortex.filler.cache.get_filler_cache", return_value=warm), \
+                patch.object(tts, "_synthesize_filler", synth):
+            resp = await client.post(
+                "/admin/tts/filler_preview",
+                json={"sentiment": "greeting", "voice": "en_US-lessac"},
+                headers=auth_header,
+            )
+        tts_cache.clear()
+        assert resp.status_code == 200
+        synth.assert_awaited_once()
+
+
 class TestTTSDefaultVoice:
     """PUT /admin/tts/default_voice"""
 
@@ -799,6 +1379,24 @@ class TestTTSDefaultVoice:
         assert resp.status_code == 200
         assert resp.json()["default_voice"] == "af_bella"
 
+    async def test_default_voice_round_trip(self, client, auth_header):
+        from unittest.mock import AsyncMock, patch
+
+        from cortex.admin import tts
+
+        empty = AsyncMock(return_value=[])
+        with patch.object(tts, "_regenerate_cache_for_voice", AsyncMock()), \
+                patch.object(tts, "_fetch_qwen_voices", empty), \
+                patch.object(tts, "_fetch_kokoro_voices", empty), \
+                patch.object(tts, "_fetch_piper_voices", empty):
+            await client.put(
+                "/admin/tts/default_voice", json={"voice": "am_adam"}, headers=auth_header
+            )
+            voices = await client.get("/admin/tts/voices", headers=auth_header)
+            regen = await client.post("/admin/tts/regenerate", json={}, headers=auth_header)
+        assert voices.json()["system_default"] == "am_adam"
+        assert regen.json()["voice"] == "am_adam"
+
     async def test_set_default_voice_no_auth(self, client):
         resp = await client.put(
             "/admin/tts/default_voice", json={"voice": "af_bella"}
@@ -1044,6 +1642,24 @@ class TestDevices:
         body = resp.json()
         assert body["total"] == 2
 
+    async def test_aliases_attached_per_device(self, client, auth_header, db):
+        db.execute(
+            "INSERT INTO ha_devices (entity_id, friendly_name, domain) VALUES "
+            "('light.kitchen', 'Kitchen Light', 'light'), ('switch.fan', 'Fan', 'switch')"
+        )
+        db.execute(
+            "INSERT INTO device_aliases (entity_id, alias, source) VALUES "
+            "('light.kitchen', 'kitchen', 'manual'), ('light.kitchen', 'cooker light', 'nightly')"
+        )
+        db.commit()
+        resp = await client.get("/admin/devices", headers=auth_header)
+        devices = {d["entity_id"]: d for d in resp.json()["devices"]}
+        assert sorted(a["alias"] for a in devices["light.kitchen"]["aliases"]) == [
+            "cooker light", "kitchen",
+        ]
+        assert devices["light.kitchen"]["aliases"][0].keys() == {"alias", "source"}
+        assert devices["switch.fan"]["aliases"] == []
+
     async def test_filter_by_domain(self, client, auth_header, db_path):
         _insert_device(db_path, "light.kitchen", "Kitchen Light", "light")
         _insert_device(db_path, "switch.fan", "Fan", "switch")
@@ -1087,6 +1703,7 @@ class TestDevicePatterns:
         )
         assert resp2.status_code == 200
         assert resp2.json()["ok"] is True
+        assert resp2.json()["pattern"]["intent"] == "toggle"
 
     async def test_delete_pattern(self, client, auth_header, db_path):
         _insert_device(db_path)
@@ -1160,6 +1777,16 @@ class TestSatellites:
         resp = await client.get("/admin/satellites")
         assert resp.status_code == 401
 
+    async def test_warm_satellite_manager(self):
+        from unittest.mock import AsyncMock, MagicMock
+        from cortex.admin.satellites import warm_satellite_manager
+
+        mock_mgr = MagicMock()
+        mock_mgr.get_discovered = AsyncMock(return_value=[])
+        with patch("cortex.admin.satellites._get_satellite_manager", return_value=mock_mgr):
+            await warm_satellite_manager()
+        mock_mgr.get_discovered.assert_awaited_once()
+
 
 # ════════════════════════════════════════════════════════════════════
 # 10. EVOLUTION (EvolutionView)
@@ -1184,6 +1811,20 @@ class TestEvolutionProfiles:
         assert body["total"] >= 1
         assert "top_topics" in body["profiles"][0]
 
+    async def test_top_topics_limited_per_user(self, client, auth_header, db):
+        for uid in ("u1", "u2"):
+            db.execute("INSERT INTO emotional_profiles (user_id) VALUES (?)", (uid,))
+        db.executemany(
+            "INSERT INTO user_topics (user_id, topic, mention_count) VALUES ('u1', ?, ?)",
+            [(f"t{i}", i) for i in range(7)],
+        )
+        db.execute("INSERT INTO user_topics (user_id, topic, mention_count) VALUES ('u2', 'x', 1)")
+        db.commit()
+        resp = await client.get("/admin/evolution/profiles", headers=auth_header)
+        profiles = {p["user_id"]: p for p in resp.json()["profiles"]}
+        assert [t["topic"] for t in profiles["u1"]["top_topics"]] == ["t6", "t5", "t4", "t3", "t2"]
+        assert profiles["u2"]["top_topics"] == [{"topic": "x", "mention_count": 1}]
+
     async def test_profiles_no_auth(self, client):
         resp = await client.get("/admin/evolution/profiles")
         assert resp.status_code == 401
@@ -1350,6 +1991,21 @@ class TestSystemInteractions:
         body = resp.json()
         assert body["total"] == 1
 
+    async def test_interactions_cursor(self, client, auth_header, db_path):
+        for i in range(3):
+            _insert_interaction(db_path, "u1", f"msg{i}", "layer1")
+        first = (await client.get(
+            "/admin/system/interactions", params={"per_page": 2}, headers=auth_header
+        )).json()
+        second = (await client.get(
+            "/admin/system/interactions",
+            params={"per_page": 2, "cursor": first["next_cursor"], "user_id": "u1"},
+            headers=auth_header,
+        )).json()
+        assert [i["message"] for i in first["interactions"]] == ["msg2", "msg1"]
+        assert [i["message"] for i in second["interactions"]] == ["msg0"]
+        assert second["next_cursor"] is None
+
     async def test_interactions_no_auth(self, client):
         resp = await client.get("/admin/system/interactions")
         assert resp.status_code == 401
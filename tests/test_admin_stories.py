@@ -134,6 +134,18 @@ class TestStoryList:
         assert len(stories) == 1
         assert stories[0]["genre"] == "mystery"
 
+    def test_filter_by_genre_and_age_group(self, client, auth_header, db_path):
+        _insert_story(db_path, "Mystery Manor", genre="mystery", age="child")
+        _insert_story(db_path, "Midnight Case", genre="mystery", age="teen")
+        _insert_story(db_path, "Teen Quest", genre="adventure", age="teen")
+        resp = client.get(
+            "/admin/stories?genre=mystery&age_group=teen", headers=auth_header
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total"] == 1
+        assert [s["title"] for s in data["stories"]] == ["Midnight Case"]
+
 
 class TestStoryDetail:
     def test_get_story(self, client, auth_header, db_path):
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import dataclasses
+
+import pytest
+
 from cortex.avatar import (
     EXPRESSIONS,
     VISEME_CATEGORIES,
@@ -160,6 +164,15 @@ class TestTextToVisemes:
         consonant_frame = next(f for f in frames if f.viseme not in {"AA", "EH", "IH", "OH", "OU", "IDLE"})
         assert vowel_frame.intensity > consonant_frame.intensity
 
+    def test_repeat_text_shares_frozen_frames(self):
+        state = AvatarState()
+        first = state.text_to_visemes("okay")
+        second = state.text_to_visemes("okay")
+        assert second is not first
+        assert second == first
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first[0].intensity = 1.0
+
 
 # ──────────────────────────────────────────────────────────────────
 # Expression from sentiment
@@ -203,6 +216,17 @@ class TestExpressionFromSentiment:
         expr = state.expression_from_sentiment("positive", 1.0)
         assert state.expression is expr
 
+    def test_expression_is_frozen_and_slotted(self):
+        expr = EXPRESSIONS["happy"]
+        assert not hasattr(expr, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            expr.mouth_smile = 0.0
+
+    def test_partial_confidence_is_shared(self):
+        state = AvatarState()
+        first = state.expression_from_sentiment("greeting", 0.5)
+        assert state.expression_from_sentiment("greeting", 0.501) is first
+
 
 # ──────────────────────────────────────────────────────────────────
 # AvatarState
@@ -0,0 +1,128 @@
+"""Tests for local backup creation and restore."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+
+import pytest
+
+from cortex.backup import (
+    _find_latest,
+    _read_archive,
+    create_backup,
+    list_backups,
+    restore_backup,
+)
+
+
+def _contents(path):
+    """Return (member names, BASE header text or None) for an archive."""
+    with _read_archive(path) as tar:
+        names, header = [], None
+        for member in tar:
+            names.append(member.name)
+            if member.name == "BASE":
+                header = tar.extractfile(member).read().decode()
+    return names, header
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    data = tmp_path / "data"
+    chroma = data / "cortex_chroma" / "seg"
+    chroma.mkdir(parents=True)
+    (chroma / "keep.bin").write_bytes(b"k" * 64)
+    (chroma / "grow.bin").write_bytes(b"g" * 64)
+    (chroma / "gone.bin").write_bytes(b"x" * 64)
+    conn = sqlite3.connect(str(data / "cortex.db"))
+    conn.execute("CREATE TABLE t (v INTEGER)")
+    conn.execute("INSERT INTO t VALUES (1)")
+    conn.commit()
+    conn.close()
+    monkeypatch.setenv("CORTEX_DATA_DIR", str(data))
+    return data
+
+
+class TestCreateBackup:
+    def test_full_backup_contains_db_and_chroma(self, data_dir):
+        path = create_backup("manual")
+        names, _ = _contents(path)
+        assert "cortex.db" in names
+        assert "cortex_chroma/seg/keep.bin" in names
+        assert (data_dir / "backups" / "manifest.json").exists()
+
+    def test_daily_after_full_is_delta(self, data_dir):
+        full = create_backup("manual")
+        seg = data_dir / "cortex_chroma" / "seg"
+        (seg / "grow.bin").write_bytes(b"g" * 128)
+        (seg / "gone.bin").unlink()
+
+        delta = create_backup("daily")
+        assert delta.name.startswith("cortex_daily_delta_")
+        names, header = _contents(delta)
+        assert names[0] == "BASE"
+        assert f"BASE={full.name}" in header
+        assert "DELETED=cortex_chroma/seg/gone.bin" in header
+        assert "cortex_chroma/seg/grow.bin" in names
+        assert "cortex_chroma/seg/keep.bin" not in names
+
+    def test_gzip_archive_without_zstd(self, data_dir, monkeypatch):
+        monkeypatch.setattr("cortex.backup._ARCHIVE_SUFFIX", ".tar.gz")
+        path = create_backup("manual")
+        assert path.name.endswith(".tar.gz")
+        assert "cortex.db" in _contents(path)[0]
+
+    def test_daily_without_manifest_is_full(self, data_dir):
+        path = create_backup("daily")
+        assert not path.name.startswith("cortex_daily_delta_")
+
+    def test_backup_is_logged(self, data_dir):
+        conn = sqlite3.connect(str(data_dir / "cortex.db"))
+        conn.execute(
+            "CREATE TABLE backup_log (id INTEGER PRIMARY KEY, archive_path TEXT NOT NULL, "
+            "backup_type TEXT NOT NULL, size_bytes INTEGER, duration_ms INTEGER, "
+            "success BOOLEAN DEFAULT TRUE, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+        )
+        conn.commit()
+        conn.close()
+
+        path = create_backup("manual")
+        [entry] = list_backups()
+        assert entry["archive_path"] == str(path)
+        assert entry["backup_type"] == "manual"
+        assert entry["size_bytes"] == path.stat().st_size
+
+
+class TestRestoreBackup:
+    def test_restore_delta_applies_base_first(self, data_dir):
+        create_backup("manual")
+        seg = data_dir / "cortex_chroma" / "seg"
+        (seg / "grow.bin").write_bytes(b"g" * 128)
+        (seg / "gone.bin").unlink()
+        delta = create_backup("daily")
+
+        (seg / "keep.bin").unlink()
+        (seg / "grow.bin").write_bytes(b"bad")
+        (seg / "gone.bin").write_bytes(b"stale")
+        restore_backup(delta)
+
+        assert (seg / "keep.bin").read_bytes() == b"k" * 64
+        assert (seg / "grow.bin").read_bytes() == b"g" * 128
+        assert not (seg / "gone.bin").exists()
+        assert not (data_dir / "BASE").exists()
+
+    def test_find_latest_sees_new_archive(self, data_dir):
+        assert _find_latest("manual") is None
+        first = create_backup("manual")
+        assert _find_latest("manual") == first
+        os.remove(first)
+        assert _find_latest("manual") is None
+
+    def test_restore_delta_without_base_fails(self, data_dir):
+        full = create_backup("manual")
+        (data_dir / "cortex_chroma" / "seg" / "grow.bin").write_bytes(b"g" * 128)
+        delta = create_backup("daily")
+        os.remove(full)
+        with pytest.raises(FileNotFoundError, match="Base archive"):
+            restore_backup(delta)
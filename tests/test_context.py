@@ -0,0 +1,105 @@
+"""Tests for context window budgeting and compaction."""
+
+from __future__ import annotations
+
+from cortex.context import (
+    ContextLimits,
+    compact_context,
+    limits_from_hardware,
+    summarize_checkpoint,
+    trim_history,
+)
+
+
+def _turns(*sizes: int) -> list[dict[str, str]]:
+    roles = ("user", "assistant")
+    return [
+        {"role": roles[i % 2], "content": f"Turn {i}." + "x" * (size * 4 - 7)}
+        for i, size in enumerate(sizes)
+    ]
+
+
+class TestTrimHistory:
+    def test_fits_returns_same_list(self):
+        history = _turns(10, 10)
+        assert trim_history(history, 100) is history
+
+    def test_drops_oldest_until_it_fits(self):
+        history = _turns(50, 30, 20, 10)
+        assert trim_history(history, 40) == history[2:]
+
+    def test_drops_everything_when_nothing_fits(self):
+        assert trim_history(_turns(50, 60), 10) == []
+
+
+class TestCompactContext:
+    def test_keeps_recent_turns_and_summarises_older(self):
+        history = _turns(40, 40, 40, 20, 20)
+        recent, checkpoint = compact_context(history, ContextLimits(default_context=100))
+        assert recent == history[3:]
+        assert checkpoint == "Turn 1."
+
+    def test_always_keeps_latest_turn(self):
+        history = _turns(10, 500)
+        recent, _ = compact_context(history, ContextLimits(default_context=100))
+        assert recent == history[1:]
+
+    def test_appends_to_existing_checkpoint(self):
+        history = _turns(40, 40, 40, 40)
+        _, checkpoint = compact_context(
+            history, ContextLimits(default_context=100), checkpoints=["Earlier."],
+        )
+        assert checkpoint == "Earlier. Turn 1."
+
+    def test_numpy_path_matches_python_path(self, monkeypatch):
+        history = _turns(*(7 * i % 50 + 2 for i in range(80)))
+        limits = ContextLimits(default_context=600)
+        expected = compact_context(history, limits)
+        monkeypatch.setattr("cortex.context._VECTORISE_MIN_TURNS", 1)
+        assert compact_context(history, limits) == expected
+        monkeypatch.setattr("cortex.context._VECTORISE_MIN_TURNS", 1000)
+        assert compact_context(history, limits) == expected
+
+
+class TestLimitsFromHardware:
+    def test_best_discrete_gpu_wins(self):
+        limits = limits_from_hardware({"gpus": [
+            {"vram_mb": 32000, "is_igpu": True},
+            {"vram_mb": 8000},
+            {"vram_mb": 16000},
+        ]})
+        assert limits.default_context == 16384
+        assert limits.recommended_model_class == "14B-30B"
+
+    def test_small_gpu_gets_lowest_tier(self):
+        limits = limits_from_hardware({"gpus": [{"vram_mb": 2000}]})
+        assert (limits.default_context, limits.thinking_context) == (2048, 4096)
+
+    def test_cpu_only(self):
+        limits = limits_from_hardware({})
+        assert limits.recommended_model_class == "3B-7B (Q4)"
+
+
+class _RecordingProvider:
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+
+    async def generate(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        return "summary"
+
+
+class TestSummarizeCheckpoint:
+    async def test_long_turns_are_truncated_in_prompt(self):
+        provider = _RecordingProvider()
+        history = [{"role": "assistant", "content": "Start." + "y" * 2000}]
+        assert await summarize_checkpoint(history, provider) == "summary"
+        assert "y" * 494 in provider.prompts[0]
+        assert "y" * 495 not in provider.prompts[0]
+
+    async def test_oversized_transcript_uses_extractive_summary(self):
+        provider = _RecordingProvider()
+        history = [{"role": "assistant", "content": f"Point {i}." + "z" * 600} for i in range(20)]
+        summary = await summarize_checkpoint(history, provider, max_turns=20)
+        assert provider.prompts == []
+        assert summary.startswith("Point 0. Point 1.")
@@ -98,6 +98,23 @@ class TestGetDb:
         fk = c.execute("PRAGMA foreign_keys").fetchone()[0]
         assert fk == 1, "Foreign keys should be ON"
 
+    def test_tuning_pragmas(self, db_path):
+        c = get_db()
+        assert c.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert c.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert c.execute("PRAGMA cache_size").fetchone()[0] == -64000
+        assert c.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+    def test_statement_cache_size(self, db_path):
+        from unittest.mock import patch
+
+        import cortex.db as dbmod
+
+        set_db_path(db_path)  # drop this thread's connection
+        with patch.object(dbmod.sqlite3, "connect", wraps=sqlite3.connect) as m:
+            get_db()
+        assert m.call_args.kwargs["cached_statements"] == dbmod._CACHED_STATEMENTS
+
     def test_row_factory_is_row(self, db_path):
         c = get_db()
         assert c.row_factory is sqlite3.Row
@@ -500,14 +517,66 @@ class TestIndexExistence:
         return {r[0] for r in rows}
 
     @pytest.mark.parametrize("index_name", [
-        "idx_devices_domain",
-        "idx_interactions_layer",
+        "idx_devices_domain_name",
+        "idx_interactions_layer_created",
         "idx_interactions_created",
         "idx_aliases_entity",
-        "idx_patterns_source",
+        "idx_patterns_source_hits",
         "idx_audit_type",
         "idx_satellites_status",
+        "idx_interactions_user_created",
+        "idx_guardrail_created",
+        "idx_guardrail_category",
+        "idx_mistakes_resolved_created",
+        "idx_backup_log_created",
+        "idx_evolution_log_run",
+        "idx_topics_user_count",
     ])
     def test_index_exists(self, conn, index_name):
         indexes = self._index_names(conn)
         assert index_name in indexes, f"Index '{index_name}' missing"
+
+    @pytest.mark.parametrize("index_name", [
+        "idx_devices_domain",
+        "idx_patterns_source",
+        "idx_interactions_layer",
+        "idx_interactions_user",
+        "idx_interactions_fallthrough",
+    ])
+    def test_prefix_index_dropped(self, conn, db_path, index_name):
+        assert index_name not in self._index_names(conn)
+        # Databases created before the composites lose it on the next init
+        conn.execute(f"CREATE INDEX {index_name} ON interactions(created_at)")
+        conn.commit()
+        init_db(db_path)
+        assert index_name not in self._index_names(conn)
+
+    @pytest.mark.parametrize("sql, index_name", [
+        ("SELECT * FROM guardrail_events ORDER BY created_at DESC LIMIT 10",
+         "idx_guardrail_created"),
+        ("SELECT * FROM guardrail_events WHERE category = 'x' ORDER BY created_at DESC LIMIT 10",
+         "idx_guardrail_category"),
+        ("SELECT * FROM interactions WHERE user_id = 'u' ORDER BY created_at DESC LIMIT 10",
+         "idx_interactions_user_created"),
+        ("SELECT * FROM backup_log ORDER BY created_at DESC LIMIT 10",
+         "idx_backup_log_created"),
+        ("SELECT * FROM evolution_log ORDER BY run_at DESC LIMIT 10",
+         "idx_evolution_log_run"),
+        ("SELECT * FROM interactions WHERE matched_layer = 'l' "
+         "ORDER BY created_at DESC, id DESC LIMIT 10",
+         "idx_interactions_layer_created"),
+        ("SELECT * FROM ha_devices WHERE domain = 'd' ORDER BY domain, friendly_name LIMIT 10",
+         "idx_devices_domain_name"),
+        ("SELECT * FROM command_patterns WHERE source = 's' "
+         "ORDER BY hit_count DESC, id DESC LIMIT 10",
+         "idx_patterns_source_hits"),
+        ("SELECT * FROM emotional_profiles ORDER BY last_interaction DESC LIMIT 10",
+         "idx_emotional_last"),
+        ("SELECT * FROM media_playback_history WHERE user_id = 'u' "
+         "ORDER BY played_at DESC LIMIT 10",
+         "idx_playback_user_played"),
+    ])
+    def test_list_query_uses_index(self, conn, sql, index_name):
+        plan = " ".join(r[3] for r in conn.execute(f"EXPLAIN QUERY PLAN {sql}"))
+        assert index_name in plan
+        assert "TEMP B-TREE" not in plan
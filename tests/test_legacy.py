@@ -888,6 +888,23 @@ class TestAdminLegacyAPI:
         )
         assert resp.status_code == 200
 
+    def test_list_messages_filters_combine(self, client, auth_header, db):
+        db.executemany(
+            "INSERT INTO legacy_channels (id, channel_type, name) VALUES (?, 'sms', ?)",
+            [("a", "A"), ("b", "B")],
+        )
+        db.executemany(
+            "INSERT INTO legacy_messages (channel_id, direction, content) VALUES (?, ?, ?)",
+            [("a", "inbound", "one"), ("a", "outbound", "two"), ("b", "inbound", "three")],
+        )
+        db.commit()
+        resp = client.get(
+            "/admin/legacy/messages?channel_id=a&direction=inbound", headers=auth_header,
+        )
+        assert [m["content"] for m in resp.json()["messages"]] == ["one"]
+        resp = client.get("/admin/legacy/messages?direction=inbound", headers=auth_header)
+        assert {m["content"] for m in resp.json()["messages"]} == {"one", "three"}
+
     def test_webhook_auto_secret(self, client, auth_header):
         """Webhook channels auto-generate a secret."""
         resp = client.post(
@@ -149,6 +149,50 @@ class TestRetentionPolicy:
         assert result["kept"] == 2
         assert result["deleted"] == 1
 
+    @patch("cortex.backup.offsite.asyncio.create_subprocess_exec")
+    async def test_retention_orders_daily_by_timestamp(self, mock_exec):
+        list_output = (
+            "-rw-r--r-- 1,000 2025/01/02 12:00:00 cortex_daily_delta_20250102T120000Z.tar.zst\n"
+            "-rw-r--r-- 1,000 2025/01/03 12:00:00 cortex_daily_delta_20250103T120000Z.tar.zst\n"
+            "-rw-r--r-- 1,000 2025/01/04 12:00:00 cortex_daily_20250104T120000Z.tar.zst\n"
+        )
+        mock_exec.return_value = _make_process(stdout=list_output.encode("utf-8"))
+
+        backup = OffsiteBackup(remote_path="user@nas:/backups", method="rsync")
+        result = await backup.apply_retention(daily=1, weekly=0, monthly=0)
+
+        deleted = {c.args[-1].rsplit("/", 1)[-1] for c in mock_exec.call_args_list[1:]}
+        assert result == {"kept": 1, "deleted": 2}
+        assert "cortex_daily_20250104T120000Z.tar.zst" not in deleted
+
+    @patch("cortex.backup.offsite.asyncio.create_subprocess_exec")
+    async def test_retention_keeps_base_of_kept_deltas(self, mock_exec):
+        list_output = (
+            "-rw-r--r-- 1,000 2025/01/01 12:00:00 cortex_manual_20250101T120000Z.tar.zst\n"
+            "-rw-r--r-- 1,000 2025/01/03 12:00:00 cortex_daily_delta_20250103T120000Z.tar.zst\n"
+            "-rw-r--r-- 1,000 2025/01/05 12:00:00 cortex_pre_restore_20250105T120000Z.tar.zst\n"
+        )
+        mock_exec.return_value = _make_process(stdout=list_output.encode("utf-8"))
+
+        backup = OffsiteBackup(remote_path="user@nas:/backups", method="rsync")
+        result = await backup.apply_retention(daily=1, weekly=0, monthly=0)
+
+        # "other" keeps only the newest archive, but the delta needs the manual base
+        assert result == {"kept": 3, "deleted": 0}
+
+    @patch("cortex.backup.offsite.asyncio.create_subprocess_exec")
+    async def test_health_then_retention_lists_once(self, mock_exec):
+        mock_exec.return_value = _make_process(stdout=SAMPLE_RSYNC_LIST.encode("utf-8"))
+
+        backup = OffsiteBackup(remote_path="user@nas:/backups", method="rsync")
+        assert await backup.health() is True
+        await backup.apply_retention(daily=7, weekly=4, monthly=12)
+        assert mock_exec.call_count == 1
+
+        backup.clear_remote_cache()
+        await backup.list_remote_backups()
+        assert mock_exec.call_count == 2
+
     @patch("cortex.backup.offsite.asyncio.create_subprocess_exec")
     async def test_apply_retention_empty(self, mock_exec):
         mock_exec.return_value = _make_process(stdout=b"")
@@ -192,6 +236,20 @@ class TestSMBBackup:
         assert result["files_synced"] == 2
         assert result["bytes_transferred"] > 0
 
+    @patch("cortex.backup.offsite.asyncio.create_subprocess_exec")
+    async def test_smb_sync_partial_failure(self, mock_exec, backup_dir):
+        def _exec(*cmd, **kwargs):
+            if "20250101" in cmd[-1]:
+                return _make_process(returncode=1, stderr=b"NT_STATUS_ACCESS_DENIED")
+            return _make_process(stdout=b"putting file ok")
+
+        mock_exec.side_effect = _exec
+
+        backup = OffsiteBackup(remote_path="/backups", method="smb", smb_share="//nas/share")
+        result = await backup.sync(local_backup_dir=backup_dir)
+        assert result["files_synced"] == 1
+        assert result["bytes_transferred"] == 800
+
     async def test_smb_no_share_raises(self):
         backup = OffsiteBackup(
             remote_path="/backups",
@@ -730,3 +730,21 @@ class TestAdminProactiveAPI:
             "SELECT max_per_hour FROM notification_preferences WHERE user_id = 'user1'"
         ).fetchone()
         assert dict(row)["max_per_hour"] == 5
+
+    async def test_patch_preferences_updates_only_given_fields(self):
+        """PATCH keeps fields it was not given (memoised UPDATE per field set)."""
+        from cortex.admin.proactive import (
+            PreferencesUpdateRequest,
+            get_preferences,
+            update_preferences,
+        )
+
+        await update_preferences("u1", PreferencesUpdateRequest(min_priority="high"), {})
+        await update_preferences(
+            "u1", PreferencesUpdateRequest(max_per_hour=3, channels=["log", "tts"]), {},
+        )
+        prefs = await get_preferences("u1", {})
+        assert prefs["min_priority"] == "high"
+        assert prefs["max_per_hour"] == 3
+        assert prefs["channels"] == ["log", "tts"]
+        assert prefs["quiet_hours_start"] == "22:00"
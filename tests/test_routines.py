@@ -1106,6 +1106,29 @@ class TestAdminRoutineAPI:
         assert resp.status_code == 200
         assert resp.json()["routines"] == []
 
+    def test_list_routines_attaches_children(self, client, db_conn):
+        a = client.post("/admin/routines", json={"name": "A"}).json()["id"]
+        b = client.post("/admin/routines", json={"name": "B"}).json()["id"]
+        client.post(f"/admin/routines/{a}/steps", json={"action_type": "delay", "step_order": 2})
+        client.post(f"/admin/routines/{a}/steps", json={"action_type": "delay", "step_order": 1})
+        client.post(f"/admin/routines/{b}/triggers", json={"trigger_type": "voice_phrase"})
+        for i in range(7):
+            db_conn.execute(
+                "INSERT INTO routine_runs (routine_id, started_at) VALUES (?, ?)",
+                (a, f"2026-01-0{i + 1}"),
+            )
+        db_conn.commit()
+
+        routines = {r["name"]: r for r in client.get("/admin/routines").json()["routines"]}
+        assert [s["step_order"] for s in routines["A"]["steps"]] == [1, 2]
+        assert all(s["routine_id"] == a for s in routines["A"]["steps"])
+        assert routines["A"]["triggers"] == []
+        assert [t["trigger_type"] for t in routines["B"]["triggers"]] == ["voice_phrase"]
+        runs = routines["A"]["recent_runs"]
+        assert [r["started_at"] for r in runs] == [f"2026-01-0{i}" for i in range(7, 2, -1)]
+        assert "_rn" not in runs[0] and runs[0]["routine_id"] == a
+        assert routines["B"]["recent_runs"] == []
+
     def test_create_routine(self, client):
         resp = client.post("/admin/routines", json={"name": "Test Routine"})
         assert resp.status_code == 200
@@ -517,6 +517,29 @@ class TestSatelliteAdminAPI:
         assert resp.status_code == 200
         assert resp.json()["id"] == sat_id
 
+    def test_led_config_merges_over_defaults(self, client, auth_header):
+        resp = client.post(
+            "/admin/satellites/add",
+            json={"ip_address": "192.168.3.102"},
+            headers=auth_header,
+        )
+        sat_id = resp.json()["id"]
+        resp = client.patch(
+            f"/admin/satellites/{sat_id}/led_config",
+            json={"patterns": {"idle": {"r": 1, "g": 2, "b": 3, "brightness": 0.2}}},
+            headers=auth_header,
+        )
+        assert resp.json()["saved"] is True
+
+        patterns = client.get(
+            f"/admin/satellites/{sat_id}/led_config", headers=auth_header
+        ).json()["patterns"]
+        assert patterns["idle"] == {"r": 1, "g": 2, "b": 3, "brightness": 0.2}
+        assert patterns["error"]["r"] == 255  # untouched default
+
+        from cortex.admin.satellites import _LED_DEFAULTS
+        assert _LED_DEFAULTS["idle"]["r"] == 0
+
     def test_get_satellite_not_found(self, client, auth_header):
         resp = client.get("/admin/satellites/nonexistent", headers=auth_header)
         assert resp.status_code == 404
@@ -614,3 +637,61 @@ class TestSatelliteAdminAPI:
         data = resp.json()
         assert data["mode"] == "shared"
         assert data["service_port"] == 5110
+
+
+# ── WebSocket connection ──────────────────────────────────────────
+
+
+class TestSatelliteConnectionSend:
+    async def test_send_encodes_compact_json_text(self):
+        from unittest.mock import AsyncMock
+
+        from cortex.satellite.websocket import SatelliteConnection
+
+        ws = AsyncMock()
+        conn = SatelliteConnection(ws, "sat-1")
+        await conn.send({"type": "TTS_START", "sample_rate": 22050})
+        frame = ws.send_text.call_args[0][0]
+        assert json.loads(frame) == {"type": "TTS_START", "sample_rate": 22050}
+
+    async def test_send_raw_passes_frame_through(self):
+        from unittest.mock import AsyncMock
+
+        from cortex.satellite.websocket import SatelliteConnection
+
+        ws = AsyncMock()
+        conn = SatelliteConnection(ws, "sat-1")
+        await conn.send_raw('{"type":"TTS_END"}')
+        ws.send_text.assert_awaited_once_with('{"type":"TTS_END"}')
+
+    async def test_stream_audio_chunks_reassemble(self):
+        import base64
+        from unittest.mock import AsyncMock, MagicMock
+
+        from cortex.orchestrator.voice import _stream_audio_to_satellite
+
+        conn = MagicMock(session_id="s1", _more_phrases_pending=False, binary_audio=False)
+        conn.send = AsyncMock()
+        audio = bytes(range(256)) * 40  # 10 KiB, not a multiple of the chunk size
+        await _stream_audio_to_satellite(conn, audio, 22050, "hi")
+        msgs = [c.args[0] for c in conn.send.await_args_list]
+        pcm = b"".join(base64.b64decode(m["audio"]) for m in msgs if m["type"] == "TTS_CHUNK")
+        assert pcm == audio
+        assert msgs[-1]["type"] == "TTS_END"
+
+    async def test_stream_audio_binary_frames(self):
+        from unittest.mock import AsyncMock
+
+        from cortex.orchestrator.voice import _stream_audio_to_satellite
+        from cortex.satellite.websocket import SatelliteConnection
+
+        ws = AsyncMock()
+        conn = SatelliteConnection(ws, "sat-1")
+        conn.binary_audio = True
+        audio = bytes(range(256)) * 40
+        await _stream_audio_to_satellite(conn, audio, 22050, "hi")
+        frames = [c.args[0] for c in ws.send_bytes.await_args_list]
+        assert all(f[:1] == b"\x01" for f in frames)
+        assert b"".join(f[1:] for f in frames) == audio
+        types = [json.loads(c.args[0])["type"] for c in ws.send_text.await_args_list]
+        assert types == ["TTS_START", "TTS_END"]
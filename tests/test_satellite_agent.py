@@ -224,6 +224,17 @@ class TestWSClient:
         client.on("TTS_START", handler)
         assert "TTS_START" in client._handlers
 
+    async def test_binary_frames_dispatch_by_opcode(self):
+        from satellite.atlas_satellite.ws_client import TTS_CHUNK_OPCODE, SatelliteWSClient
+
+        client = SatelliteWSClient("ws://localhost:5100/ws/satellite", "sat-test")
+        handler = AsyncMock()
+        client.on_binary(TTS_CHUNK_OPCODE, handler)
+        await client._dispatch_binary(b"\x01pcm")
+        await client._dispatch_binary(b"\x7fignored")
+        await client._dispatch_binary(b"")
+        handler.assert_awaited_once_with(b"pcm")
+
 
 # ── Wake word tests ───────────────────────────────────────────────
 
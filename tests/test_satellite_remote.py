@@ -110,8 +110,8 @@ class TestSendRemoteCommand:
         try:
             result = await send_remote_command("sat-kitchen", "REBOOT")
             assert result["status"] == "sent"
-            mock_ws.send_json.assert_called_once()
-            sent_msg = mock_ws.send_json.call_args[0][0]
+            mock_ws.send_text.assert_called_once()
+            sent_msg = json.loads(mock_ws.send_text.call_args[0][0])
             assert sent_msg["type"] == "REBOOT"
             assert sent_msg["cmd_id"] == result["id"]
         finally:
@@ -679,8 +679,8 @@ class TestFullCommandFlow:
             cmd_id = result["id"]
 
             # Verify it was sent to satellite
-            mock_ws.send_json.assert_called_once()
-            sent_msg = mock_ws.send_json.call_args[0][0]
+            mock_ws.send_text.assert_called_once()
+            sent_msg = json.loads(mock_ws.send_text.call_args[0][0])
             assert sent_msg["type"] == "EXEC_SCRIPT"
             assert sent_msg["cmd_id"] == cmd_id
 
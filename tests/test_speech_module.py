@@ -175,7 +175,7 @@ class TestSynthesizeSpeech:
         mock_kokoro_cls = MagicMock(return_value=mock_kokoro_inst)
 
         with patch("cortex.speech.tts._TTS_PROVIDER", "orpheus"), \
-             patch("cortex.voice.kokoro.KokoroClient", mock_kokoro_cls):
+             patch("cortex.voice.kokoro.get_kokoro_client", mock_kokoro_cls):
             from cortex.speech.tts import synthesize_speech
             pcm, rate, provider = await synthesize_speech("hello", "af_bella", fast=True)
         assert provider == "kokoro"
@@ -185,7 +185,7 @@ class TestSynthesizeSpeech:
     @pytest.mark.asyncio
     async def test_all_providers_fail_returns_empty(self):
         """When every provider raises, returns (b'', 24000, 'none')."""
-        with patch("cortex.voice.kokoro.KokoroClient", side_effect=Exception("no kokoro")), \
+        with patch("cortex.voice.kokoro.get_kokoro_client", side_effect=Exception("no kokoro")), \
              patch("cortex.speech.tts._TTS_PROVIDER", "orpheus"), \
              patch("cortex.voice.wyoming.WyomingClient") as mock_piper:
             mock_piper.return_value.synthesize = AsyncMock(side_effect=Exception("no piper"))
@@ -221,12 +221,45 @@ class TestSynthesizeSpeech:
 
         with patch("cortex.speech.tts._TTS_PROVIDER", "orpheus"), \
              patch("aiohttp.ClientSession", mock_session_cls), \
-             patch("cortex.voice.kokoro.KokoroClient", mock_kokoro_cls):
+             patch("cortex.voice.kokoro.get_kokoro_client", mock_kokoro_cls):
             from cortex.speech.tts import synthesize_speech
             pcm, rate, provider = await synthesize_speech("hello", "af_bella")
 
         assert provider == "kokoro"
 
+    @pytest.mark.asyncio
+    async def test_kokoro_calls_share_one_closable_session(self):
+        """Repeated Kokoro synthesis reuses the pooled session instead of leaking one per call."""
+        from aiohttp import web
+        from cortex.voice import kokoro
+
+        async def speech(request):
+            return web.Response(body=b"\x01\x02\x03\x04")
+
+        app = web.Application()
+        app.router.add_post("/v1/audio/speech", speech)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        await kokoro.close_kokoro_clients()
+        try:
+            with patch("cortex.speech.tts._KOKORO_HOST", "127.0.0.1"), \
+                 patch("cortex.speech.tts._KOKORO_PORT", port):
+                from cortex.speech.tts import synthesize_speech
+                for _ in range(3):
+                    _, _, provider = await synthesize_speech("hi", "af_bella", fast=True)
+                    assert provider == "kokoro"
+            [client] = kokoro._clients.values()
+            [session] = client._sessions.values()
+            assert not session.closed
+            await kokoro.close_kokoro_clients()
+            assert session.closed
+        finally:
+            await kokoro.close_kokoro_clients()
+            await runner.cleanup()
+
     @pytest.mark.asyncio
     async def test_extract_pcm_raw_passthrough(self):
         """Non-WAV data passes through extract_pcm unchanged."""
@@ -598,3 +598,119 @@ class TestSpeechEndpoint:
                 )
 
         assert resp.status_code == 200
+
+
+# ===========================================================================
+# TTS audio cache
+# ===========================================================================
+
+class TestTTSAudioCache:
+    @pytest.fixture(autouse=True)
+    def _clear(self):
+        from cortex.speech import tts_cache
+
+        tts_cache.clear()
+        yield
+        tts_cache.clear()
+
+    def test_key_depends_on_every_part(self):
+        from cortex.speech.tts_cache import cache_key
+
+        assert cache_key("preview", "hi", "tara") == cache_key("preview", "hi", "tara")
+        assert cache_key("preview", "hi", "tara") != cache_key("filler", "hi", "tara")
+        assert cache_key("preview", "hi", None) == cache_key("preview", "hi", "")
+
+    async def test_get_or_synth_calls_backend_once(self):
+        from cortex.speech import tts_cache
+
+        synth = AsyncMock(return_value=(b"pcm", 22050, 2, 1))
+        first = await tts_cache.get_or_synth("k", synth)
+        second = await tts_cache.get_or_synth("k", synth)
+        assert first == second == (b"pcm", 22050, 2, 1)
+        synth.assert_awaited_once()
+
+    async def test_empty_audio_not_cached(self):
+        from cortex.speech import tts_cache
+
+        synth = AsyncMock(return_value=(b"", 22050, 2, 1))
+        await tts_cache.get_or_synth("k", synth)
+        await tts_cache.get_or_synth("k", synth)
+        assert synth.await_count == 2
+
+    def test_evicts_least_recently_used(self, monkeypatch):
+        from cortex.speech import tts_cache
+
+        monkeypatch.setattr(tts_cache, "MAX_ENTRIES", 2)
+        tts_cache.put("a", (b"a", 1, 2, 1))
+        tts_cache.put("b", (b"b", 1, 2, 1))
+        tts_cache.get("a")  # refresh "a"
+        tts_cache.put("c", (b"c", 1, 2, 1))
+        assert tts_cache.get("b") is None
+        assert tts_cache.get("a") is not None
+        assert tts_cache.get("c") is not None
+
+
+class TestKokoroClientPool:
+    @pytest.fixture(autouse=True)
+    async def _reset(self):
+        from cortex.voice import kokoro
+
+        yield
+        await kokoro.close_kokoro_clients()
+
+    def test_same_endpoint_shares_client(self):
+        from cortex.voice.kokoro import get_kokoro_client
+
+        a = get_kokoro_client("kokoro", 8880)
+        assert get_kokoro_client("kokoro", 8880) is a
+        assert get_kokoro_client("kokoro", 8881) is not a
+        assert get_kokoro_client("kokoro", 8880, timeout=5.0) is not a
+
+    async def test_session_reused_until_closed(self):
+        from cortex.voice.kokoro import get_kokoro_client
+
+        client = get_kokoro_client("kokoro", 8880)
+        session = await client._get_session()
+        assert await client._get_session() is session
+        await client.close()
+        assert session.closed
+        assert await client._get_session() is not session
+
+    def test_closed_loop_session_dropped(self):
+        import asyncio
+
+        from cortex.voice.kokoro import KokoroClient
+
+        client = KokoroClient("kokoro", 8880)
+        first = asyncio.run(client._get_session())
+        second = asyncio.run(client._get_session())
+        assert second is not first
+        assert first.closed
+        asyncio.run(client.close())
+        assert second.closed
+
+    def test_live_loops_keep_their_own_session(self):
+        import asyncio
+
+        from cortex.voice.kokoro import KokoroClient
+
+        client = KokoroClient("kokoro", 8880)
+        other = asyncio.new_event_loop()
+        try:
+            theirs = other.run_until_complete(client._get_session())
+            ours = asyncio.run(client._get_session())
+            assert ours is not theirs
+            assert not theirs.closed
+            assert other.run_until_complete(client._get_session()) is theirs
+            other.run_until_complete(client.close())
+            assert theirs.closed
+        finally:
+            other.close()
+
+    def test_connect_timeout_opt_in(self):
+        from cortex.voice.kokoro import get_kokoro_client
+
+        assert get_kokoro_client("kokoro", 8880).timeout.connect is None
+        quick = get_kokoro_client("kokoro", 8880, connect_timeout=2.0)
+        assert quick.timeout.connect == 2.0
+        assert quick is not get_kokoro_client("kokoro", 8880)
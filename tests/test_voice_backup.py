@@ -48,6 +48,9 @@ class TestMatchIntent:
     def test_no_match_unrelated(self):
         assert match_backup_intent("what time is it") is None
 
+    def test_uppercase_still_matches(self):
+        assert match_backup_intent("BACK UP NOW") == "create"
+
 
 class TestHandleBackupLast:
     @pytest.mark.asyncio
@@ -273,6 +273,40 @@ class TestFillerCache:
         assert result is not None
         assert result.phrase == "fallback"
 
+    def test_peek_leaves_rotation_alone(self):
+        """peek() (admin preview) must not change what get() avoids next."""
+        from cortex.filler.cache import FillerCache, CachedFiller
+        cache = FillerCache()
+        cache._cache["question"] = [
+            CachedFiller(phrase=f"filler-{i}", audio=b"\x00", sample_rate=24000, duration_ms=100)
+            for i in range(4)
+        ]
+        cache._initialized = True
+
+        for _ in range(10):
+            assert cache.peek("question") is not None
+        assert "question" not in cache._recent
+        picked = cache.get("question")
+        assert list(cache._recent["question"]) == [picked.phrase]
+
+    @pytest.mark.asyncio
+    async def test_voice_set_after_regeneration(self, tmp_path, monkeypatch):
+        """During a forced rebuild the old voice is not reported as the new one."""
+        from cortex.filler import cache as filler_cache
+        monkeypatch.setenv("CORTEX_DATA_DIR", str(tmp_path))
+        cache = filler_cache.FillerCache()
+        cache.voice = "old"
+        seen = []
+
+        async def synth(phrase, voice):
+            seen.append(cache.voice)
+            return b"\x00\x00", 24000, "fake"
+
+        monkeypatch.setattr(filler_cache, "_synthesize_for_cache", synth)
+        await cache.initialize(voice="new", force=True)
+        assert set(seen) == {"old"}
+        assert cache.voice == "new"
+
     def test_get_timing_under_5ms(self):
         """get() should be sub-5ms since it's just a dict lookup."""
         from cortex.filler.cache import FillerCache, CachedFiller
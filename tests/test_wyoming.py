@@ -246,3 +246,31 @@ class TestConnectionErrors:
         with _patch_connect(reader, writer), _patch_read_json(reader):
             with pytest.raises(WyomingError, match="Connection closed"):
                 await client.transcribe(b"\x00")
+
+
+class TestTimeouts:
+    def test_read_timeout_defaults_to_at_least_a_minute(self):
+        client = WyomingClient("localhost", 10300, timeout=5.0)
+        assert client.timeout == 5.0
+        assert client.read_timeout == 60.0
+
+    def test_read_timeout_separate_from_connect(self):
+        client = WyomingClient("localhost", 10300, timeout=5.0, read_timeout=15.0)
+        assert client.timeout == 5.0
+        assert client.read_timeout == 15.0
+
+    async def test_stalled_drain_raises_after_write_timeout(self):
+        from unittest.mock import MagicMock
+
+        client = WyomingClient("localhost", 10300, timeout=5.0, write_timeout=0.01)
+        async def stalled():
+            await asyncio.sleep(10)
+
+        writer = MagicMock()
+        writer.drain = stalled
+        with pytest.raises(WyomingError, match="Timed out sending synthesize"):
+            await client._send_event(writer, "synthesize", {"text": "hi"})
+
+    def test_write_timeout_defaults_to_connect_timeout(self):
+        client = WyomingClient("localhost", 10300, timeout=2.0)
+        assert client.write_timeout == 2.0